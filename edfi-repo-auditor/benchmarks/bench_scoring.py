@@ -0,0 +1,86 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+"""
+Microbenchmark of scoring a results table at once against the previous
+approach of scoring one repository's results at a time.
+
+Run with `poetry run python benchmarks/bench_scoring.py`.
+"""
+
+import argparse
+import random
+import timeit
+from typing import List
+
+import pandas as pd
+
+from edfi_repo_auditor.checklist import CHECKLIST_DEFAULT_SUCCESS_MESSAGE
+from edfi_repo_auditor.scoring import SCORE_KEY, Scoring, load_scoring, score_results
+
+
+def synthetic_report(rows: int, scoring: Scoring) -> pd.DataFrame:
+    generator = random.Random(rows)
+    return pd.DataFrame(
+        [
+            {
+                "repository": f"repo-{row}",
+                **{
+                    rule: generator.choice(
+                        [CHECKLIST_DEFAULT_SUCCESS_MESSAGE, "❌ FAILED"]
+                    )
+                    for rule in scoring.rules
+                },
+            }
+            for row in range(rows)
+        ]
+    )
+
+
+def per_repository(report: pd.DataFrame, scoring: Scoring) -> List[int]:
+    """The approach replaced by `score_results`: one loop per repository."""
+    scores = []
+    for results in report.to_dict("records"):
+        score = 0
+        for rule, points in scoring.rules.items():
+            if results.get(rule) == CHECKLIST_DEFAULT_SUCCESS_MESSAGE:
+                score += points
+        scores.append(score)
+    return scores
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scoring_file", default="scoring.json")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    scoring = load_scoring(args.scoring_file)
+    for rows in (1_000, 10_000, 100_000):
+        report = synthetic_report(rows, scoring)
+        expected = per_repository(report, scoring)
+        assert score_results(report, scoring)[SCORE_KEY].to_list() == expected
+
+        timings = {
+            name: min(
+                timeit.repeat(
+                    lambda: func(report, scoring), number=1, repeat=args.repeat
+                )
+            )
+            for name, func in [
+                ("per repository", per_repository),
+                ("vectorized", score_results),
+            ]
+        }
+        print(
+            f"{rows} repositories: "
+            + ", ".join(
+                f"{name} {seconds * 1000:.1f} ms" for name, seconds in timings.items()
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+"""
+Microbenchmark of the workflow checks as the audit runs them, against the
+previous approach of one regular expression or substring search per check.
+
+The audit scans each workflow for the text checks with the single-pass
+scanner, parses it into the workflow model for the checks on the workflows
+and actions used, and resolves the reusable workflows and composite actions
+it calls through the workflow graph. Files called through the graph are
+served from memory, so only the parsing and resolution are timed.
+
+Run with `poetry run python benchmarks/bench_workflow_scanner.py`, or with
+`PYTHONPATH=. python benchmarks/bench_workflow_scanner.py` outside Poetry;
+the `edfi_repo_auditor` package is not importable otherwise.
+"""
+
+import argparse
+import random
+import re
+import timeit
+from typing import Dict, List, Optional, Set
+
+from edfi_repo_auditor.auditor import WORKFLOW_SCANNER
+from edfi_repo_auditor.checklist import CHECKLIST
+from edfi_repo_auditor.workflow_graph import WorkflowGraph
+from edfi_repo_auditor.workflow_model import USES_CHECKS, UsesReference, parse_workflow
+
+OWNER = "Ed-Fi-Alliance-OSS"
+REPOSITORY = "Ed-Fi-ODS"
+
+UT_PATTERN = re.compile(r"unit.{0,2}test(s)?", flags=re.IGNORECASE)
+APPROVED_ACTIONS_PATTERN = re.compile(
+    r"uses:\s*ed-fi-alliance-oss/ed-fi-actions/.github/workflows/repository-scanner\.yml",
+    flags=re.IGNORECASE,
+)
+
+STEP_TEMPLATES = [
+    "      - name: Checkout\n        uses: actions/checkout@v4\n",
+    "      - name: Setup .NET\n        uses: actions/setup-dotnet@v4\n",
+    "      - name: Build\n        run: dotnet build --configuration Release\n",
+    "      - name: Cache\n        uses: actions/cache@v4\n        with:\n          path: ~/.nuget\n",
+    "      - name: Publish\n        run: dotnet pack --no-build --output ./artifacts\n",
+]
+MATCHING_STEPS = [
+    "      - name: Unit Tests\n        run: dotnet test\n",
+    "      - name: Report\n        uses: dorny/test-reporter@v1\n",
+]
+SCANNER_JOB = (
+    "  scan:\n"
+    "    uses: ed-fi-alliance-oss/ed-fi-actions/.github/workflows/"
+    "repository-scanner.yml@main\n"
+)
+
+# Files read through the workflow graph: the actions used are JavaScript
+# actions, which call nothing further, and the scanner workflow checks out the
+# repository.
+ACTION_FILE = "runs:\n  using: node20\n  main: index.js\n"
+SCANNER_WORKFLOW = (
+    "on: workflow_call\njobs:\n  scan:\n    steps:\n"
+    "      - uses: actions/checkout@v4\n"
+)
+
+
+class InMemoryClient:
+    """Serves the files read by the workflow graph without calling GitHub."""
+
+    def get_file_content(
+        self, owner: str, repository: str, path: str, ref: Optional[str] = None
+    ) -> Optional[str]:
+        if path.endswith("repository-scanner.yml"):
+            return SCANNER_WORKFLOW
+        return ACTION_FILE if path.endswith("action.yml") else None
+
+
+def synthetic_workflows(count: int, steps: int, match_rate: float) -> List[str]:
+    """
+    Generate `count` workflows of `steps` steps each; roughly `match_rate` of
+    them contain one step or job that passes a check, near the end of the
+    file.
+    """
+    generator = random.Random(count)
+    workflows = []
+    for _ in range(count):
+        body = [generator.choice(STEP_TEMPLATES) for _ in range(steps)]
+        jobs = ""
+        if generator.random() < match_rate:
+            choice = generator.randrange(len(MATCHING_STEPS) + 1)
+            if choice < len(MATCHING_STEPS):
+                body.insert(steps - 1, MATCHING_STEPS[choice])
+            else:
+                jobs = SCANNER_JOB
+        workflows.append(
+            "name: CI\non: push\njobs:\n  build:\n    steps:\n" + "".join(body) + jobs
+        )
+    return workflows
+
+
+def per_check(workflows: List[str]) -> Dict[str, bool]:
+    """The approach replaced by the scanner: one search per check per file."""
+    results = {"approved": False, "reporter": False, "unit": False}
+    for content in workflows:
+        if all(results.values()):
+            break
+        if not results["approved"]:
+            results["approved"] = APPROVED_ACTIONS_PATTERN.search(content) is not None
+        if not results["reporter"]:
+            results["reporter"] = (
+                "uses: dorny/test-reporter" in content
+                or "uses: EnricoMi/publish-unit-test-result-action" in content
+            )
+        if not results["unit"]:
+            results["unit"] = UT_PATTERN.search(content) is not None
+    return results
+
+
+def audit_path(workflows: List[str]) -> Dict[str, bool]:
+    """
+    The checks as `auditor.audit_actions` evaluates them, stopping once every
+    check has passed. The graph is created for each run, as an audit run
+    loads each called file once.
+    """
+    graph = WorkflowGraph(InMemoryClient())  # type: ignore
+    found = 0
+    references: Set[UsesReference] = set()
+
+    def uses_checks_passed() -> bool:
+        return all(check.passed(references) for check in USES_CHECKS)
+
+    for content in workflows:
+        found = WORKFLOW_SCANNER.scan(content, found)
+        workflow = parse_workflow(content)
+        direct = (
+            {
+                reference.relative_to(OWNER, REPOSITORY)
+                for reference in workflow.references()
+            }
+            if workflow is not None
+            else set()
+        )
+        references |= direct
+        if not uses_checks_passed():
+            references |= graph.references(OWNER, REPOSITORY, direct)
+        if found == WORKFLOW_SCANNER.all_passed and uses_checks_passed():
+            break
+
+    passed = {
+        check.item["description"]: check.passed(references) for check in USES_CHECKS
+    }
+    return {
+        "approved": passed[CHECKLIST.APPROVED_ACTIONS["description"]],
+        "reporter": passed[CHECKLIST.TEST_REPORTER["description"]],
+        "unit": all(
+            WORKFLOW_SCANNER.passed(found, check) for check in WORKFLOW_SCANNER.checks
+        ),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workflows", type=int, default=200)
+    parser.add_argument("--steps", type=int, default=60)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for match_rate in (0.0, 0.01, 0.1):
+        workflows = synthetic_workflows(args.workflows, args.steps, match_rate)
+        size = sum(len(workflow) for workflow in workflows) / 1024 / 1024
+
+        assert audit_path(workflows) == per_check(workflows)
+
+        timings = {
+            name: min(
+                timeit.repeat(lambda: func(workflows), number=1, repeat=args.repeat)
+            )
+            for name, func in [("per check", per_check), ("audit", audit_path)]
+        }
+
+        print(
+            f"{args.workflows} workflows ({size:.1f} MiB), match rate {match_rate:.0%}: "
+            + ", ".join(
+                f"{name} {seconds * 1000:.1f} ms" for name, seconds in timings.items()
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
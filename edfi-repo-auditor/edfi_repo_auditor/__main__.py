@@ -9,6 +9,7 @@ This version is designed to run on a single repository and output
 results to GitHub Actions job output instead of generating HTML files.
 """
 
+import asyncio
 import sys
 import logging
 
@@ -16,7 +17,7 @@ from dotenv import load_dotenv
 from errorhandler import ErrorHandler
 
 from edfi_repo_auditor.config import Configuration, load_configuration
-from edfi_repo_auditor.auditor import run_audit
+from edfi_repo_auditor.auditor import run_audit, run_audit_async
 
 
 def _configure_logging(config: Configuration) -> None:
@@ -37,7 +38,10 @@ def _main():
     error_tracker = ErrorHandler()
 
     try:
-        run_audit(config)
+        if config.async_mode:
+            asyncio.run(run_audit_async(config))
+        else:
+            run_audit(config)
     except Exception as e:
         logging.getLogger(__name__).error(e, exc_info=True)
 
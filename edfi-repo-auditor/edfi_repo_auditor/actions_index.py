@@ -0,0 +1,214 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+"""
+Persistent index of the actions and reusable workflows used across an
+organization.
+
+The audit records each repository's workflow files and the `uses` references
+found in them. References are stored per git blob SHA, so a workflow that has
+not changed, or that is copied between repositories, is only indexed once.
+
+Query the index without calling the GitHub API:
+
+    python -m edfi_repo_auditor.actions_index actions/checkout --ref v3
+"""
+
+import argparse
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set
+
+from edfi_repo_auditor.config import DEFAULT_CACHE_DIR
+from edfi_repo_auditor.workflow_model import UsesReference
+
+INDEX_FILE_NAME = "actions.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS workflow_files (
+    organization TEXT NOT NULL,
+    repository TEXT NOT NULL,
+    path TEXT NOT NULL,
+    oid TEXT NOT NULL,
+    PRIMARY KEY (organization, repository, path)
+);
+CREATE INDEX IF NOT EXISTS workflow_files_oid ON workflow_files (oid);
+CREATE TABLE IF NOT EXISTS blobs (
+    oid TEXT PRIMARY KEY
+);
+CREATE TABLE IF NOT EXISTS action_uses (
+    oid TEXT NOT NULL,
+    action TEXT NOT NULL,
+    ref TEXT,
+    uses TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS action_uses_action ON action_uses (action, ref);
+CREATE INDEX IF NOT EXISTS action_uses_oid ON action_uses (oid);
+"""
+
+# Parameters per statement stay well under SQLite's limit
+_BATCH_SIZE = 500
+
+
+@dataclass(frozen=True)
+class ActionUse:
+    action: str
+    ref: Optional[str]
+    organization: str
+    repository: str
+    path: str
+
+
+def _batches(values: List[str]) -> Iterable[List[str]]:
+    for start in range(0, len(values), _BATCH_SIZE):
+        yield values[start : start + _BATCH_SIZE]
+
+
+class ActionsIndex:
+    def __init__(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Repositories audited on worker threads share the connection
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def missing(self, oids: Iterable[str]) -> Set[str]:
+        """The blob SHAs whose references have not been indexed yet."""
+        wanted = list(set(oids))
+        known: Set[str] = set()
+        with self._lock:
+            for batch in _batches(wanted):
+                rows = self._connection.execute(
+                    "SELECT oid FROM blobs WHERE oid IN "
+                    f"({', '.join('?' * len(batch))})",
+                    batch,
+                )
+                known.update(oid for (oid,) in rows)
+        return set(wanted) - known
+
+    def update(
+        self,
+        organization: str,
+        repository: str,
+        files: Dict[str, str],
+        uses: Dict[str, List[str]],
+    ) -> None:
+        """
+        Replace the workflow files recorded for a repository.
+
+        Parameters:
+            files: Blob SHA of each workflow file, by path
+            uses: Raw `uses` values of each blob SHA not yet indexed
+        """
+        with self._lock, self._connection:
+            connection = self._connection
+            previous = {
+                oid
+                for (oid,) in connection.execute(
+                    "SELECT oid FROM workflow_files "
+                    "WHERE organization = ? AND repository = ?",
+                    (organization, repository),
+                )
+            }
+            connection.execute(
+                "DELETE FROM workflow_files WHERE organization = ? AND repository = ?",
+                (organization, repository),
+            )
+            connection.executemany(
+                "INSERT INTO workflow_files VALUES (?, ?, ?, ?)",
+                [(organization, repository, path, oid) for path, oid in files.items()],
+            )
+
+            for oid, values in uses.items():
+                if connection.execute(
+                    "INSERT OR IGNORE INTO blobs VALUES (?)", (oid,)
+                ).rowcount:
+                    references = [UsesReference.parse(value) for value in values]
+                    connection.executemany(
+                        "INSERT INTO action_uses VALUES (?, ?, ?, ?)",
+                        [
+                            (oid, reference.target, reference.ref, reference.raw)
+                            for reference in references
+                        ],
+                    )
+
+            # Blobs no longer found in any repository
+            stale = list(previous - set(files.values()))
+            for batch in _batches(stale):
+                placeholders = ", ".join("?" * len(batch))
+                unused = (
+                    f"oid IN ({placeholders}) AND oid NOT IN "
+                    "(SELECT oid FROM workflow_files)"
+                )
+                connection.execute(f"DELETE FROM action_uses WHERE {unused}", batch)
+                connection.execute(f"DELETE FROM blobs WHERE {unused}", batch)
+
+    def find(self, action: str, ref: Optional[str] = None) -> List[ActionUse]:
+        """
+        Find the workflow files that use `action`, optionally pinned to `ref`.
+        Actions in subdirectories of the repository, such as
+        `github/codeql-action/init`, are found by `github/codeql-action`.
+        """
+        target = action.strip().lower().rstrip("/")
+        # Everything below `target/` sorts between "target/" and "target0"
+        query = (
+            "SELECT DISTINCT u.action, u.ref, f.organization, f.repository, f.path "
+            "FROM action_uses u JOIN workflow_files f ON f.oid = u.oid "
+            "WHERE (u.action = ? OR (u.action >= ? AND u.action < ?))"
+        )
+        parameters: List[str] = [target, target + "/", target + "0"]
+        if ref is not None:
+            query += " AND u.ref = ?"
+            parameters.append(ref)
+        query += " ORDER BY u.action, u.ref, f.organization, f.repository, f.path"
+
+        with self._lock:
+            rows = self._connection.execute(query, parameters).fetchall()
+        return [ActionUse(*row) for row in rows]
+
+
+def main(args_in: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="List the repositories and workflow files that use an action"
+    )
+    parser.add_argument("action", help="Action or reusable workflow, without ref")
+    parser.add_argument("--ref", help="Only list uses pinned to this ref")
+    parser.add_argument(
+        "--index",
+        default=os.path.join(DEFAULT_CACHE_DIR, INDEX_FILE_NAME),
+        help="Index file written by the audit",
+    )
+    args = parser.parse_args(args_in)
+
+    if not os.path.exists(args.index):
+        parser.error(f"{args.index} does not exist; run an audit to create it")
+
+    index = ActionsIndex(args.index)
+    try:
+        uses = index.find(args.action, args.ref)
+    finally:
+        index.close()
+
+    if not uses:
+        print(f"No workflows use {args.action}")
+    for use in uses:
+        print(
+            f"{use.action}@{use.ref or ''}\t"
+            f"{use.organization}/{use.repository}\t{use.path}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+"""
+asyncio front end for GitHubClient.
+
+Every coroutine delegates to the synchronous GitHubClient on a dedicated
+thread pool, so the pooled session, error handling, and response parsing are
+shared with the synchronous client. A semaphore bounds the number of API calls
+in flight at any moment.
+"""
+
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+from edfi_repo_auditor.github_client import DEFAULT_POOL_SIZE, GitHubClient
+
+DEFAULT_MAX_IN_FLIGHT = 8
+
+T = TypeVar("T")
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class AsyncGitHubClient:
+    def __init__(
+        self,
+        access_token: str,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        **options: Any,
+    ):
+        """
+        Args:
+            access_token: GitHub personal access token
+            max_in_flight: Maximum number of concurrent API calls
+            pool_size: Maximum keep-alive connections; raised to at least
+                `max_in_flight` so that concurrent calls never wait on the pool
+            options: Additional GitHubClient keyword arguments
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+
+        self.client = GitHubClient(
+            access_token, pool_size=max(pool_size, max_in_flight), **options
+        )
+        self.max_in_flight = max_in_flight
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_in_flight, thread_name_prefix="github-api"
+        )
+
+    async def __aenter__(self) -> "AsyncGitHubClient":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+        self.client.close()
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking client call without exceeding the in-flight limit."""
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, functools.partial(func, *args, **kwargs)
+            )
+
+    def blocking(self, loop: asyncio.AbstractEventLoop) -> "BlockingGitHubClient":
+        """
+        Synchronous view of this client for code running in worker threads,
+        such as the audit stages. Calls are scheduled on `loop` so they share
+        the in-flight limit with every other caller.
+        """
+        return BlockingGitHubClient(self, loop)
+
+    async def get_repositories(self, owner: str) -> List[str]:
+        return await self.run(self.client.get_repositories, owner)
+
+    async def get_repositories_information(
+        self,
+        owner: str,
+        repositories: Optional[List[str]] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Dict[str, dict]:
+        return await self.run(
+            self.client.get_repositories_information, owner, repositories, fields
+        )
+
+    async def get_workflow_files(
+        self, owner: str, repositories: List[str]
+    ) -> Dict[str, Dict[str, str]]:
+        return await self.run(self.client.get_workflow_files, owner, repositories)
+
+    async def get_workflow_tree(self, owner: str, repository: str) -> List[dict]:
+        return await self.run(self.client.get_workflow_tree, owner, repository)
+
+    async def get_blob_texts(
+        self, owner: str, repository: str, oids: List[str]
+    ) -> Dict[str, Optional[str]]:
+        return await self.run(self.client.get_blob_texts, owner, repository, oids)
+
+    async def get_repository_files(
+        self, owner: str, repository: str, revision: str = "HEAD"
+    ) -> List[str]:
+        return await self.run(
+            self.client.get_repository_files, owner, repository, revision
+        )
+
+    async def get_actions(self, owner: str, repository: str) -> dict:
+        return await self.run(self.client.get_actions, owner, repository)
+
+    async def get_repository_information(
+        self, owner: str, repository: str, fields: Optional[List[str]] = None
+    ) -> dict:
+        return await self.run(
+            self.client.get_repository_information, owner, repository, fields
+        )
+
+    async def has_dependabot_enabled(self, owner: str, repository: str) -> bool:
+        return await self.run(self.client.has_dependabot_enabled, owner, repository)
+
+    async def get_file_content(
+        self, owner: str, repository: str, path: str, ref: Optional[str] = None
+    ) -> Optional[str]:
+        return await self.run(
+            self.client.get_file_content, owner, repository, path, ref
+        )
+
+    async def get_pull_requests(
+        self,
+        owner: str,
+        repository: str,
+        state: str = "closed",
+        per_page: int = 100,
+        since: Optional[datetime] = None,
+    ) -> List[dict]:
+        return await self.run(
+            self.client.get_pull_requests, owner, repository, state, per_page, since
+        )
+
+    async def get_merged_pull_requests(
+        self,
+        owner: str,
+        repository: str,
+        since: Optional[datetime] = None,
+        page_size: int = 50,
+        reviews_per_pr: int = 50,
+    ) -> List[dict]:
+        return await self.run(
+            self.client.get_merged_pull_requests,
+            owner,
+            repository,
+            since,
+            page_size,
+            reviews_per_pr,
+        )
+
+    async def get_pull_request_detail(
+        self, owner: str, repository: str, pr_number: int
+    ) -> dict:
+        return await self.run(
+            self.client.get_pull_request_detail, owner, repository, pr_number
+        )
+
+    async def get_pull_request_reviews(
+        self, owner: str, repository: str, pr_number: int
+    ) -> List[dict]:
+        return await self.run(
+            self.client.get_pull_request_reviews, owner, repository, pr_number
+        )
+
+
+class BlockingGitHubClient:
+    """
+    Exposes the GitHubClient interface to worker threads while routing every
+    call through an AsyncGitHubClient running on an event loop.
+    """
+
+    def __init__(self, client: AsyncGitHubClient, loop: asyncio.AbstractEventLoop):
+        self._client = client
+        self._loop = loop
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._client.client, name)
+        if not callable(attribute):
+            return attribute
+
+        def call(*args: Any, **kwargs: Any) -> Any:
+            future = asyncio.run_coroutine_threadsafe(
+                self._client.run(attribute, *args, **kwargs), self._loop
+            )
+            return future.result()
+
+        return call
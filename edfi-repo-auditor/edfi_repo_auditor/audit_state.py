@@ -0,0 +1,114 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+"""
+Results of the previous audit, kept so that unchanged repositories are not
+audited again.
+
+A repository's fingerprint covers the repository information fetched in bulk
+at the start of each run: when it was last pushed to and updated, the head
+commit of the default branch, the latest merged pull request, and the settings
+and alerts the checks read. It also covers the checks that were run, so a
+different selection of checks never reuses results.
+
+Some checks also depend on the time rather than on the repository alone, or
+on data outside the repository information; the auditor runs those again for
+an unchanged repository and keeps the rest of its previous results.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from typing import Dict, Iterable, Optional
+
+from edfi_repo_auditor.results import AuditResult
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+STATE_FILE_NAME = "audit-state.json"
+
+# Repository information fields that change whenever a repository does
+FINGERPRINT_FIELDS = [
+    "pushedAt",
+    "updatedAt",
+    "defaultBranchRef",
+    "latestMergedPullRequest",
+]
+
+
+def fingerprint(information: dict, checks: Iterable[str]) -> str:
+    data = json.dumps(
+        {"information": information, "checks": sorted(checks)}, sort_keys=True
+    )
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+class AuditState:
+    def __init__(self, path: str, reuse: bool = True):
+        """
+        Parameters:
+            path: JSON file holding the state between runs
+            reuse: False to audit every repository again, while still
+                recording the new results
+        """
+        self.path = path
+        self._reuse = reuse
+        self._lock = threading.Lock()
+        self._previous: Dict[str, dict] = {}
+        self._current: Dict[str, dict] = {}
+        self.reused = 0
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                self._previous = json.load(f)
+        except FileNotFoundError:
+            pass
+        except ValueError:
+            logger.warning(f"Ignoring unreadable audit state {path}")
+
+    def previous_results(self, repository: str, key: str) -> Optional[AuditResult]:
+        """
+        The results of `repository` from the previous audit when its
+        fingerprint is still `key`; these are carried over into the new state
+        unless recorded again.
+        """
+        entry = self._previous.get(repository) if self._reuse else None
+        if entry is None or entry.get("fingerprint") != key or "result" not in entry:
+            return None
+        results = AuditResult.from_dict(entry["result"])
+        if results is None:
+            return None
+
+        with self._lock:
+            self._current[repository] = entry
+            self.reused += 1
+        return results
+
+    def record(self, repository: str, key: str, results: dict) -> None:
+        """Record `results`, as stored by `AuditResult.to_dict`."""
+        with self._lock:
+            self._current[repository] = {"fingerprint": key, "result": results}
+
+    def save(self) -> None:
+        """
+        Replace the state file with the repositories recorded in this run.
+        Repositories that were not audited this time keep their entries.
+        """
+        with self._lock:
+            state = {**self._previous, **self._current}
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Write to a temporary file first so that an interrupted run never
+        # leaves a partially written state behind.
+        handle, temp_path = tempfile.mkstemp(dir=directory or ".", suffix=".tmp")
+        with os.fdopen(handle, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(temp_path, self.path)
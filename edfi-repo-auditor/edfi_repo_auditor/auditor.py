@@ -8,23 +8,65 @@ GitHub Actions auditor that runs on a single repository and outputs
 results to GitHub Actions job summary instead of generating HTML files.
 """
 
+import asyncio
 import logging
 import os
-import re
-from typing import List
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, cast
 from datetime import datetime, timedelta
 
+import numpy as np
 import pandas as pd
-
-from edfi_repo_auditor.checklist import (
-    CHECKLIST,
-    CHECKLIST_DEFAULT_SUCCESS_MESSAGE,
-    get_message,
+import requests
+
+from edfi_repo_auditor.checklist import CHECKLIST
+from edfi_repo_auditor.actions_index import INDEX_FILE_NAME, ActionsIndex
+from edfi_repo_auditor.async_github_client import AsyncGitHubClient
+from edfi_repo_auditor.audit_state import (
+    FINGERPRINT_FIELDS,
+    STATE_FILE_NAME,
+    AuditState,
+    fingerprint,
 )
+from edfi_repo_auditor.checkpoint import CHECKPOINT_FILE_NAME, Checkpoint
 from edfi_repo_auditor.config import Configuration
+from edfi_repo_auditor.disk_cache import DiskCache
 from edfi_repo_auditor.github_client import GitHubClient
-from edfi_repo_auditor.ossf_score import get_ossf_score
+from edfi_repo_auditor.http_cache import HttpCache
+from edfi_repo_auditor.ossf_score import OSSF_SCORE_KEY, fetch_ossf_score
 from edfi_repo_auditor.pr_metrics import get_pr_metrics
+from edfi_repo_auditor.rate_limit import RateLimitScheduler
+from edfi_repo_auditor.repository_files import RepositoryFiles
+from edfi_repo_auditor.results import WORKFLOW_FETCHES_SKIPPED_KEY, AuditResult
+from edfi_repo_auditor.rules import (
+    DEPENDABOT_STATUS,
+    FULL_PLAN,
+    AuditPlan,
+    plan_audit,
+)
+from edfi_repo_auditor.scoring import (
+    MEETS_THRESHOLD_KEY,
+    SCORE_KEY,
+    Scoring,
+    load_scoring,
+    score_records,
+    with_scores,
+)
+from edfi_repo_auditor.sinks import ResultSink, open_sinks
+from edfi_repo_auditor.stage_memo import StageMemo, memo_fields, memoize_stages
+from edfi_repo_auditor.stages import Stage, run_stages
+from edfi_repo_auditor.step_summary import (
+    org_summary,
+    repository_markdown,
+    write_details,
+    write_step_summary,
+)
+from edfi_repo_auditor.workflow_cache import WorkflowCache
+from edfi_repo_auditor.workflow_graph import WorkflowGraph
+from edfi_repo_auditor.workflow_model import USES_CHECKS, UsesReference, parse_workflow
+from edfi_repo_auditor.workflow_scanner import WorkflowScanner
 
 
 logger: logging.Logger = logging.getLogger(__name__)
@@ -33,252 +75,1195 @@ logger: logging.Logger = logging.getLogger(__name__)
 ALERTS_INCLUDED_SEVERITIES = ["CRITICAL", "HIGH"]
 ALERTS_WEEKS_SINCE_CREATED = 3
 
+# Workflow files whose names contain these words are the most likely to
+# satisfy the workflow checks, and are read first, in this order.
+WORKFLOW_PRIORITY_KEYWORDS = ["test", "scan", "build"]
+
+# Number of workflow files downloaded per request
+WORKFLOW_FETCH_BATCH_SIZE = 4
+
+WORKFLOW_SCANNER = WorkflowScanner()
+
+# Percentage of `--cache_max_mb` given to each cache in the cache directory, so
+# that together they stay within it
+CACHE_SHARES = {"http": 50, "workflows": 25, "trees": 15, "stages": 10}
+
+# Stages whose outputs are audit results, in the order they are reported
+RESULT_STAGES = ["actions", "files", "repo_config", "pr_metrics", "ossf_score"]
+
 
 def run_audit(config: Configuration) -> None:
     """
-    Run audit on a single repository and output results to GitHub Actions.
+    Run the audit and output results to GitHub Actions. Repositories are
+    audited by `config.workers` threads.
 
     Args:
         config: Configuration with repository details
     """
-    client = GitHubClient(config.personal_access_token)
+    client = GitHubClient(config.personal_access_token, **_client_options(config))
+    audit = _Audit(config, client)
+    repositories = audit.list_repositories()
+    audit.open_outputs()
+
+    # Repositories are independent, so they are spread across the workers.
+    # `map` yields results in input order, keeping the report deterministic.
+    try:
+        with ThreadPoolExecutor(
+            max_workers=config.workers, thread_name_prefix="audit"
+        ) as executor:
+            for repository, results in zip(
+                repositories, executor.map(audit.audit, repositories)
+            ):
+                audit.report(repository, results)
+    finally:
+        audit.close()
+
+    audit.complete(client)
+
+
+async def run_audit_async(config: Configuration) -> None:
+    """
+    Run the audit with up to `config.max_in_flight` GitHub API calls in flight
+    at once. Repositories are audited by `config.workers` threads; results are
+    reported in the same order as the synchronous path.
 
-    organization = config.organization
+    Args:
+        config: Configuration with repository details
+    """
+    async with AsyncGitHubClient(
+        config.personal_access_token,
+        max_in_flight=config.max_in_flight,
+        **_client_options(config),
+    ) as async_client:
+        # Audit stages block on their API calls, so they run in threads of
+        # their own; the API calls themselves run on the async client's
+        # executor.
+        loop = asyncio.get_running_loop()
+        audit = _Audit(config, cast(GitHubClient, async_client.blocking(loop)))
+        repositories = await loop.run_in_executor(None, audit.list_repositories)
+        # The outputs are written and closed on this thread, so they are
+        # opened on it too.
+        audit.open_outputs()
+
+        # Results are reported in input order, each as soon as it and those
+        # before it are done.
+        try:
+            with ThreadPoolExecutor(
+                max_workers=config.workers, thread_name_prefix="audit"
+            ) as executor:
+                futures = [
+                    loop.run_in_executor(executor, audit.audit, repository)
+                    for repository in repositories
+                ]
+                for repository, future in zip(repositories, futures):
+                    audit.report(repository, await future)
+        finally:
+            audit.close()
+
+        audit.complete(async_client.client)
+
+
+class _Audit:
+    """
+    One audit of an organization's repositories: the setup, the audit of each
+    repository and the reporting that the synchronous and asyncio paths share.
+    They only differ in how the repositories are scheduled.
+    """
 
-    repositories = (
-        config.repositories
-        if len(config.repositories) > 0
-        else client.get_repositories(config.organization)
-    )
+    def __init__(self, config: Configuration, client: GitHubClient):
+        """
+        Parameters:
+            client: Client for the audit stages, which run in worker threads
+        """
+        self.config = config
+        self.client = client
+        self.scoring = _load_scoring(config)
+        self.plan = _audit_plan(config, self.scoring)
+        self.state = _audit_state(config)
+        self.stage_memo = _stage_memo(config)
+        self.workflow_cache = _workflow_cache(config)
+        self.workflow_graph = WorkflowGraph(client)
+        self.actions_index = _actions_index(config)
+        self.report_data: List[Tuple[str, AuditResult]] = []
+        self.information: Dict[str, dict] = {}
+        self.progress: Optional[AuditProgress] = None
+        self.checkpoint: Optional[Checkpoint] = None
+        self.sinks: List[ResultSink] = []
+
+    def list_repositories(self) -> List[str]:
+        """List the repositories to audit, fetching their information."""
+        organization = self.config.organization
+        fields = _information_fields(self.plan, self.state, self.stage_memo)
+
+        # Settings for every repository are fetched up front in a few bulk
+        # queries; this also lists the organization's repositories when none
+        # were given.
+        if fields:
+            self.information = self.client.get_repositories_information(
+                organization, self.config.repositories, fields
+            )
+            repositories = self.config.repositories or list(self.information)
+        else:
+            repositories = self.config.repositories or self.client.get_repositories(
+                organization
+            )
 
-    report_data = []
+        self.progress = AuditProgress(self.client.scheduler, len(repositories))
+        return repositories
+
+    def open_outputs(self) -> None:
+        """Open the checkpoint and the streaming outputs."""
+        self.checkpoint = _checkpoint(self.config, self.plan)
+        self.sinks = _open_sinks(self.config)
+
+    def audit(self, repository: str) -> AuditResult:
+        return _audit_or_record_failure(
+            self.client,
+            self.config.organization,
+            repository,
+            self.information.get(repository),
+            cast(AuditProgress, self.progress),
+            self.workflow_cache,
+            self.workflow_graph,
+            self.actions_index,
+            self.plan,
+            self.state,
+            self.stage_memo,
+            self.checkpoint,
+        )
 
-    for repository in repositories:
+    def report(self, repository: str, results: AuditResult) -> None:
+        _report_repository(repository, results, self.sinks, not self.config.org_summary)
+        self.report_data.append((repository, results))
+
+    def close(self) -> None:
+        """Close the streaming outputs."""
+        _close_sinks(self.sinks)
+
+    def complete(self, client: GitHubClient) -> None:
+        """
+        Parameters:
+            client: The client that made the API calls, for its statistics
+        """
+        _complete_audit(
+            self.config,
+            client,
+            self.report_data,
+            self.progress,
+            self.workflow_cache,
+            self.workflow_graph,
+            self.actions_index,
+            self.scoring,
+            self.state,
+            self.stage_memo,
+            self.checkpoint,
+        )
 
-        logger.info(f"Auditing repository {organization}/{repository}")
 
-        # Perform all audits
-        repo_config = get_repo_information(client, organization, repository)
-        logger.debug(f"Repo configuration: {repo_config}")
-        actions = audit_actions(client, organization, repository)
-        logger.debug(f"Actions {actions}")
-        file_review = review_files(client, organization, repository)
-        logger.debug(f"Files: {file_review}")
-        pr_metrics = get_pr_metrics(client, config.organization, repository)
-        logger.debug(f"PR Metrics: {pr_metrics}")
-        ossf_score = get_ossf_score(organization, repository)
-        logger.debug(f"OpenSSF Score: {ossf_score}")
+class AuditProgress:
+    """
+    Logs progress and the projected time to finish after each repository, and
+    accumulates the time spent in each audit stage.
+    """
 
-        results = {**actions, **file_review, **repo_config, **pr_metrics, **ossf_score}
+    def __init__(self, scheduler: RateLimitScheduler, total: int):
+        self._scheduler = scheduler
+        self._total = total
+        self._done = 0
+        self._started = time.monotonic()
+        self._lock = threading.Lock()
+        self._stage_seconds: Dict[str, List[float]] = {}
+
+    def completed(self, stage_timings: Optional[Dict[str, float]] = None) -> None:
+        with self._lock:
+            self._done += 1
+            done = self._done
+            for stage, seconds in (stage_timings or {}).items():
+                self._stage_seconds.setdefault(stage, []).append(seconds)
+
+        remaining = self._total - done
+        elapsed = time.monotonic() - self._started
+
+        # Project both from the pace so far and from the calls the remaining
+        # repositories are expected to need against the rate limit budgets.
+        pending = {
+            resource: count / done * remaining
+            for resource, count in self._scheduler.requests().items()
+        }
+        projected = max(
+            elapsed / done * remaining, self._scheduler.projected_seconds(pending)
+        )
 
-        output_to_github_actions(repository, results)
+        logger.info(
+            f"Audited {done}/{self._total} repositories; projected time to "
+            f"finish: {timedelta(seconds=round(projected))}"
+        )
 
-        report_data.append(
-            {
-                "repository": repository,
-                **actions,
-                **file_review,
-                **repo_config,
-                **pr_metrics,
-                **ossf_score,
+    def stage_timings(self) -> Dict[str, Dict[str, float]]:
+        """Mean and maximum seconds per stage, slowest stages first."""
+        with self._lock:
+            summary = {
+                stage: {"mean": sum(seconds) / len(seconds), "max": max(seconds)}
+                for stage, seconds in self._stage_seconds.items()
             }
+        return dict(
+            sorted(summary.items(), key=lambda item: item[1]["mean"], reverse=True)
+        )
+
+
+def audit_repository(
+    client: GitHubClient,
+    organization: str,
+    repository: str,
+    information: Optional[dict] = None,
+    stage_timings: Optional[Dict[str, float]] = None,
+    workflow_cache: Optional[WorkflowCache] = None,
+    workflow_graph: Optional[WorkflowGraph] = None,
+    actions_index: Optional[ActionsIndex] = None,
+    plan: AuditPlan = FULL_PLAN,
+    stage_memo: Optional[StageMemo] = None,
+) -> AuditResult:
+    """
+    Run every audit against one repository and combine the results. The audit
+    stages run concurrently, each starting once the stages it needs are done.
+
+    Args:
+        client: GitHubClient instance
+        organization: Organization name
+        repository: Repository name
+        information: Pre-fetched repository information, see
+            `GitHubClient.get_repositories_information`
+        stage_timings: Receives the seconds spent in each stage, when given
+        workflow_cache: Workflow files and scan results shared between
+            repositories
+        workflow_graph: Reusable workflows and composite actions shared
+            between repositories
+        actions_index: Index of the actions used, updated when given
+        plan: The checks to run; stages that no planned check needs are
+            skipped
+        stage_memo: Results of earlier runs, reused by the stages whose
+            inputs have not changed
+    """
+    logger.info(f"Auditing repository {organization}/{repository}")
+
+    outputs, timings = run_stages(
+        audit_stages(
+            client,
+            organization,
+            repository,
+            information,
+            workflow_cache,
+            workflow_graph,
+            actions_index,
+            plan,
+            stage_memo,
+        )
+    )
+    logger.debug(
+        f"Stage timings for {repository}: "
+        + ", ".join(f"{stage} {seconds:.2f}s" for stage, seconds in timings.items())
+    )
+    if stage_timings is not None:
+        stage_timings.update(timings)
+
+    # Merge in a fixed order so that the results do not depend on which stage
+    # happened to finish first.
+    results = AuditResult()
+    for stage in RESULT_STAGES:
+        if stage in outputs:
+            logger.debug(f"{stage}: {outputs[stage]}")
+            results.update(outputs[stage])
+    return results
+
+
+def audit_stages(
+    client: GitHubClient,
+    organization: str,
+    repository: str,
+    information: Optional[dict] = None,
+    workflow_cache: Optional[WorkflowCache] = None,
+    workflow_graph: Optional[WorkflowGraph] = None,
+    actions_index: Optional[ActionsIndex] = None,
+    plan: AuditPlan = FULL_PLAN,
+    stage_memo: Optional[StageMemo] = None,
+) -> List[Stage]:
+    """
+    Describe the audit of one repository as a dependency graph of stages.
+    The repository settings and required-file checks wait for the repository
+    information; everything else can start immediately. Only the stages that
+    `plan` needs are described. With a `stage_memo`, every stage also waits
+    for the information, which fingerprints its inputs.
+    """
+    fields = plan.fields
+    if stage_memo is not None:
+        fields = list(dict.fromkeys(fields + memo_fields(plan)))
+
+    def fetch_information(_: Dict[str, Any]) -> dict:
+        if information is not None:
+            return information
+        return client.get_repository_information(organization, repository, fields)
+
+    # Without any planned fields there is no information to wait for
+    needs_information = ("information",) if plan.fields else ()
+
+    stages = [
+        Stage(
+            "repo_config",
+            lambda inputs: get_repo_information(
+                client, organization, repository, inputs.get("information"), plan
+            ),
+            requires=needs_information,
+        ),
+        Stage(
+            "actions",
+            lambda _: audit_actions(
+                client,
+                organization,
+                repository,
+                workflow_cache,
+                workflow_graph,
+                actions_index,
+                plan,
+            ),
+        ),
+        Stage(
+            "files",
+            lambda inputs: review_files(
+                client, organization, repository, inputs.get("information"), plan
+            ),
+            requires=needs_information,
+        ),
+        Stage(
+            "pr_metrics",
+            lambda _: AuditResult(get_pr_metrics(client, organization, repository)),
+        ),
+        Stage(
+            "ossf_score",
+            lambda _: _ossf_score(organization, repository),
+        ),
+    ]
+    stages = [stage for stage in stages if stage.name in plan.stages]
+    if stage_memo is not None:
+        stages = memoize_stages(
+            stages, stage_memo, f"{organization}/{repository}", plan
+        )
+    if any(stage.requires for stage in stages):
+        stages.insert(0, Stage("information", fetch_information))
+    return stages
+
+
+def _ossf_score(organization: str, repository: str) -> AuditResult:
+    try:
+        score = fetch_ossf_score(organization, repository)
+    except requests.RequestException as exc:
+        logger.warning(
+            f"Failed to fetch the OSSF score of {organization}/{repository}: {exc}"
+        )
+        # Not kept between runs, so that the score is fetched again
+        return AuditResult({OSSF_SCORE_KEY: None}, complete=False)
+    return AuditResult({OSSF_SCORE_KEY: score})
+
+
+def _audit_or_record_failure(
+    client: GitHubClient,
+    organization: str,
+    repository: str,
+    information: Optional[dict],
+    progress: "AuditProgress",
+    workflow_cache: Optional[WorkflowCache] = None,
+    workflow_graph: Optional[WorkflowGraph] = None,
+    actions_index: Optional[ActionsIndex] = None,
+    plan: AuditPlan = FULL_PLAN,
+    state: Optional[AuditState] = None,
+    stage_memo: Optional[StageMemo] = None,
+    checkpoint: Optional[Checkpoint] = None,
+) -> AuditResult:
+    """
+    Audit one repository. A failure is logged and recorded in the results
+    instead of stopping the audit of the remaining repositories.
+
+    With an audit `state`, a repository unchanged since the previous audit
+    keeps its previous results, and only its checks that can change while it
+    does not are run again. With a
+    `checkpoint`, the results are recorded as soon as the repository is done,
+    and a repository done before a resumed audit was interrupted is skipped.
+    """
+    done = (
+        AuditResult.from_dict(checkpoint.completed[repository])
+        if checkpoint is not None and repository in checkpoint.completed
+        else None
+    )
+    if done is not None:
+        progress.completed()
+        return done
+
+    results = _audit_or_reuse(
+        client,
+        organization,
+        repository,
+        information,
+        progress,
+        workflow_cache,
+        workflow_graph,
+        actions_index,
+        plan,
+        state,
+        stage_memo,
+    )
+    if checkpoint is not None:
+        checkpoint.record(
+            repository, results.to_dict(), failed=results.error is not None
+        )
+    return results
+
+
+def _audit_or_reuse(
+    client: GitHubClient,
+    organization: str,
+    repository: str,
+    information: Optional[dict],
+    progress: "AuditProgress",
+    workflow_cache: Optional[WorkflowCache],
+    workflow_graph: Optional[WorkflowGraph],
+    actions_index: Optional[ActionsIndex],
+    plan: AuditPlan,
+    state: Optional[AuditState],
+    stage_memo: Optional[StageMemo],
+) -> AuditResult:
+    key = (
+        fingerprint(information, [rule.name for rule in plan.rules])
+        if state is not None and information is not None
+        else None
+    )
+    previous = (
+        state.previous_results(repository, key)
+        if state is not None and key is not None
+        else None
+    )
+    if previous is not None:
+        logger.debug(f"Reusing results of unchanged {organization}/{repository}")
+        plan = _refresh_plan(plan)
+        if not plan.rules:
+            progress.completed()
+            return previous
+
+    stage_timings: Dict[str, float] = {}
+    try:
+        results = audit_repository(
+            client,
+            organization,
+            repository,
+            information,
+            stage_timings,
+            workflow_cache=workflow_cache,
+            workflow_graph=workflow_graph,
+            actions_index=actions_index,
+            plan=plan,
+            stage_memo=stage_memo,
+        )
+    except Exception as error:
+        logger.error(
+            f"Audit of {organization}/{repository} failed: {error}", exc_info=True
+        )
+        results = AuditResult(error=str(error))
+    else:
+        if previous is not None:
+            previous.update(results)
+            results = previous
+        if state is not None and key is not None:
+            state.record(repository, key, results.to_dict())
+
+    progress.completed(stage_timings)
+    return results
+
+
+def _refresh_plan(plan: AuditPlan) -> AuditPlan:
+    """
+    The planned checks to run again for an unchanged repository: those that
+    depend on the time, and the Dependabot status, which is not part of the
+    repository information.
+    """
+    return AuditPlan(
+        tuple(
+            rule
+            for rule in plan.rules
+            if rule.time_dependent or DEPENDABOT_STATUS in rule.calls
+        )
+    )
+
+
+def _cache_bytes(config: Configuration, name: str) -> int:
+    return config.cache_max_mb * 1024 * 1024 * CACHE_SHARES[name] // 100
+
+
+def _client_options(config: Configuration) -> dict:
+    cache = (
+        HttpCache(
+            os.path.join(config.cache_dir, "http"),
+            max_bytes=_cache_bytes(config, "http"),
+        )
+        if config.cache_dir
+        else None
+    )
+    tree_cache = (
+        DiskCache(
+            os.path.join(config.cache_dir, "trees"), _cache_bytes(config, "trees")
         )
+        if config.cache_dir
+        else None
+    )
+
+    # Every worker runs the stages of its repository concurrently, and each
+    # stage needs a connection of its own; connections beyond the pool would
+    # be discarded instead of kept alive.
+    return {
+        "pool_size": max(config.pool_size, config.workers * len(FULL_PLAN.stages)),
+        "cache": cache,
+        "tree_cache": tree_cache,
+    }
+
+
+def _workflow_cache(config: Configuration) -> WorkflowCache:
+    return WorkflowCache(
+        os.path.join(config.cache_dir, "workflows") if config.cache_dir else None,
+        max_bytes=_cache_bytes(config, "workflows"),
+    )
+
+
+def _load_scoring(config: Configuration) -> Optional[Scoring]:
+    if not os.path.exists(config.scoring_file):
+        logger.warning(f"{config.scoring_file} not found; results are not scored")
+        return None
+    return load_scoring(config.scoring_file)
+
+
+def _audit_plan(config: Configuration, scoring: Optional[Scoring] = None) -> AuditPlan:
+    if config.checks:
+        plan = plan_audit(config.checks)
+    elif config.scored_only:
+        if scoring is None:
+            raise ValueError(f"--scored_only needs {config.scoring_file}")
+        plan = plan_audit(scoring.rules, strict=False)
+    else:
+        return FULL_PLAN
+
+    logger.info(
+        f"Running {len(plan.rules)} checks; querying "
+        f"{', '.join(plan.fields) or 'no repository fields'} and calling "
+        f"{', '.join(sorted(plan.calls)) or 'nothing else'}"
+    )
+    return plan
+
+
+def _actions_index(config: Configuration) -> Optional[ActionsIndex]:
+    path = config.actions_index or (
+        os.path.join(config.cache_dir, INDEX_FILE_NAME) if config.cache_dir else ""
+    )
+    return ActionsIndex(path) if path else None
+
+
+def _audit_state(config: Configuration) -> Optional[AuditState]:
+    path = config.state_file or (
+        os.path.join(config.cache_dir, STATE_FILE_NAME) if config.cache_dir else ""
+    )
+    return AuditState(path, reuse=not config.full) if path else None
+
+
+def _checkpoint(config: Configuration, plan: AuditPlan) -> Optional[Checkpoint]:
+    path = config.checkpoint_file or (
+        os.path.join(config.cache_dir, CHECKPOINT_FILE_NAME) if config.cache_dir else ""
+    )
+    if not path:
+        if config.resume:
+            raise ValueError("--resume needs a checkpoint file or cache directory")
+        return None
+
+    audit = {
+        "organization": config.organization,
+        "repositories": config.repositories,
+        "checks": [rule.name for rule in plan.rules],
+    }
+    return Checkpoint(path, audit, resume=config.resume)
+
+
+def _stage_memo(config: Configuration) -> Optional[StageMemo]:
+    if not config.cache_dir:
+        return None
+    return StageMemo(
+        os.path.join(config.cache_dir, "stages"),
+        max_bytes=_cache_bytes(config, "stages"),
+        reuse=not config.full,
+        max_age_hours=config.max_age_hours,
+    )
+
+
+def _information_fields(
+    plan: AuditPlan,
+    state: Optional[AuditState],
+    stage_memo: Optional[StageMemo] = None,
+) -> List[str]:
+    """
+    The fields the planned checks read, and those fingerprinting the state
+    and the stages.
+    """
+    fields = list(plan.fields)
+    if state is not None:
+        fields += FINGERPRINT_FIELDS
+    if stage_memo is not None:
+        fields += memo_fields(plan)
+    return list(dict.fromkeys(fields))
+
+
+def _complete_audit(
+    config: Configuration,
+    client: GitHubClient,
+    report_data: List[Tuple[str, AuditResult]],
+    progress: Optional[AuditProgress] = None,
+    workflow_cache: Optional[WorkflowCache] = None,
+    workflow_graph: Optional[WorkflowGraph] = None,
+    actions_index: Optional[ActionsIndex] = None,
+    scoring: Optional[Scoring] = None,
+    state: Optional[AuditState] = None,
+    stage_memo: Optional[StageMemo] = None,
+    checkpoint: Optional[Checkpoint] = None,
+) -> None:
+    report = pd.DataFrame(
+        [
+            {"repository": repository, **result.render()}
+            for repository, result in report_data
+        ]
+    )
+    scores = None
+    if scoring is not None and report_data:
+        scores = score_records([result for _, result in report_data], scoring)
+        report = with_scores(report, scores, scoring)
+        if not config.org_summary:
+            output_scores_to_github_actions(report, scoring)
+
+    if config.org_summary:
+        output_org_summary(config, report_data, scores, scoring)
 
     if config.save_results is True:
-        save_to_csv(pd.DataFrame(report_data), config.file_name)
+        save_to_csv(report, config.file_name)
+
+    if checkpoint is not None:
+        checkpoint.finish()
+
+    if state is not None:
+        state.save()
+        logger.info(
+            f"Reused the previous results of {state.reused} unchanged repositories"
+        )
+    if stage_memo is not None:
+        for stage, counts in stage_memo.stats().items():
+            logger.info(
+                f"Stage {stage}: reused {counts['hits']} results of unchanged "
+                f"inputs, ran {counts['misses']} times"
+            )
+
+    if progress is not None:
+        for stage, seconds in progress.stage_timings().items():
+            logger.info(
+                f"Stage {stage}: {seconds['mean']:.2f}s mean, "
+                f"{seconds['max']:.2f}s max per repository"
+            )
+
+    stats = client.connection_stats()
+    logger.info(
+        f"GitHub API requests: {stats['requests']}, new connections: "
+        f"{stats['connections']}, reused connections: {stats['reused']}"
+    )
+    logger.info(
+        f"Waited {client.scheduler.waited_seconds:.1f}s for GitHub API rate limits"
+    )
+    logger.info(
+        f"Skipped {client.pages_skipped} pull request pages outside the time window"
+    )
+    for endpoint_class, retries in client.retrier.stats().items():
+        logger.info(
+            f"Retried {retries['retries']} {endpoint_class} calls, spending "
+            f"{retries['seconds']:.1f}s in backoff"
+        )
+    if client.cache is not None:
+        cache_stats = client.cache.stats()
+        logger.info(
+            f"Response cache: {cache_stats['hits']} not-modified responses served "
+            f"from cache, {cache_stats['misses']} downloaded"
+        )
+    if workflow_cache is not None:
+        workflow_stats = workflow_cache.stats()
+        lookups = workflow_stats["hits"] + workflow_stats["misses"]
+        logger.info(
+            f"Workflow cache: {workflow_stats['hits']} of {lookups} workflow "
+            f"files found ({workflow_stats['hits'] / max(lookups, 1):.0%} hit rate)"
+        )
+    if workflow_graph is not None:
+        logger.info(f"Read {workflow_graph.fetched} reusable workflow and action files")
+    if actions_index is not None:
+        actions_index.close()
+    client.close()
 
     logger.info("Audit complete.")
 
 
-def audit_actions(client: GitHubClient, organization: str, repository: str) -> dict:
-    """Audit GitHub Actions configuration."""
-    audit_results: dict = {}
+def _workflow_priority(workflow: dict) -> Tuple[int, str]:
+    name = workflow["name"].lower()
+    for rank, keyword in enumerate(WORKFLOW_PRIORITY_KEYWORDS):
+        if keyword in name:
+            return rank, workflow["path"]
+    return len(WORKFLOW_PRIORITY_KEYWORDS), workflow["path"]
+
+
+class _WorkflowReader:
+    """
+    Scans and parses a repository's workflows in the order given. Results are
+    taken from the cache where possible; other files are downloaded a few at a
+    time, only when the caller asks for more. `fetched` counts these
+    downloads.
+    """
+
+    def __init__(
+        self,
+        client: GitHubClient,
+        organization: str,
+        repository: str,
+        cache: WorkflowCache,
+    ):
+        self._client = client
+        self._organization = organization
+        self._repository = repository
+        self._cache = cache
+        self.fetched = 0
+
+    def _scan(self, oid: str, text: str) -> Optional[dict]:
+        if not text:
+            entry = None
+        else:
+            workflow = parse_workflow(text)
+            entry = {
+                "found": WORKFLOW_SCANNER.scan(text),
+                "uses": (
+                    [reference.raw for reference in workflow.references()]
+                    if workflow is not None
+                    else []
+                ),
+            }
+        self._cache.set(
+            oid, {"text": text, "checks": WORKFLOW_SCANNER.signature, "result": entry}
+        )
+        return entry
+
+    def _download(self, workflows: List[dict]) -> Iterator[Tuple[str, Optional[dict]]]:
+        texts = self._client.get_blob_texts(
+            self._organization,
+            self._repository,
+            [workflow["oid"] for workflow in workflows],
+        )
+        self.fetched += len(workflows)
+        for workflow in workflows:
+            oid = workflow["oid"]
+            yield oid, self._scan(oid, texts.get(oid) or "")
+
+    def _cached(self, oid: str, entry: dict) -> Optional[dict]:
+        if entry["checks"] == WORKFLOW_SCANNER.signature and "result" in entry:
+            return entry["result"]
+        # The checks have changed since the file was stored; the text can be
+        # scanned again without downloading it.
+        return self._scan(oid, entry["text"])
+
+    def results(self, workflows: List[dict]) -> Iterator[Tuple[str, Optional[dict]]]:
+        """
+        Yield the blob SHA of each workflow with its scan bitmap (`found`)
+        and `uses` references; None for empty files.
+        """
+        pending: List[dict] = []
+        for workflow in workflows:
+            oid = workflow["oid"]
+            entry = self._cache.get(oid)
+            if entry is None:
+                pending.append(workflow)
+                if len(pending) == WORKFLOW_FETCH_BATCH_SIZE:
+                    yield from self._download(pending)
+                    pending = []
+            else:
+                yield oid, self._cached(oid, entry)
+
+        if pending:
+            yield from self._download(pending)
+
+    def all_results(
+        self, workflows: List[dict]
+    ) -> Iterator[Tuple[str, Optional[dict]]]:
+        """
+        Like `results`, but every file not in the cache is read at once with
+        the query for all of the repository's workflow files. These reads are
+        not counted in `fetched`.
+        """
+        entries = {
+            workflow["oid"]: self._cache.get(workflow["oid"]) for workflow in workflows
+        }
+        texts: Dict[str, str] = {}
+        if any(entry is None for entry in entries.values()):
+            texts = self._client.get_workflow_files(
+                self._organization, [self._repository]
+            ).get(self._repository, {})
+
+        for workflow in workflows:
+            oid = workflow["oid"]
+            entry = entries[oid]
+            if entry is None:
+                yield oid, self._scan(oid, texts.get(workflow["path"], ""))
+            else:
+                yield oid, self._cached(oid, entry)
+
+
+def _index_actions(
+    actions_index: ActionsIndex,
+    organization: str,
+    repository: str,
+    workflows: List[dict],
+    reader: _WorkflowReader,
+    uses: Dict[str, List[str]],
+) -> None:
+    # Only files the audit stopped before reading, and that are not indexed
+    # already, are read now, in one query rather than a few at a time
+    missing = actions_index.missing(workflow["oid"] for workflow in workflows)
+    unread = [
+        workflow
+        for workflow in workflows
+        if workflow["oid"] in missing and workflow["oid"] not in uses
+    ]
+    for oid, result in reader.all_results(unread):
+        uses[oid] = result["uses"] if result is not None else []
+
+    actions_index.update(
+        organization,
+        repository,
+        {workflow["path"]: workflow["oid"] for workflow in workflows},
+        {oid: values for oid, values in uses.items() if oid in missing},
+    )
 
-    actions = client.get_actions(organization, repository)
 
-    logger.debug(f"Got {actions['total_count']} workflow files")
+def audit_actions(
+    client: GitHubClient,
+    organization: str,
+    repository: str,
+    workflow_cache: Optional[WorkflowCache] = None,
+    workflow_graph: Optional[WorkflowGraph] = None,
+    actions_index: Optional[ActionsIndex] = None,
+    plan: AuditPlan = FULL_PLAN,
+) -> AuditResult:
+    """
+    Audit GitHub Actions configuration. Workflow files are read in order of
+    how likely they are to pass the checks, and reading stops once every
+    check has passed. Files already in `workflow_cache` are not downloaded.
+
+    Checks on the workflows and actions used also look through the reusable
+    workflows and composite actions that are called, which `workflow_graph`
+    loads once per run.
+
+    When given, `actions_index` is updated with the references in every
+    workflow file; files whose blob SHA is already indexed are not read.
 
-    audit_results[CHECKLIST.HAS_ACTIONS["description"]] = get_message(
-        CHECKLIST.HAS_ACTIONS, actions["total_count"] > 0
+    Only the checks in `plan` are evaluated, and no workflow file is read
+    when none of them looks at the content.
+    """
+    audit_results = AuditResult()
+
+    workflows = sorted(
+        client.get_workflow_tree(organization, repository), key=_workflow_priority
     )
 
-    ut_pattern = re.compile(r"unit.{0,2}test(s)?", flags=re.IGNORECASE)
-    approved_actions_pattern = re.compile(
-        r"uses:\s*ed-fi-alliance-oss/ed-fi-actions/.github/workflows/repository-scanner\.yml",
-        flags=re.IGNORECASE,
+    logger.debug(f"Got {len(workflows)} workflow files")
+
+    if plan.includes(CHECKLIST.HAS_ACTIONS):
+        audit_results.record(CHECKLIST.HAS_ACTIONS, len(workflows) > 0)
+
+    uses_checks = [check for check in USES_CHECKS if plan.includes(check.item)]
+    scanner_checks = [
+        check for check in WORKFLOW_SCANNER.checks if plan.includes(check.item)
+    ]
+    # Bits of the planned checks in the scanner's bitmap
+    wanted = sum(
+        1 << index
+        for index, check in enumerate(WORKFLOW_SCANNER.checks)
+        if check in scanner_checks
+    )
+
+    found = 0
+    references: Set[UsesReference] = set()
+    scanned = False
+    reader = _WorkflowReader(
+        client, organization, repository, workflow_cache or WorkflowCache()
     )
-    workflow_paths = [workflow["path"] for workflow in actions["workflows"]]
+    graph = workflow_graph or WorkflowGraph(client)
+
+    def uses_checks_passed() -> bool:
+        return all(check.passed(references) for check in uses_checks)
 
-    for file_path in workflow_paths:
-        file_content = client.get_file_content(organization, repository, file_path)
-        if not file_content:
-            logger.debug("File not found")
+    uses: Dict[str, List[str]] = {}
+    reads = workflows if uses_checks or scanner_checks else []
+    for oid, result in reader.results(reads):
+        uses[oid] = result["uses"] if result is not None else []
+        if result is None:
             continue
 
-        if (
-            CHECKLIST.APPROVED_ACTIONS["description"] not in audit_results
-            or audit_results[CHECKLIST.APPROVED_ACTIONS["description"]]
-            == CHECKLIST.APPROVED_ACTIONS["fail"]
-        ):
-            audit_results[CHECKLIST.APPROVED_ACTIONS["description"]] = get_message(
-                CHECKLIST.APPROVED_ACTIONS,
-                approved_actions_pattern.search(file_content) is not None,
-            )
+        found |= result["found"]
+        scanned = True
 
-        if (
-            CHECKLIST.TEST_REPORTER["description"] not in audit_results
-            or audit_results[CHECKLIST.TEST_REPORTER["description"]]
-            == CHECKLIST.TEST_REPORTER["fail"]
-        ):
-            audit_results[CHECKLIST.TEST_REPORTER["description"]] = get_message(
-                CHECKLIST.TEST_REPORTER,
-                "uses: dorny/test-reporter" in file_content
-                or "uses: EnricoMi/publish-unit-test-result-action" in file_content,
-            )
+        direct = {
+            UsesReference.parse(raw).relative_to(organization, repository)
+            for raw in result["uses"]
+        }
+        references |= direct
+        # Called workflows and actions are only loaded when the references
+        # made directly are not enough
+        if not uses_checks_passed():
+            references |= graph.references(organization, repository, direct)
 
-        if (
-            CHECKLIST.UNIT_TESTS["description"] not in audit_results
-            or audit_results[CHECKLIST.UNIT_TESTS["description"]]
-            == CHECKLIST.UNIT_TESTS["fail"]
-        ):
-            audit_results[CHECKLIST.UNIT_TESTS["description"]] = get_message(
-                CHECKLIST.UNIT_TESTS, ut_pattern.search(file_content) is not None
-            )
+        # Checking before the next file is requested avoids downloading it
+        if found & wanted == wanted and uses_checks_passed():
+            break
+
+    if scanned:
+        for uses_check in uses_checks:
+            audit_results.record(uses_check.item, uses_check.passed(references))
+        for check in scanner_checks:
+            audit_results.record(check.item, WORKFLOW_SCANNER.passed(found, check))
+
+    if actions_index is not None:
+        _index_actions(actions_index, organization, repository, workflows, reader, uses)
+
+    skipped = len(workflows) - reader.fetched
+    audit_results.metrics[WORKFLOW_FETCHES_SKIPPED_KEY] = skipped
+    logger.debug(f"Skipped fetching {skipped} workflow files")
 
     return audit_results
 
 
 def get_repo_information(
-    client: GitHubClient, organization: str, repository: str
-) -> dict:
-    """Get repository configuration information."""
-    information = client.get_repository_information(organization, repository)
+    client: GitHubClient,
+    organization: str,
+    repository: str,
+    information: Optional[dict] = None,
+    plan: AuditPlan = FULL_PLAN,
+) -> AuditResult:
+    """
+    Get repository configuration information. Uses `information` when it was
+    pre-fetched and only queries GitHub otherwise.
+    """
+    if information is None:
+        information = (
+            client.get_repository_information(organization, repository, plan.fields)
+            if plan.fields
+            else {}
+        )
 
-    dependabot_results = audit_alerts(
-        client, organization, repository, information["vulnerabilityAlerts"]["nodes"]
+    settings = [
+        (CHECKLIST.WIKI, lambda: not information["hasWikiEnabled"]),
+        (CHECKLIST.ISSUES, lambda: information["hasIssuesEnabled"]),
+        (CHECKLIST.PROJECTS, lambda: not information["hasProjectsEnabled"]),
+        (CHECKLIST.DELETES_HEAD, lambda: information["deleteBranchOnMerge"]),
+        (CHECKLIST.USES_SQUASH, lambda: information["squashMergeAllowed"]),
+        (
+            CHECKLIST.LICENSE_INFORMATION,
+            lambda: information["licenseInfo"] is not None,
+        ),
+    ]
+    results = AuditResult()
+    for item, passed in settings:
+        if plan.includes(item):
+            results.record(item, passed())
+
+    alerts = (
+        information["vulnerabilityAlerts"]["nodes"]
+        if plan.includes(CHECKLIST.DEPENDABOT_ALERTS)
+        else []
     )
-
-    return {
-        **{
-            CHECKLIST.WIKI["description"]: get_message(
-                CHECKLIST.WIKI, not information["hasWikiEnabled"]
-            ),
-            CHECKLIST.ISSUES["description"]: get_message(
-                CHECKLIST.ISSUES, information["hasIssuesEnabled"]
-            ),
-            CHECKLIST.PROJECTS["description"]: get_message(
-                CHECKLIST.PROJECTS, not information["hasProjectsEnabled"]
-            ),
-            CHECKLIST.DELETES_HEAD["description"]: get_message(
-                CHECKLIST.DELETES_HEAD, information["deleteBranchOnMerge"]
-            ),
-            CHECKLIST.USES_SQUASH["description"]: get_message(
-                CHECKLIST.USES_SQUASH, information["squashMergeAllowed"]
-            ),
-            CHECKLIST.LICENSE_INFORMATION["description"]: get_message(
-                CHECKLIST.LICENSE_INFORMATION, information["licenseInfo"] is not None
-            ),
-        },
-        **dependabot_results,
-    }
+    results.update(audit_alerts(client, organization, repository, alerts, plan))
+    return results
 
 
 def audit_alerts(
-    client: GitHubClient, organization: str, repository: str, alerts: List[dict]
-) -> dict:
+    client: GitHubClient,
+    organization: str,
+    repository: str,
+    alerts: List[dict],
+    plan: AuditPlan = FULL_PLAN,
+) -> AuditResult:
     """Audit dependabot alerts."""
-    vulnerabilities = [
-        alert
-        for alert in alerts
-        if (
-            alert["createdAt"]
-            < (datetime.now() - timedelta(ALERTS_WEEKS_SINCE_CREATED * 7)).isoformat()
-            and alert["securityVulnerability"]["advisory"]["severity"]
-            in ALERTS_INCLUDED_SEVERITIES
-        )
-    ]
-    total_vulnerabilities = len(vulnerabilities)
+    results = AuditResult()
+
+    if plan.includes(CHECKLIST.DEPENDABOT_ENABLED):
+        dependabot_enabled = client.has_dependabot_enabled(organization, repository)
+        results.record(CHECKLIST.DEPENDABOT_ENABLED, dependabot_enabled)
+
+    if plan.includes(CHECKLIST.DEPENDABOT_ALERTS):
+        vulnerabilities = [
+            alert
+            for alert in alerts
+            if (
+                alert["createdAt"]
+                < (
+                    datetime.now() - timedelta(ALERTS_WEEKS_SINCE_CREATED * 7)
+                ).isoformat()
+                and alert["securityVulnerability"]["advisory"]["severity"]
+                in ALERTS_INCLUDED_SEVERITIES
+            )
+        ]
+        results.record(CHECKLIST.DEPENDABOT_ALERTS, len(vulnerabilities) == 0)
 
-    dependabot_enabled = client.has_dependabot_enabled(organization, repository)
-    return {
-        CHECKLIST.DEPENDABOT_ENABLED["description"]: get_message(
-            CHECKLIST.DEPENDABOT_ENABLED, dependabot_enabled
-        ),
-        CHECKLIST.DEPENDABOT_ALERTS["description"]: get_message(
-            CHECKLIST.DEPENDABOT_ALERTS, total_vulnerabilities == 0
-        ),
-    }
+    return results
 
 
-def review_files(client: GitHubClient, organization: str, repository: str) -> dict:
-    """Review required files in the repository."""
-    file_audit: dict = {}
+def review_files(
+    client: GitHubClient,
+    organization: str,
+    repository: str,
+    information: Optional[dict] = None,
+    plan: AuditPlan = FULL_PLAN,
+) -> AuditResult:
+    """
+    Review required files in the repository. Every check is answered from one
+    listing of the default branch's head commit, taken from `information` when
+    available.
+    """
+    file_audit = AuditResult()
 
     files_to_review = [
-        CHECKLIST.NOTICES,
-        CHECKLIST.CODE_OF_CONDUCT,
+        file
+        for file in [CHECKLIST.NOTICES, CHECKLIST.CODE_OF_CONDUCT]
+        if plan.includes(file)
     ]
+    if not files_to_review:
+        return file_audit
+
+    revision = "HEAD"
+    if information and information.get("defaultBranchRef"):
+        revision = information["defaultBranchRef"]["target"]["oid"]
+    files = RepositoryFiles(
+        client.get_repository_files(organization, repository, revision)
+    )
 
     for file in files_to_review:
-        file_found = False
-        for filename in file["filename"]:
-            if file_found:
-                # There are multiple possible file names, and one of them was already detected
-                break
-            file_found = (
-                client.get_file_content(organization, repository, filename) is not None
-            )
+        # There are multiple possible file names; any one of them will do
+        file_found = any(
+            files.find(filename) is not None for filename in file["filename"]
+        )
 
-        file_audit[file["description"]] = get_message(file, file_found)
+        file_audit.record(file, file_found)
 
     return file_audit
 
 
-def calculate_score(results: dict, rules: dict) -> int:
-    """Calculate the total score based on audit results."""
-    score = 0
+def output_to_github_actions(repository: str, results: AuditResult) -> None:
+    """
+    Output audit results to GitHub Actions job summary.
 
-    for property in rules:
-        try:
-            if results[property] == CHECKLIST_DEFAULT_SUCCESS_MESSAGE:
-                score += rules[property]
-        except KeyError:
-            logger.info(f"Unable to read property {property} in results")
+    Args:
+        repository: Repository name
+        results: All audit results of the repository
+    """
+    write_step_summary(repository_markdown(repository, results))
 
-    return score
 
+def output_scores_to_github_actions(report: pd.DataFrame, scoring: Scoring) -> None:
+    """
+    Output the score of every repository to the GitHub Actions job summary,
+    in one table.
 
-def output_to_github_actions(repository: str, results: dict) -> None:
+    Args:
+        report: Scored results, one row per repository
+        scoring: The rules the results were scored with
     """
-    Output audit results to GitHub Actions job summary.
+    lines = [
+        "# Repository Scores",
+        "",
+        f"Passing score: {scoring.threshold}",
+        "",
+        "| Repository | Score | Meets Threshold |",
+        "|------------|-------|-----------------|",
+    ]
+    lines.extend(
+        f"| {repository} | {score} | {'✅' if meets else '❌'} |"
+        for repository, score, meets in zip(
+            report["repository"], report[SCORE_KEY], report[MEETS_THRESHOLD_KEY]
+        )
+    )
+    write_step_summary("\n".join(lines) + "\n")
+
+
+def output_org_summary(
+    config: Configuration,
+    report_data: List[Tuple[str, AuditResult]],
+    scores: Optional[np.ndarray] = None,
+    scoring: Optional[Scoring] = None,
+) -> None:
+    """
+    Output one matrix of every repository's checks to the GitHub Actions job
+    summary, within `config.summary_max_kb`, and the full results of every
+    repository to a details file in the reports directory.
 
     Args:
-        repository: Repository name
-        results: Dictionary of all audit results
+        config: Configuration with the organization and the summary budget
+        report_data: Results of each repository, in report order
+        scores: Score of each repository, when scored
+        scoring: The rules the results were scored with
     """
-    github_step_summary = os.getenv("GITHUB_STEP_SUMMARY")
+    details_path = f"{_report_base_path(config.file_name)}-details.md"
+    logger.info(f"Saving the results of every repository to {details_path}")
+    write_details(details_path, report_data)
+
+    write_step_summary(
+        org_summary(
+            config.organization,
+            report_data,
+            config.summary_max_kb * 1024,
+            details_path,
+            scores,
+            scoring.threshold if scoring is not None else None,
+        )
+    )
+
 
-    # Create a markdown summary
-    summary = f"""# Repository Audit Results: {repository}
+def _report_repository(
+    repository: str,
+    results: AuditResult,
+    sinks: List[ResultSink],
+    job_summary: bool = True,
+) -> None:
+    """
+    Parameters:
+        job_summary: False when the results go to the organization summary
+            once the audit completes, rather than to a table of their own
+    """
+    if job_summary:
+        output_to_github_actions(repository, results)
+    for sink in sinks:
+        sink.write(repository, results)
 
 
-## Audit Details
+def _open_sinks(config: Configuration) -> List[ResultSink]:
+    """The streaming outputs requested by `config`, if any."""
+    if not config.outputs:
+        return []
+    return open_sinks(config.outputs, _report_base_path(config.file_name))
 
-| Check | Result |
-|-------|--------|
-"""
 
-    # Sort results for consistent output
-    for check, result in sorted(results.items()):
-        summary += f"| {check} | {result} |\n"
+def _close_sinks(sinks: List[ResultSink]) -> None:
+    for sink in sinks:
+        try:
+            sink.close()
+        except Exception as error:
+            logger.error(f"Failed to close {type(sink).__name__}: {error}")
 
-    # Write to job summary
-    if github_step_summary:
-        with open(github_step_summary, "a") as f:
-            f.write(summary)
 
-    # Also print to stdout
-    print(summary)
+def _report_base_path(file_name: str) -> str:
+    """Path of the reports, without extension, as for `save_to_csv`."""
+    name, ext = os.path.splitext(file_name)
+    return os.path.join(
+        "reports", (name if ext == ".csv" else file_name) or "audit-result"
+    )
 
 
 def save_to_csv(report: pd.DataFrame, file_name: str) -> None:
@@ -0,0 +1,114 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+"""
+Checkpoint of an audit in progress.
+
+Each repository's results are appended to a JSON lines file as soon as the
+repository has been audited, so an interrupted audit keeps the work already
+done. The first line describes the audit; resuming only reuses a checkpoint
+of the same audit. The file is removed once the audit completes.
+"""
+
+import json
+import logging
+import os
+import threading
+from typing import Dict, Optional
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+CHECKPOINT_FILE_NAME = "checkpoint.jsonl"
+
+
+class Checkpoint:
+    def __init__(self, path: str, audit: dict, resume: bool = False):
+        """
+        Parameters:
+            path: JSON lines file holding the checkpoint
+            audit: Description of the audit, such as the organization and the
+                checks run, that a resumed checkpoint must match
+            resume: True to continue from an existing checkpoint; otherwise it
+                is replaced
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._complete_bytes = 0
+
+        loaded = self._load(audit) if resume else None
+        # Results of the repositories audited before the audit was interrupted
+        self.completed: Dict[str, dict] = loaded or {}
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        if loaded is not None:
+            self._file = open(path, "a", encoding="utf-8")
+            # Drop the last line of an interrupted write
+            self._file.truncate(self._complete_bytes)
+            logger.info(
+                f"Resuming the audit; {len(self.completed)} repositories are done"
+            )
+        else:
+            self._file = open(path, "w", encoding="utf-8")
+            self._write({"audit": audit})
+
+    def _load(self, audit: dict) -> Optional[Dict[str, dict]]:
+        """
+        The completed repositories in the checkpoint, or None when there is
+        no checkpoint of `audit`. Failed repositories are audited again.
+        """
+        try:
+            with open(self.path, "rb") as f:
+                lines = f.read().decode("utf-8").splitlines(keepends=True)
+        except FileNotFoundError:
+            logger.info(f"No checkpoint at {self.path}; starting a new audit")
+            return None
+
+        try:
+            header = json.loads(lines[0]) if lines else {}
+        except ValueError:
+            header = {}
+        if header.get("audit") != audit:
+            logger.warning(
+                f"Not resuming: {self.path} is the checkpoint of another audit"
+            )
+            return None
+
+        completed: Dict[str, dict] = {}
+        self._complete_bytes = len(lines[0].encode("utf-8"))
+        for line in lines[1:]:
+            try:
+                if not line.endswith("\n"):
+                    raise ValueError("incomplete line")
+                entry = json.loads(line)
+            except ValueError:
+                # The last line of an interrupted write
+                break
+            self._complete_bytes += len(line.encode("utf-8"))
+            if entry.get("failed") or "result" not in entry:
+                completed.pop(entry["repository"], None)
+            else:
+                completed[entry["repository"]] = entry["result"]
+        return completed
+
+    def _write(self, entry: dict) -> None:
+        with self._lock:
+            self._file.write(json.dumps(entry) + "\n")
+            self._file.flush()
+
+    def record(self, repository: str, results: dict, failed: bool = False) -> None:
+        """Record `results`, as stored by `AuditResult.to_dict`."""
+        self._write({"repository": repository, "result": results, "failed": failed})
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+    def finish(self) -> None:
+        """Remove the checkpoint of a completed audit."""
+        self.close()
+        os.remove(self.path)
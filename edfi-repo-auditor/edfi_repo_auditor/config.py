@@ -3,13 +3,25 @@
 # The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
 # See the LICENSE and NOTICES files in the project root for more information.
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List
 
 from configargparse import ArgParser
 
+from edfi_repo_auditor.rules import unknown_rules
+from edfi_repo_auditor.sinks import SINKS
+from edfi_repo_auditor.stage_memo import DEFAULT_MAX_AGE_HOURS
+from edfi_repo_auditor.step_summary import DEFAULT_SUMMARY_MAX_KB
+
 
 DEFAULT_LOG_LEVEL = "INFO"
+DEFAULT_POOL_SIZE = 10
+DEFAULT_WORKERS = 1
+DEFAULT_MAX_IN_FLIGHT = 8
+DEFAULT_CACHE_DIR = ".audit-cache"
+DEFAULT_CACHE_MAX_MB = 256
+DEFAULT_SCORING_FILE = "scoring.json"
+DEFAULT_FILE_NAME = "audit-result"
 
 
 @dataclass
@@ -24,6 +36,24 @@ class Configuration:
     log_level: str
     save_results: bool
     file_name: str
+    pool_size: int = DEFAULT_POOL_SIZE
+    async_mode: bool = False
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT
+    cache_dir: str = DEFAULT_CACHE_DIR
+    cache_max_mb: int = DEFAULT_CACHE_MAX_MB
+    workers: int = DEFAULT_WORKERS
+    actions_index: str = ""
+    checks: List[str] = field(default_factory=list)
+    scoring_file: str = DEFAULT_SCORING_FILE
+    scored_only: bool = False
+    state_file: str = ""
+    full: bool = False
+    max_age_hours: int = DEFAULT_MAX_AGE_HOURS
+    checkpoint_file: str = ""
+    resume: bool = False
+    outputs: List[str] = field(default_factory=list)
+    org_summary: bool = False
+    summary_max_kb: int = DEFAULT_SUMMARY_MAX_KB
 
 
 def load_configuration(args_in: List[str]) -> Configuration:
@@ -81,14 +111,207 @@ def load_configuration(args_in: List[str]) -> Configuration:
         "-f",
         "--file_name",
         required=False,
-        help="File name for results",
-        default=False,
+        help="File name for results (default: audit-result)",
+        default=DEFAULT_FILE_NAME,
         type=str,
         env_var="AUDIT_FILE_NAME",
     )
 
+    parser.add(  # type: ignore
+        "--pool_size",
+        required=False,
+        help="Maximum number of keep-alive connections to the GitHub API",
+        default=DEFAULT_POOL_SIZE,
+        type=int,
+        env_var="AUDIT_POOL_SIZE",
+    )
+
+    parser.add(  # type: ignore
+        "--async_mode",
+        action="store_true",
+        help="Audit repositories concurrently using the asyncio client",
+        env_var="AUDIT_ASYNC_MODE",
+    )
+
+    parser.add(  # type: ignore
+        "--max_in_flight",
+        required=False,
+        help="Maximum concurrent GitHub API calls in async mode",
+        default=DEFAULT_MAX_IN_FLIGHT,
+        type=int,
+        env_var="AUDIT_MAX_IN_FLIGHT",
+    )
+
+    parser.add(  # type: ignore
+        "--cache_dir",
+        required=False,
+        help="Directory for cached API responses; an empty value disables caching",
+        default=DEFAULT_CACHE_DIR,
+        type=str,
+        env_var="AUDIT_CACHE_DIR",
+    )
+
+    parser.add(  # type: ignore
+        "--cache_max_mb",
+        required=False,
+        help=(
+            "Maximum size in megabytes of the caches in the cache directory, "
+            "shared between them"
+        ),
+        default=DEFAULT_CACHE_MAX_MB,
+        type=int,
+        env_var="AUDIT_CACHE_MAX_MB",
+    )
+
+    parser.add(  # type: ignore
+        "-w",
+        "--workers",
+        required=False,
+        help="Number of repositories to audit concurrently",
+        default=DEFAULT_WORKERS,
+        type=int,
+        env_var="AUDIT_WORKERS",
+    )
+
+    parser.add(  # type: ignore
+        "--actions_index",
+        required=False,
+        help=(
+            "SQLite file indexing the actions used by each repository; "
+            "defaults to actions.sqlite in the cache directory"
+        ),
+        default="",
+        type=str,
+        env_var="AUDIT_ACTIONS_INDEX",
+    )
+
+    parser.add(  # type: ignore
+        "--checks",
+        required=False,
+        help=(
+            "Only run these checks, by name (DEPENDABOT_ENABLED) or description "
+            '("Dependabot Enabled"); PR_METRICS and OSSF_SCORE select the metrics'
+        ),
+        default=[],
+        type=str,
+        nargs="+",
+        env_var="AUDIT_CHECKS",
+    )
+
+    parser.add(  # type: ignore
+        "--scoring_file",
+        required=False,
+        help="JSON file with the scoring rules and threshold",
+        default=DEFAULT_SCORING_FILE,
+        type=str,
+        env_var="AUDIT_SCORING_FILE",
+    )
+
+    parser.add(  # type: ignore
+        "--scored_only",
+        action="store_true",
+        help="Only run the checks listed in the scoring file",
+        env_var="AUDIT_SCORED_ONLY",
+    )
+
+    parser.add(  # type: ignore
+        "--state_file",
+        required=False,
+        help=(
+            "JSON file recording each repository's results, to reuse while the "
+            "repository is unchanged; defaults to audit-state.json in the cache "
+            "directory"
+        ),
+        default="",
+        type=str,
+        env_var="AUDIT_STATE_FILE",
+    )
+
+    parser.add(  # type: ignore
+        "--full",
+        action="store_true",
+        help="Audit every repository, even those unchanged since the last audit",
+        env_var="AUDIT_FULL",
+    )
+
+    parser.add(  # type: ignore
+        "--max_age_hours",
+        required=False,
+        help=(
+            "Hours for which the results of checks that depend on the time, "
+            "such as the pull request metrics, are reused"
+        ),
+        default=DEFAULT_MAX_AGE_HOURS,
+        type=int,
+        env_var="AUDIT_MAX_AGE_HOURS",
+    )
+
+    parser.add(  # type: ignore
+        "--checkpoint_file",
+        required=False,
+        help=(
+            "JSON lines file recording each repository's results as it is "
+            "audited; defaults to checkpoint.jsonl in the cache directory"
+        ),
+        default="",
+        type=str,
+        env_var="AUDIT_CHECKPOINT_FILE",
+    )
+
+    parser.add(  # type: ignore
+        "--resume",
+        action="store_true",
+        help="Skip the repositories already audited by an interrupted audit",
+        env_var="AUDIT_RESUME",
+    )
+
+    parser.add(  # type: ignore
+        "--outputs",
+        required=False,
+        help=(
+            "Also write the results in these formats, as each repository "
+            "completes, next to the CSV report"
+        ),
+        default=[],
+        type=str,
+        nargs="+",
+        choices=list(SINKS),
+        env_var="AUDIT_OUTPUTS",
+    )
+
+    parser.add(  # type: ignore
+        "--org_summary",
+        action="store_true",
+        help=(
+            "Write one matrix of every repository's checks to the job summary, "
+            "and the full results to a details file next to the CSV report"
+        ),
+        env_var="AUDIT_ORG_SUMMARY",
+    )
+
+    parser.add(  # type: ignore
+        "--summary_max_kb",
+        required=False,
+        help="Maximum size of the organization job summary in kilobytes",
+        default=DEFAULT_SUMMARY_MAX_KB,
+        type=int,
+        env_var="AUDIT_SUMMARY_MAX_KB",
+    )
+
     parsed = parser.parse_args(args_in)
 
+    if parsed.workers < 1:
+        parser.error("--workers must be at least 1")
+    if not parsed.file_name:
+        parser.error("--file_name must not be empty")
+    if parsed.max_age_hours < 0:
+        parser.error("--max_age_hours must not be negative")
+    if parsed.summary_max_kb < 1:
+        parser.error("--summary_max_kb must be at least 1")
+    unknown = unknown_rules(parsed.checks)
+    if unknown:
+        parser.error(f"Unknown checks: {', '.join(unknown)}")
+
     return Configuration(
         parsed.organization,
         parsed.access_token,
@@ -96,4 +319,22 @@ def load_configuration(args_in: List[str]) -> Configuration:
         parsed.log_level,
         parsed.save_results,
         parsed.file_name,
+        parsed.pool_size,
+        parsed.async_mode,
+        parsed.max_in_flight,
+        parsed.cache_dir,
+        parsed.cache_max_mb,
+        parsed.workers,
+        parsed.actions_index,
+        parsed.checks,
+        parsed.scoring_file,
+        parsed.scored_only,
+        parsed.state_file,
+        parsed.full,
+        parsed.max_age_hours,
+        parsed.checkpoint_file,
+        parsed.resume,
+        parsed.outputs,
+        parsed.org_summary,
+        parsed.summary_max_kb,
     )
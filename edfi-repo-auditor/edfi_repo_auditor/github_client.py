@@ -4,30 +4,45 @@
 # See the LICENSE and NOTICES files in the project root for more information.
 
 import logging
-from typing import List, Optional
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
 from json import dumps
 
 import base64
+import hashlib
 import pandas as pd
 import requests
 from requests import Response
+from requests.adapters import HTTPAdapter
 
-from edfi_repo_auditor.log_helper import http_error
+from edfi_repo_auditor.disk_cache import DiskCache
+from edfi_repo_auditor.http_cache import HttpCache
+from edfi_repo_auditor.log_helper import HttpError, http_error
+from edfi_repo_auditor.rate_limit import GRAPHQL, REST, RateLimitScheduler
+from edfi_repo_auditor.retry import Retrier, is_retryable
 
 API_URL = "https://api.github.com"
 GRAPHQL_ENDPOINT = f"{API_URL}/graphql"
 
 REPO_TOKEN = "[REPOSITORY]"
 ORG_TOKEN = "[OWNER]"
+INDEX_TOKEN = "[INDEX]"
+REVISION_TOKEN = "[REVISION]"
+ALIASES_TOKEN = "[ALIASES]"
+OID_TOKEN = "[OID]"
 
-# Note that this doesn't handle paging and thus will not be sufficient if there
-# are more than 100 repositories.
 REPOSITORIES_TEMPLATE = """
-{
+query($cursor: String) {
   organization(login: "[OWNER]") {
     id
-    repositories(first: 100) {
+    repositories(first: 100, after: $cursor) {
       totalCount
+      pageInfo {
+        hasNextPage
+        endCursor
+      }
       nodes {
         name
       }
@@ -36,87 +51,438 @@ REPOSITORIES_TEMPLATE = """
 }
 """.strip()
 
-# Note that this doesn't handle paging and thus will not be sufficient if there
-# are more than 100 alerts.
-REPOSITORY_INFORMATION_TEMPLATE = """
-{
-  repository(name: "[REPOSITORY]", owner: "[OWNER]") {
-    vulnerabilityAlerts(first: 100, states: [OPEN]) {
-      nodes {
-        createdAt
-        securityVulnerability {
-          package {
-            name
-          }
-          advisory {
-            severity
+# GraphQL selection of each field of a repository that checks can depend on,
+# see `rules.RULES`.
+REPOSITORY_INFORMATION_FIELDS: Dict[str, str] = {
+    # Note that this doesn't handle paging and thus will not be sufficient if
+    # there are more than 100 alerts.
+    "vulnerabilityAlerts": """
+  vulnerabilityAlerts(first: 100, states: [OPEN]) {
+    nodes {
+      createdAt
+      securityVulnerability {
+        package {
+          name
+        }
+        advisory {
+          severity
+        }
+      }
+    }
+  }""",
+    "rulesets": """
+  rulesets(first: 10) {
+    nodes {
+      bypassActors(first: 10) {
+        edges {
+          node {
+            organizationAdmin
+            actor {
+              __typename
+            }
           }
         }
       }
+      conditions {
+        refName {
+          include
+        }
+      }
+      enforcement
+      name
+      rules(first: 20) {
+        nodes {
+          type
+        }
+      }
+      target
+    }
+  }""",
+    "defaultBranchRef": """
+  defaultBranchRef {
+    target {
+      oid
     }
-    rulesets(first: 10) {
+  }""",
+    "hasWikiEnabled": "\n  hasWikiEnabled",
+    "hasIssuesEnabled": "\n  hasIssuesEnabled",
+    "hasProjectsEnabled": "\n  hasProjectsEnabled",
+    "deleteBranchOnMerge": "\n  deleteBranchOnMerge",
+    "squashMergeAllowed": "\n  squashMergeAllowed",
+    "licenseInfo": """
+  licenseInfo {
+    key
+  }""",
+    "pushedAt": "\n  pushedAt",
+    "updatedAt": "\n  updatedAt",
+    "githubTree": """
+  githubTree: object(expression: "HEAD:.github") {
+    oid
+  }""",
+    "rootTree": """
+  rootTree: object(expression: "HEAD:") {
+    oid
+  }""",
+    "latestMergedPullRequest": """
+  latestMergedPullRequest: pullRequests(
+    states: MERGED, first: 1, orderBy: {field: UPDATED_AT, direction: DESC}
+  ) {
+    nodes {
+      number
+      mergedAt
+    }
+  }""",
+}
+
+# Fetched when the caller does not choose the fields: those the checks read
+DEFAULT_INFORMATION_FIELDS = [
+    "vulnerabilityAlerts",
+    "defaultBranchRef",
+    "hasWikiEnabled",
+    "hasIssuesEnabled",
+    "hasProjectsEnabled",
+    "deleteBranchOnMerge",
+    "squashMergeAllowed",
+    "licenseInfo",
+]
+
+
+def information_fragment(fields: Optional[List[str]] = None) -> str:
+    """
+    The `RepositoryInformation` fragment selecting the repository name and
+    `fields`, in a fixed order.
+    """
+    wanted = set(DEFAULT_INFORMATION_FIELDS if fields is None else fields)
+    unknown = wanted - set(REPOSITORY_INFORMATION_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown repository fields: {', '.join(sorted(unknown))}")
+
+    return (
+        "fragment RepositoryInformation on Repository {\n  name"
+        + "".join(
+            selection
+            for field, selection in REPOSITORY_INFORMATION_FIELDS.items()
+            if field in wanted
+        )
+        + "\n}"
+    )
+
+
+REPOSITORY_INFORMATION_QUERY = """
+{
+  repository(name: "[REPOSITORY]", owner: "[OWNER]") {
+    ...RepositoryInformation
+  }
+}
+""".strip()
+
+ORGANIZATION_REPOSITORIES_INFORMATION_QUERY = """
+query($cursor: String) {
+  organization(login: "[OWNER]") {
+    repositories(first: 100, after: $cursor) {
+      pageInfo {
+        hasNextPage
+        endCursor
+      }
       nodes {
-        bypassActors(first: 10) {
-          edges {
-            node {
-              organizationAdmin
-              actor {
-                __typename
-              }
+        ...RepositoryInformation
+      }
+    }
+  }
+}
+""".strip()
+
+# Used with one aliased `repository` entry per requested repository.
+REPOSITORY_ALIAS_TEMPLATE = """
+  repo_[INDEX]: repository(name: "[REPOSITORY]", owner: "[OWNER]") {
+    ...RepositoryInformation
+  }
+""".strip("\n")
+
+# The workflow files of one repository, with their text, for use as an aliased
+# entry in a multi-repository query. `text` is null for binary files.
+WORKFLOW_FILES_ALIAS_TEMPLATE = """
+  repo_[INDEX]: repository(name: "[REPOSITORY]", owner: "[OWNER]") {
+    workflows: object(expression: "HEAD:.github/workflows") {
+      ... on Tree {
+        entries {
+          name
+          path
+          object {
+            ... on Blob {
+              oid
+              text
             }
           }
         }
-        conditions {
-          refName {
-            include
-          }
+      }
+    }
+  }
+""".strip("\n")
+
+# Directories, besides the root, that are listed to answer file-existence
+# checks; GitHub also reads community health files from `.github` and `docs`.
+LISTED_DIRECTORIES = [".github", "docs"]
+
+# Files in the root and in each listed directory, as of one revision.
+REPOSITORY_FILES_TEMPLATE = """
+{
+  repository(name: "[REPOSITORY]", owner: "[OWNER]") {
+    root: object(expression: "[REVISION]:") {
+      ...TreeEntries
+    }
+    [ALIASES]
+  }
+}
+fragment TreeEntries on GitObject {
+  ... on Tree {
+    entries {
+      name
+      type
+    }
+  }
+}
+""".strip()
+
+# The workflow files of one repository without their text, which is fetched
+# separately by object ID so that only the files needed are downloaded.
+WORKFLOW_TREE_TEMPLATE = """
+{
+  repository(name: "[REPOSITORY]", owner: "[OWNER]") {
+    workflows: object(expression: "HEAD:.github/workflows") {
+      ... on Tree {
+        entries {
+          name
+          path
+          oid
+          type
         }
-        enforcement
-        name
-        rules(first: 20) {
+      }
+    }
+  }
+}
+""".strip()
+
+# The text of several blobs in one repository, with one aliased `object` entry
+# per blob.
+BLOBS_TEMPLATE = """
+{
+  repository(name: "[REPOSITORY]", owner: "[OWNER]") {
+    [ALIASES]
+  }
+}
+""".strip()
+
+BLOB_ALIAS_TEMPLATE = 'blob_[INDEX]: object(oid: "[OID]") { ... on Blob { text } }'
+
+# GitHub only runs workflow files with these extensions
+WORKFLOW_FILE_EXTENSIONS = (".yml", ".yaml")
+
+# Merged pull requests with their reviews, most recently updated first so that
+# paging can stop once it passes the time window of interest.
+MERGED_PULL_REQUESTS_TEMPLATE = """
+query($cursor: String, $pageSize: Int!, $reviewCount: Int!) {
+  repository(name: "[REPOSITORY]", owner: "[OWNER]") {
+    pullRequests(
+      states: [MERGED]
+      first: $pageSize
+      after: $cursor
+      orderBy: {field: UPDATED_AT, direction: DESC}
+    ) {
+      totalCount
+      pageInfo {
+        hasNextPage
+        endCursor
+      }
+      nodes {
+        number
+        createdAt
+        closedAt
+        mergedAt
+        updatedAt
+        author {
+          login
+        }
+        additions
+        deletions
+        changedFiles
+        reviews(first: $reviewCount) {
           nodes {
-            type
+            author {
+              login
+            }
+            state
+            submittedAt
           }
         }
-        target
       }
     }
-    hasWikiEnabled
-    hasIssuesEnabled
-    hasProjectsEnabled
-    deleteBranchOnMerge
-    squashMergeAllowed
-    licenseInfo {
-      key
-    }
   }
 }
 """.strip()
 
+# Number of repositories requested per aliased query when an explicit list of
+# repositories is audited.
+REPOSITORY_BATCH_SIZE = 25
+
+# Connection pool defaults. All calls go to a single host (api.github.com), so
+# the number of host pools can stay small while the per-host pool size bounds
+# how many connections may be kept alive concurrently.
+DEFAULT_POOL_CONNECTIONS = 4
+DEFAULT_POOL_SIZE = 10
+
 logger: logging.Logger = logging.getLogger(__name__)
 
 
+def _last_page(headers: Mapping[str, str]) -> Optional[int]:
+    """Read the number of the last page from a REST `Link` header."""
+    for link in requests.utils.parse_header_links(headers.get("Link", "")):
+        if link.get("rel") == "last":
+            pages = parse_qs(urlparse(link["url"]).query).get("page")
+            if pages:
+                return int(pages[0])
+    return None
+
+
 class GitHubClient:
-    def __init__(self, access_token: str):
+    def __init__(
+        self,
+        access_token: str,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_block: bool = False,
+        cache: Optional[HttpCache] = None,
+        scheduler: Optional[RateLimitScheduler] = None,
+        retrier: Optional[Retrier] = None,
+        tree_cache: Optional[DiskCache] = None,
+    ):
+        """
+        Create a client that shares one pooled, keep-alive HTTP session across
+        every call.
+
+        Args:
+            access_token: GitHub personal access token
+            pool_size: Maximum number of connections kept alive per host
+            pool_connections: Number of per-host connection pools to cache
+            pool_block: When True, never open more than `pool_size` connections
+                to a host; callers wait for a free connection instead
+            cache: Optional conditional-request cache for REST GET calls
+            scheduler: Paces calls against the REST and GraphQL rate limits;
+                a default scheduler is created when not provided
+            retrier: Retry policy for transient failures; a default retrier
+                is created when not provided
+            tree_cache: Optional store for file listings of specific commits,
+                which never change once fetched
+        """
         if len(access_token.strip()) == 0:
             raise ValueError("access_token cannot be blank")
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
         self.access_token = access_token
 
+        self._adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_size,
+            pool_block=pool_block,
+        )
+        self.session = requests.Session()
+        self.session.mount("https://", self._adapter)
+        self.session.headers.update(
+            {
+                "Authorization": f"bearer {self.access_token}",
+                "Content-Type": "application/json",
+                "Accept-Encoding": "gzip, deflate",
+                "Connection": "keep-alive",
+            }
+        )
+
+        self.cache = cache
+        self.scheduler = scheduler or RateLimitScheduler()
+        self.retrier = retrier or Retrier()
+        self.tree_cache = tree_cache
+        # Cached responses are only valid for the token that fetched them, as
+        # another token may not be able to see the same content.
+        self._cache_namespace = hashlib.sha256(access_token.encode("utf-8")).hexdigest()
+
+        self._stats_lock = threading.Lock()
+        self._request_count = 0
+        self.pages_skipped = 0
+
+    def __enter__(self) -> "GitHubClient":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.session.close()
+
+    def connection_stats(self) -> Dict[str, int]:
+        """
+        Report how many HTTP requests were sent and how many new connections
+        (TCP + TLS handshakes) were needed to send them.
+
+        Returns:
+            Dictionary with requests, connections and reused counts
+        """
+        connections = 0
+        pools = self._adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is not None:
+                connections += pool.num_connections
+
+        with self._stats_lock:
+            requests_sent = self._request_count
+
+        return {
+            "requests": requests_sent,
+            "connections": connections,
+            "reused": max(requests_sent - connections, 0),
+        }
+
     def _execute_api_call(
         self, description: str, method: str, url: str, payload: str = ""
     ) -> dict:
-        headers = {
-            "Authorization": f"bearer {self.access_token}",
-            "Content-Type": "application/json",
-        }
+        body, _ = self._execute_api_call_with_headers(description, method, url, payload)
+        return body
 
+    def _execute_api_call_with_headers(
+        self, description: str, method: str, url: str, payload: str = ""
+    ) -> Tuple[Any, Mapping[str, str]]:
         logger.debug(f"{description}")
 
-        response: Response = requests.request(
-            method, url, headers=headers, data=payload
+        cache_key = f"{self._cache_namespace} {method} {url}"
+        cached = (
+            self.cache.lookup(cache_key)
+            if self.cache is not None and method == "GET"
+            else None
         )
 
-        if response.status_code == requests.codes.ok:
+        resource = GRAPHQL if url == GRAPHQL_ENDPOINT else REST
+
+        def send() -> Response:
+            self.scheduler.acquire(resource)
+            response = self.session.request(
+                method,
+                url,
+                data=payload,
+                headers=cached.validators() if cached is not None else None,
+            )
+            with self._stats_lock:
+                self._request_count += 1
+            self.scheduler.update(resource, response.headers)
+            return response
+
+        response: Response = self.retrier.call(resource, description, send)
+
+        if self.cache is not None and method == "GET":
+            self.cache.record(response.status_code == requests.codes.not_modified)
+
+        if response.status_code == requests.codes.not_modified and cached is not None:
+            logger.debug(f"{description}: not modified, using cached response")
+            return cached.body, response.headers
+        elif response.status_code == requests.codes.ok:
             body = response.json()
 
             # GitHub API will return 200 with error messages if the query is malformed.
@@ -124,16 +490,26 @@ class GitHubClient:
                 msg = f"Query for {description}."
                 raise http_error(msg, response)
 
-            return body
+            if self.cache is not None and method == "GET":
+                self.cache.store(cache_key, response, body)
+
+            return body, response.headers
         elif response.status_code == requests.codes.no_content:
             # There's a failure when attempting to convert a 204 response to JSON
-            return {"status_code": response.status_code}
+            return {"status_code": response.status_code}, response.headers
         else:
             msg = f"Query for {description}."
-            raise http_error(msg, response)
+            raise http_error(msg, response, retryable=is_retryable(response))
 
-    def _execute_graphql(self, description: str, query: str) -> dict:
-        payload = dumps({"query": query, "variables": {}})
+    def _record_pages_skipped(self, description: str, skipped: int) -> None:
+        logger.debug(f"{description}: stopped paging, skipped {skipped} pages")
+        with self._stats_lock:
+            self.pages_skipped += skipped
+
+    def _execute_graphql(
+        self, description: str, query: str, variables: Optional[dict] = None
+    ) -> dict:
+        payload = dumps({"query": query, "variables": variables or {}})
 
         body = self._execute_api_call(
             f"Querying for {description}", "POST", f"{GRAPHQL_ENDPOINT}", payload
@@ -141,22 +517,272 @@ class GitHubClient:
 
         return body
 
+    def _get_organization_repositories(
+        self, description: str, owner: str, template: str
+    ) -> List[dict]:
+        query = template.replace(ORG_TOKEN, owner)
+        nodes: List[dict] = []
+        cursor = None
+
+        while True:
+            body = self._execute_graphql(description, query, {"cursor": cursor})
+            repositories = body["data"]["organization"]["repositories"]
+            nodes.extend(repositories["nodes"])
+
+            if not repositories["pageInfo"]["hasNextPage"]:
+                break
+            cursor = repositories["pageInfo"]["endCursor"]
+
+        return nodes
+
     def get_repositories(self, owner: str) -> List[str]:
         logger.info(f"Getting all repositories for organization {owner}")
         if len(owner.strip()) == 0:
             raise ValueError("owner cannot be blank")
 
-        query = REPOSITORIES_TEMPLATE.replace(ORG_TOKEN, owner)
-        body = self._execute_graphql(f"repositories for {owner}", query)
+        nodes = self._get_organization_repositories(
+            f"repositories for {owner}", owner, REPOSITORIES_TEMPLATE
+        )
+
+        df = pd.DataFrame(nodes, columns=["name"])
+        return df["name"].to_list()
 
-        total_repos = body["data"]["organization"]["repositories"]["totalCount"]
-        if total_repos > 100:
-            logger.warning(
-                f"There are over 100 repos in {owner}. Update the query to handle pagination"
+    def get_repositories_information(
+        self,
+        owner: str,
+        repositories: Optional[List[str]] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Dict[str, dict]:
+        """
+        Get the settings and open vulnerability alerts for many repositories
+        with as few queries as possible.
+
+        Args:
+            owner: Organization name
+            repositories: Repositories to fetch. When empty, every repository
+                in the organization is fetched by paging through
+                `organization.repositories`; otherwise the repositories are
+                batched into aliased multi-repository queries.
+            fields: Fields of `REPOSITORY_INFORMATION_FIELDS` to select;
+                `DEFAULT_INFORMATION_FIELDS` when not given
+
+        Returns:
+            Repository information keyed by repository name, in the same
+            shape as `get_repository_information`
+        """
+        if len(owner.strip()) == 0:
+            raise ValueError("owner cannot be blank")
+
+        fragment = information_fragment(fields)
+        if not repositories:
+            logger.info(f"Getting information for all repositories in {owner}")
+            nodes = self._get_organization_repositories(
+                f"repository information for {owner}",
+                owner,
+                ORGANIZATION_REPOSITORIES_INFORMATION_QUERY + "\n" + fragment,
             )
+            return {node["name"]: node for node in nodes}
 
-        df = pd.DataFrame(body["data"]["organization"]["repositories"]["nodes"])
-        return df["name"].to_list()
+        return self._execute_aliased_queries(
+            "repository information",
+            owner,
+            repositories,
+            REPOSITORY_ALIAS_TEMPLATE,
+            fragment,
+        )
+
+    def _execute_aliased_queries(
+        self,
+        description: str,
+        owner: str,
+        repositories: List[str],
+        alias_template: str,
+        fragment: str = "",
+    ) -> Dict[str, Any]:
+        """
+        Query many repositories at once, `REPOSITORY_BATCH_SIZE` per request,
+        with one aliased entry per repository built from `alias_template`.
+
+        Returns:
+            Each repository's entry from the response, keyed by repository name
+        """
+        results: Dict[str, Any] = {}
+        for start in range(0, len(repositories), REPOSITORY_BATCH_SIZE):
+            batch = repositories[start : start + REPOSITORY_BATCH_SIZE]
+            aliases = "\n".join(
+                alias_template.replace(INDEX_TOKEN, str(index))
+                .replace(ORG_TOKEN, owner)
+                .replace(REPO_TOKEN, repository)
+                for index, repository in enumerate(batch)
+            )
+            query = "{\n" + aliases + "\n}\n" + fragment
+
+            body = self._execute_graphql(
+                f"{description} for {len(batch)} repositories in {owner}", query
+            )
+            for index, repository in enumerate(batch):
+                results[repository] = body["data"][f"repo_{index}"]
+
+        return results
+
+    def get_workflow_files(
+        self, owner: str, repositories: List[str]
+    ) -> Dict[str, Dict[str, str]]:
+        """
+        Get the text of every workflow file in `.github/workflows` on the
+        default branch of each repository, in as few queries as possible.
+
+        Args:
+            owner: Organization name
+            repositories: Repositories to fetch
+
+        Returns:
+            For each repository, workflow text keyed by file path. Repositories
+            without workflows map to an empty dictionary.
+        """
+        if len(owner.strip()) == 0:
+            raise ValueError("owner cannot be blank")
+        if any(len(repository.strip()) == 0 for repository in repositories):
+            raise ValueError("repository cannot be blank")
+
+        entries = self._execute_aliased_queries(
+            "workflow files", owner, repositories, WORKFLOW_FILES_ALIAS_TEMPLATE
+        )
+
+        workflow_files: Dict[str, Dict[str, str]] = {}
+        for repository, entry in entries.items():
+            tree = (entry or {}).get("workflows") or {}
+            workflow_files[repository] = {
+                file["path"]: file["object"]["text"]
+                for file in sorted(tree.get("entries", []), key=lambda f: f["path"])
+                if file["name"].lower().endswith(WORKFLOW_FILE_EXTENSIONS)
+                and (file.get("object") or {}).get("text") is not None
+            }
+
+        return workflow_files
+
+    def get_workflow_tree(self, owner: str, repository: str) -> List[dict]:
+        """
+        List the workflow files in `.github/workflows` on the default branch,
+        without their text; see `get_blob_texts`.
+
+        Returns:
+            Dictionaries with the `name`, `path` and blob `oid` of each file
+        """
+        if len(owner.strip()) == 0:
+            raise ValueError("owner cannot be blank")
+        if len(repository.strip()) == 0:
+            raise ValueError("repository cannot be blank")
+
+        query = WORKFLOW_TREE_TEMPLATE.replace(ORG_TOKEN, owner).replace(
+            REPO_TOKEN, repository
+        )
+
+        body = self._execute_graphql(f"workflow files in {owner}/{repository}", query)
+        tree = (body["data"]["repository"] or {}).get("workflows") or {}
+
+        return [
+            {"name": entry["name"], "path": entry["path"], "oid": entry["oid"]}
+            for entry in sorted(tree.get("entries", []), key=lambda e: e["path"])
+            if entry["type"] == "blob"
+            and entry["name"].lower().endswith(WORKFLOW_FILE_EXTENSIONS)
+        ]
+
+    def get_blob_texts(
+        self, owner: str, repository: str, oids: List[str]
+    ) -> Dict[str, Optional[str]]:
+        """
+        Get the text of several blobs in one query.
+
+        Returns:
+            Text keyed by object ID; None for binary files
+        """
+        if len(owner.strip()) == 0:
+            raise ValueError("owner cannot be blank")
+        if len(repository.strip()) == 0:
+            raise ValueError("repository cannot be blank")
+        if not oids:
+            return {}
+
+        aliases = "\n    ".join(
+            BLOB_ALIAS_TEMPLATE.replace(INDEX_TOKEN, str(index)).replace(OID_TOKEN, oid)
+            for index, oid in enumerate(oids)
+        )
+        query = (
+            BLOBS_TEMPLATE.replace(ALIASES_TOKEN, aliases)
+            .replace(ORG_TOKEN, owner)
+            .replace(REPO_TOKEN, repository)
+        )
+
+        body = self._execute_graphql(
+            f"{len(oids)} files in {owner}/{repository}", query
+        )
+        blobs = body["data"]["repository"]
+
+        return {
+            oid: (blobs.get(f"blob_{index}") or {}).get("text")
+            for index, oid in enumerate(oids)
+        }
+
+    def get_repository_files(
+        self, owner: str, repository: str, revision: str = "HEAD"
+    ) -> List[str]:
+        """
+        List the files in the root of a repository and in each of
+        `LISTED_DIRECTORIES` with a single query.
+
+        Args:
+            owner: Organization name
+            repository: Repository name
+            revision: Commit to list. Listings of a commit SHA are kept in
+                `tree_cache`, as they cannot change.
+
+        Returns:
+            Sorted file paths relative to the repository root
+        """
+        if len(owner.strip()) == 0:
+            raise ValueError("owner cannot be blank")
+        if len(repository.strip()) == 0:
+            raise ValueError("repository cannot be blank")
+
+        # A branch name such as HEAD moves, so only commits are cached
+        tree_cache = self.tree_cache if revision != "HEAD" else None
+        cache_key = f"{self._cache_namespace}:{owner}/{repository}@{revision}"
+        if tree_cache is not None:
+            cached = tree_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        directories = "\n    ".join(
+            f'dir_{index}: object(expression: "{REVISION_TOKEN}:{directory}") '
+            "{ ...TreeEntries }"
+            for index, directory in enumerate(LISTED_DIRECTORIES)
+        )
+        query = (
+            REPOSITORY_FILES_TEMPLATE.replace(ALIASES_TOKEN, directories)
+            .replace(ORG_TOKEN, owner)
+            .replace(REPO_TOKEN, repository)
+            .replace(REVISION_TOKEN, revision)
+        )
+
+        body = self._execute_graphql(f"files in {owner}/{repository}", query)
+        trees = body["data"]["repository"] or {}
+
+        prefixes = {"root": ""}
+        prefixes.update(
+            (f"dir_{index}", f"{directory}/")
+            for index, directory in enumerate(LISTED_DIRECTORIES)
+        )
+        files = sorted(
+            prefix + entry["name"]
+            for alias, prefix in prefixes.items()
+            for entry in (trees.get(alias) or {}).get("entries", [])
+            if entry["type"] == "blob"
+        )
+
+        if tree_cache is not None:
+            tree_cache.set(cache_key, files)
+        return files
 
     def get_actions(self, owner: str, repository: str) -> dict:
         if len(owner.strip()) == 0:
@@ -171,14 +797,20 @@ class GitHubClient:
         )
         return actions
 
-    def get_repository_information(self, owner: str, repository: str) -> dict:
+    def get_repository_information(
+        self, owner: str, repository: str, fields: Optional[List[str]] = None
+    ) -> dict:
         if len(owner.strip()) == 0:
             raise ValueError("owner cannot be blank")
         if len(repository.strip()) == 0:
             raise ValueError("repository cannot be blank")
 
-        query = REPOSITORY_INFORMATION_TEMPLATE.replace(ORG_TOKEN, owner).replace(
-            REPO_TOKEN, repository
+        query = (
+            REPOSITORY_INFORMATION_QUERY.replace(ORG_TOKEN, owner).replace(
+                REPO_TOKEN, repository
+            )
+            + "\n"
+            + information_fragment(fields)
         )
 
         body = self._execute_graphql(
@@ -201,12 +833,22 @@ class GitHubClient:
                 f"{API_URL}/repos/{owner}/{repository}/vulnerability-alerts",
             )
             has_dependabot = dependabot["status_code"] == requests.codes.no_content
-        except RuntimeError:
+        except HttpError as error:
+            # A transient failure says nothing about the setting, so only a
+            # definitive answer from GitHub is treated as "not enabled".
+            if error.retryable:
+                raise
             has_dependabot = False
 
         return has_dependabot
 
-    def get_file_content(self, owner: str, repository: str, path: str) -> Optional[str]:
+    def get_file_content(
+        self, owner: str, repository: str, path: str, ref: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Get the text of a file on the default branch, or at `ref` when given.
+        Returns None when the file does not exist.
+        """
         if len(owner.strip()) == 0:
             raise ValueError("owner cannot be blank")
         if len(repository.strip()) == 0:
@@ -219,10 +861,14 @@ class GitHubClient:
             file_result = self._execute_api_call(
                 f"Getting file {path} for {owner}/{repository}",
                 "GET",
-                f"{API_URL}/repos/{owner}/{repository}/contents/{path}",
+                f"{API_URL}/repos/{owner}/{repository}/contents/{path}"
+                + (f"?ref={ref}" if ref else ""),
             )
-        except RuntimeError:
-            pass
+        except HttpError as error:
+            # Missing or inaccessible files read as "not found", but a
+            # transient failure must not be mistaken for a missing file.
+            if error.retryable:
+                raise
 
         return (
             base64.b64decode(file_result["content"]).decode("UTF-8")
@@ -231,20 +877,27 @@ class GitHubClient:
         )
 
     def get_pull_requests(
-        self, owner: str, repository: str, state: str = "closed", per_page: int = 100
+        self,
+        owner: str,
+        repository: str,
+        state: str = "closed",
+        per_page: int = 100,
+        since: Optional[datetime] = None,
     ) -> List[dict]:
         """
-        Get pull requests with full pagination.
+        Get pull requests, most recently updated first, with full pagination.
 
         Args:
             owner: Repository owner
             repository: Repository name
             state: PR state filter ('open', 'closed', or 'all')
             per_page: Results per page (max 100)
+            since: Stop paging once pull requests were last updated before
+                this time
 
         Returns:
             List of PR records with number, created_at, closed_at, merged_at,
-            user, additions, deletions, changed_files
+            updated_at, user, additions, deletions, changed_files
         """
         if len(owner.strip()) == 0:
             raise ValueError("owner cannot be blank")
@@ -258,24 +911,34 @@ class GitHubClient:
             logger.info(f"Getting pull requests for {owner}/{repository}, page {page}")
             url = (
                 f"{API_URL}/repos/{owner}/{repository}/pulls"
-                f"?state={state}&per_page={per_page}&page={page}"
+                f"?state={state}&sort=updated&direction=desc"
+                f"&per_page={per_page}&page={page}"
             )
 
-            prs = self._execute_api_call(
-                f"Getting PRs for {owner}/{repository}",
-                "GET",
-                url,
-            )
+            description = f"Getting PRs for {owner}/{repository}"
+            prs, headers = self._execute_api_call_with_headers(description, "GET", url)
 
             if not prs:
                 break
 
+            passed_window = False
             for pr in prs:
+                updated_at = pr.get("updated_at")
+                if (
+                    since is not None
+                    and updated_at is not None
+                    and datetime.fromisoformat(updated_at.replace("Z", "+00:00"))
+                    < since
+                ):
+                    passed_window = True
+                    break
+
                 pr_record = {
                     "number": pr["number"],
                     "created_at": pr.get("created_at"),
                     "closed_at": pr.get("closed_at"),
                     "merged_at": pr.get("merged_at"),
+                    "updated_at": updated_at,
                     "user": pr.get("user", {}).get("login"),
                     "additions": pr.get("additions"),
                     "deletions": pr.get("deletions"),
@@ -283,6 +946,12 @@ class GitHubClient:
                 }
                 all_prs.append(pr_record)
 
+            if passed_window:
+                last_page = _last_page(headers)
+                if last_page is not None:
+                    self._record_pages_skipped(description, last_page - page)
+                break
+
             if len(prs) < per_page:
                 break
 
@@ -290,6 +959,99 @@ class GitHubClient:
 
         return all_prs
 
+    def get_merged_pull_requests(
+        self,
+        owner: str,
+        repository: str,
+        since: Optional[datetime] = None,
+        page_size: int = 50,
+        reviews_per_pr: int = 50,
+    ) -> List[dict]:
+        """
+        Get merged pull requests together with their reviews, using one
+        GraphQL query per page instead of a REST call per pull request.
+
+        Args:
+            owner: Repository owner
+            repository: Repository name
+            since: Stop paging once pull requests were last updated before
+                this time; a PR merged after `since` is always updated after it
+            page_size: Pull requests per page (max 100)
+            reviews_per_pr: Maximum reviews returned for each pull request
+
+        Returns:
+            List of PR records with number, created_at, closed_at, merged_at,
+            updated_at, user, additions, deletions, changed_files, and a
+            `reviews` list in the shape of `get_pull_request_reviews`
+        """
+        if len(owner.strip()) == 0:
+            raise ValueError("owner cannot be blank")
+        if len(repository.strip()) == 0:
+            raise ValueError("repository cannot be blank")
+
+        query = MERGED_PULL_REQUESTS_TEMPLATE.replace(ORG_TOKEN, owner).replace(
+            REPO_TOKEN, repository
+        )
+        all_prs: List[dict] = []
+        cursor = None
+        page = 1
+
+        while True:
+            body = self._execute_graphql(
+                f"merged pull requests for {owner}/{repository}",
+                query,
+                {
+                    "cursor": cursor,
+                    "pageSize": page_size,
+                    "reviewCount": reviews_per_pr,
+                },
+            )
+            pull_requests = body["data"]["repository"]["pullRequests"]
+
+            passed_window = False
+            for pr in pull_requests["nodes"]:
+                updated_at = datetime.fromisoformat(
+                    pr["updatedAt"].replace("Z", "+00:00")
+                )
+                if since is not None and updated_at < since:
+                    passed_window = True
+                    break
+
+                all_prs.append(
+                    {
+                        "number": pr["number"],
+                        "created_at": pr.get("createdAt"),
+                        "closed_at": pr.get("closedAt"),
+                        "merged_at": pr.get("mergedAt"),
+                        "updated_at": pr["updatedAt"],
+                        "user": (pr.get("author") or {}).get("login"),
+                        "additions": pr.get("additions"),
+                        "deletions": pr.get("deletions"),
+                        "changed_files": pr.get("changedFiles"),
+                        "reviews": [
+                            {
+                                "user": (review.get("author") or {}).get("login"),
+                                "state": review.get("state"),
+                                "submitted_at": review.get("submittedAt"),
+                            }
+                            for review in pr["reviews"]["nodes"]
+                        ],
+                    }
+                )
+
+            if passed_window:
+                pages = -(-pull_requests["totalCount"] // page_size)
+                self._record_pages_skipped(
+                    f"Getting merged PRs for {owner}/{repository}", pages - page
+                )
+                break
+            if not pull_requests["pageInfo"]["hasNextPage"]:
+                break
+            cursor = pull_requests["pageInfo"]["endCursor"]
+            page += 1
+
+        return all_prs
+
     def get_pull_request_detail(
         self, owner: str, repository: str, pr_number: int
     ) -> dict:
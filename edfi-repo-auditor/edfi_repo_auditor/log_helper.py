@@ -6,10 +6,22 @@
 from requests import Response
 
 
-def http_error(process: str, response: Response) -> RuntimeError:
+class HttpError(RuntimeError):
+    """
+    A failed GitHub API call. `retryable` is True for transient failures that
+    were still failing after every retry allowed by the retry policy.
+    """
+
+    def __init__(self, log: dict, retryable: bool = False):
+        super().__init__(log)
+        self.status_code = log["status_code"]
+        self.retryable = retryable
+
+
+def http_error(process: str, response: Response, retryable: bool = False) -> HttpError:
     log = {
         "process": process,
         "error_message": response.text,
         "status_code": response.status_code,
     }
-    return RuntimeError(log)
+    return HttpError(log, retryable)
@@ -13,6 +13,8 @@ import requests
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+OSSF_SCORE_KEY = "OSSF Score"
+
 _SCORECARD_URL_TEMPLATE = (
     "https://img.shields.io/ossf-scorecard/github.com/{org}/{repo}?"
     "label=openssf+scorecard&style=flat"
@@ -35,23 +37,35 @@ def _extract_score(svg: str) -> Optional[float]:
         return None
 
 
+def fetch_ossf_score(organization: str, repository: str) -> Optional[float]:
+    """
+    Fetch the OpenSSF Scorecard value for the provided repository, or None
+    when the repository has no score.
+
+    Raises:
+        requests.RequestException: the score could not be fetched
+    """
+
+    url = _SCORECARD_URL_TEMPLATE.format(org=organization, repo=repository)
+    response = requests.get(url, timeout=10, headers={"Accept": "image/svg+xml"})
+    response.raise_for_status()
+    score = _extract_score(response.text)
+    if score is None:
+        logger.warning(
+            "OpenSSF score missing from response for %s/%s",
+            organization,
+            repository,
+        )
+    return score
+
+
 def get_ossf_score(organization: str, repository: str) -> Dict[str, Optional[float]]:
     """Fetch the OpenSSF Scorecard value for the provided repository."""
 
-    url = _SCORECARD_URL_TEMPLATE.format(org=organization, repo=repository)
     try:
-        response = requests.get(url, timeout=10, headers={"Accept": "image/svg+xml"})
-        response.raise_for_status()
-        score = _extract_score(response.text)
-        if score is None:
-            logger.warning(
-                "OpenSSF score missing from response for %s/%s",
-                organization,
-                repository,
-            )
-        return {"OSSF Score": score}
+        return {OSSF_SCORE_KEY: fetch_ossf_score(organization, repository)}
     except requests.RequestException as exc:
         logger.warning(
             "Failed to fetch OpenSSF score for %s/%s: %s", organization, repository, exc
         )
-        return {"OSSF Score": None}
+        return {OSSF_SCORE_KEY: None}
@@ -12,7 +12,7 @@ time-to-first-response, and more.
 """
 
 import logging
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional
 
 from edfi_repo_auditor.github_client import GitHubClient
@@ -34,6 +34,21 @@ TOTAL_REVIEWS_KEY = "Total Reviews"
 UNIQUE_REVIEWERS_KEY = "Unique Reviewers"
 MERGED_PRS_LAST_30_DAYS_KEY = "Number of Merged PRs (last 30 days)"
 
+# Every metric the pull request metrics can report
+PR_METRIC_KEYS = (
+    AVG_PR_DURATION_DAYS_KEY,
+    MERGED_PR_COUNT_KEY,
+    AVG_LEAD_TIME_DAYS_KEY,
+    AVG_TIME_TO_FIRST_APPROVAL_HOURS_KEY,
+    AVG_REVIEWS_PER_PR_KEY,
+    AVG_APPROVALS_PER_PR_KEY,
+    TOP_REVIEWER_SHARE_PERCENT_KEY,
+    TOP_THREE_REVIEWERS_SHARE_PERCENT_KEY,
+    TOTAL_REVIEWS_KEY,
+    UNIQUE_REVIEWERS_KEY,
+    MERGED_PRS_LAST_30_DAYS_KEY,
+)
+
 
 def _parse_datetime(dt_str: Optional[object]) -> Optional[datetime]:
     """Parse an ISO 8601 datetime string to datetime object."""
@@ -274,9 +289,14 @@ def get_pr_metrics(
     """
     logger.info(f"Computing PR metrics for {owner}/{repository}")
 
-    prs: List[Dict] = client.get_pull_requests(owner, repository, state="closed")
-
     now_utc = datetime.now(timezone.utc)
+
+    # Merged PRs and their reviews arrive together, newest first, and paging
+    # stops once the PRs fall outside the window.
+    prs: List[Dict] = client.get_merged_pull_requests(
+        owner, repository, since=now_utc - timedelta(days=LAST_N_DAYS + 1)
+    )
+
     merged_prs: List[Dict] = []
     for pr in prs:
         merged_at_str = pr.get("merged_at")
@@ -286,18 +306,14 @@ def get_pr_metrics(
         if (now_utc - merged_at).days <= LAST_N_DAYS:
             merged_prs.append(pr)
 
-    reviews: Dict[int, List[Dict]] = {}
-    for pr in merged_prs:
-        pr_number = int(pr.get("number", 0))
-        try:
-            reviews[pr_number] = client.get_pull_request_reviews(
-                owner, repository, pr_number
-            )
-            for review in reviews[pr_number]:
-                if "created_at" not in review or review["created_at"] is None:
-                    review["created_at"] = pr.get("created_at")
-        except RuntimeError as e:
-            logger.warning(f"Failed to fetch reviews for PR #{pr_number}: {e}")
+    # Review cycle metrics measure from the PR's creation time
+    reviews: Dict[int, List[Dict]] = {
+        int(pr.get("number", 0)): [
+            {**review, "created_at": pr.get("created_at")}
+            for review in pr.get("reviews", [])
+        ]
+        for pr in merged_prs
+    }
 
     duration = audit_pr_duration(merged_prs)
     review_cycle = audit_pr_review_cycle(reviews)
@@ -0,0 +1,177 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+"""
+Rate-limit-aware pacing of GitHub API calls.
+
+GitHub enforces an hourly primary limit per resource (REST "core" and GraphQL
+are counted separately) plus secondary limits on how many points may be spent
+per minute. The scheduler tracks both budgets from the `X-RateLimit-*` and
+`Retry-After` response headers and delays a call *before* it would be
+rejected, rather than failing after a 403.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Mapping, Optional
+
+REST = "rest"
+GRAPHQL = "graphql"
+
+# Requests held back from the primary budget, so that a run never spends the
+# last few calls that other tools sharing the token may need.
+DEFAULT_RESERVE = 50
+
+# Secondary limits: at most 900 REST points and 2,000 GraphQL points per
+# minute. Reads cost one point each.
+DEFAULT_REQUESTS_PER_SECOND = {REST: 900 / 60, GRAPHQL: 2000 / 60}
+
+# Extra time to wait past the advertised reset, to allow for clock skew.
+RESET_MARGIN_SECONDS = 1.0
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RateLimitBudget:
+    rate: float
+    limit: Optional[int] = None
+    remaining: Optional[int] = None
+    reset_at: float = 0.0
+    blocked_until: float = 0.0
+    tokens: float = field(init=False)
+    refilled_at: Optional[float] = None
+    requests: int = 0
+
+    def __post_init__(self) -> None:
+        self.tokens = self.rate
+
+    def refill(self, now: float) -> None:
+        if self.refilled_at is not None:
+            self.tokens = min(
+                self.rate, self.tokens + (now - self.refilled_at) * self.rate
+            )
+        self.refilled_at = now
+
+
+def _header_number(headers: Mapping[str, str], name: str) -> Optional[float]:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class RateLimitScheduler:
+    def __init__(
+        self,
+        reserve: int = DEFAULT_RESERVE,
+        requests_per_second: Optional[Dict[str, float]] = None,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        rates = requests_per_second or DEFAULT_REQUESTS_PER_SECOND
+        self.reserve = reserve
+        self._budgets = {
+            resource: RateLimitBudget(rate) for resource, rate in rates.items()
+        }
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self.waited_seconds = 0.0
+
+    def acquire(self, resource: str) -> float:
+        """
+        Wait until a call against `resource` can be made without exceeding
+        either budget. Threads waiting on one resource do not hold up calls
+        against the other.
+
+        Returns:
+            Seconds spent waiting
+        """
+        with self._lock:
+            budget = self._budgets[resource]
+            now = self._clock()
+            wait = max(budget.blocked_until - now, 0.0)
+
+            if (
+                budget.remaining is not None
+                and budget.remaining <= self.reserve
+                and budget.reset_at > now
+            ):
+                wait = max(wait, budget.reset_at - now + RESET_MARGIN_SECONDS)
+                logger.warning(
+                    f"{resource} rate limit nearly spent ({budget.remaining} "
+                    f"remaining); pausing {wait:.0f}s until it resets"
+                )
+
+            # Token bucket: reserve a token now and wait for it to refill if
+            # the bucket is already empty.
+            budget.refill(now)
+            budget.tokens -= 1
+            if budget.tokens < 0:
+                wait = max(wait, -budget.tokens / budget.rate)
+
+            if budget.remaining is not None:
+                budget.remaining -= 1
+            budget.requests += 1
+            self.waited_seconds += wait
+
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def update(self, resource: str, headers: Mapping[str, str]) -> None:
+        """Record the budget GitHub reported on a response."""
+        remaining = _header_number(headers, "X-RateLimit-Remaining")
+        reset_at = _header_number(headers, "X-RateLimit-Reset")
+        limit = _header_number(headers, "X-RateLimit-Limit")
+        retry_after = _header_number(headers, "Retry-After")
+
+        with self._lock:
+            budget = self._budgets[resource]
+            if remaining is not None and reset_at is not None:
+                # Responses to concurrent calls can arrive out of order; within
+                # one window the lowest count is the most recent.
+                if reset_at == budget.reset_at and budget.remaining is not None:
+                    budget.remaining = min(budget.remaining, int(remaining))
+                else:
+                    budget.remaining = int(remaining)
+                budget.reset_at = reset_at
+            if limit is not None:
+                budget.limit = int(limit)
+            if retry_after is not None:
+                budget.blocked_until = max(
+                    budget.blocked_until, self._clock() + retry_after
+                )
+                logger.warning(
+                    f"GitHub asked to retry {resource} calls after {retry_after:.0f}s"
+                )
+
+    def requests(self) -> Dict[str, int]:
+        with self._lock:
+            return {resource: b.requests for resource, b in self._budgets.items()}
+
+    def projected_seconds(self, pending: Dict[str, float]) -> float:
+        """
+        Estimate how long the rate limits alone will take to allow `pending`
+        more calls per resource, including any wait for a budget to reset.
+        """
+        with self._lock:
+            now = self._clock()
+            projection = 0.0
+            for resource, count in pending.items():
+                budget = self._budgets[resource]
+                seconds = count / budget.rate
+                if budget.remaining is not None and budget.reset_at > now:
+                    available = max(budget.remaining - self.reserve, 0)
+                    if count > available:
+                        seconds = max(seconds, budget.reset_at - now)
+                projection = max(projection, seconds)
+            return projection
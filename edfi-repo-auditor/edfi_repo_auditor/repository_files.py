@@ -0,0 +1,39 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+"""File-existence checks answered from a single repository file listing."""
+
+from typing import Iterable, List, Optional
+
+from edfi_repo_auditor.github_client import LISTED_DIRECTORIES
+
+
+class RepositoryFiles:
+    """
+    Looks up files by name, ignoring case, in a listing returned by
+    `GitHubClient.get_repository_files`.
+    """
+
+    def __init__(self, paths: Iterable[str]):
+        self._paths = {path.lower(): path for path in paths}
+
+    def _candidates(self, filename: str) -> List[str]:
+        name = filename.lower()
+        base = name.rsplit("/", 1)[-1]
+        alternates = [f"{directory.lower()}/{base}" for directory in LISTED_DIRECTORIES]
+        return [name, base, *alternates]
+
+    def find(self, filename: str) -> Optional[str]:
+        """
+        Find `filename` at the given path, in the root, or in any of the
+        `LISTED_DIRECTORIES` where GitHub also looks for it.
+
+        Returns:
+            The matching path as spelled in the repository, or None
+        """
+        for candidate in self._candidates(filename):
+            if candidate in self._paths:
+                return self._paths[candidate]
+        return None
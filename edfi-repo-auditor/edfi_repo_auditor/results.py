@@ -0,0 +1,125 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+"""
+Compact audit results.
+
+A repository's checks are held as one status byte per checklist item, in
+checklist order, next to its metrics. Descriptions and messages are only
+applied when the results are rendered for output, and the statuses of many
+repositories stack into one matrix for scoring.
+"""
+
+from enum import IntEnum
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from edfi_repo_auditor.checklist import CHECKLIST, get_message
+
+# Result column recording why a repository could not be audited
+AUDIT_ERROR_KEY = "Audit Error"
+
+# Result column recording how many workflow files the audit did not need to
+# download
+WORKFLOW_FETCHES_SKIPPED_KEY = "Workflow Files Not Fetched"
+
+
+class Status(IntEnum):
+    NOT_RUN = 0
+    PASSED = 1
+    FAILED = 2
+
+
+# Position of each checklist item's status, by description
+_CHECK_INDEX = {item["description"]: index for index, item in enumerate(CHECKLIST)}
+
+
+class AuditResult:
+    __slots__ = ("statuses", "metrics", "error", "complete")
+
+    def __init__(
+        self,
+        metrics: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+        statuses: Optional[bytearray] = None,
+        complete: bool = True,
+    ):
+        self.statuses = statuses if statuses is not None else bytearray(len(CHECKLIST))
+        # Measurements such as the PR metrics, by column name
+        self.metrics: Dict[str, Any] = metrics if metrics is not None else {}
+        self.error = error
+        # False when a fetch failed, so that the results are not kept between
+        # runs; a metric without a value is otherwise a result like any other
+        self.complete = complete
+
+    def record(self, item: dict, passed: bool) -> None:
+        """Record the outcome of the check of a CHECKLIST `item`."""
+        self.statuses[_CHECK_INDEX[item["description"]]] = (
+            Status.PASSED if passed else Status.FAILED
+        )
+
+    def status(self, item: dict) -> Status:
+        return Status(self.statuses[_CHECK_INDEX[item["description"]]])
+
+    def update(self, other: "AuditResult") -> None:
+        """Add the checks and metrics of `other`, which take precedence."""
+        for index, status in enumerate(other.statuses):
+            if status != Status.NOT_RUN:
+                self.statuses[index] = status
+        self.metrics.update(other.metrics)
+        if other.error is not None:
+            self.error = other.error
+        self.complete = self.complete and other.complete
+
+    def render(self) -> Dict[str, Any]:
+        """The results by column name, with the message of each check run."""
+        rendered: Dict[str, Any] = {
+            item["description"]: get_message(item, status == Status.PASSED)
+            for item, status in zip(CHECKLIST, self.statuses)
+            if status != Status.NOT_RUN
+        }
+        rendered.update(self.metrics)
+        if self.error is not None:
+            rendered[AUDIT_ERROR_KEY] = self.error
+        return rendered
+
+    def to_dict(self) -> dict:
+        """The result as JSON, to store between runs."""
+        return {
+            "statuses": self.statuses.hex(),
+            "metrics": self.metrics,
+            "error": self.error,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Optional["AuditResult"]:
+        """
+        The result stored by `to_dict`, or None when it was stored for
+        another checklist and has to be computed again.
+        """
+        statuses = bytearray.fromhex(data["statuses"])
+        if len(statuses) != len(CHECKLIST):
+            return None
+        return cls(data["metrics"], data["error"], statuses)
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, AuditResult)
+            and self.statuses == other.statuses
+            and self.metrics == other.metrics
+            and self.error == other.error
+        )
+
+    def __repr__(self) -> str:
+        return f"AuditResult({self.render()!r})"
+
+
+def passed_matrix(results: List[AuditResult]) -> np.ndarray:
+    """Boolean matrix of the passed checks, a row per result in checklist order."""
+    statuses = np.frombuffer(
+        b"".join(bytes(result.statuses) for result in results), dtype=np.uint8
+    )
+    return statuses.reshape(len(results), len(CHECKLIST)) == Status.PASSED
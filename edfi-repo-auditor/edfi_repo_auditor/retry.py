@@ -0,0 +1,146 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+"""
+Retries for transient GitHub API failures.
+
+Gateway errors, dropped connections, and secondary-rate-limit rejections are
+retried with exponential backoff and full jitter. Each endpoint class (REST or
+GraphQL) has its own policy and a budget of retries for the whole run, so a
+persistent outage fails fast instead of stalling the audit.
+"""
+
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+
+import requests
+from requests import Response
+
+from edfi_repo_auditor.rate_limit import GRAPHQL, REST
+
+RETRYABLE_STATUS_CODES = {
+    requests.codes.bad_gateway,
+    requests.codes.service_unavailable,
+    requests.codes.gateway_timeout,
+}
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RetryPolicy:
+    max_attempts: int = 4
+    base_delay: float = 1.0
+    max_delay: float = 60.0
+    budget: int = 100
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        backoff = random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+        return max(backoff, retry_after or 0.0)
+
+
+DEFAULT_RETRY_POLICIES = {REST: RetryPolicy(), GRAPHQL: RetryPolicy(budget=50)}
+
+
+def is_retryable(response: Response) -> bool:
+    if response.status_code in RETRYABLE_STATUS_CODES:
+        return True
+
+    # Secondary rate limits are reported as 403 or 429, with a Retry-After
+    # header or a message naming the limit.
+    if response.status_code in (requests.codes.forbidden, requests.codes.too_many):
+        return (
+            "Retry-After" in response.headers
+            or "secondary rate limit" in response.text.lower()
+        )
+
+    return False
+
+
+def _retry_after(response: Optional[Response]) -> Optional[float]:
+    if response is None:
+        return None
+    try:
+        return float(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        return None
+
+
+class Retrier:
+    def __init__(
+        self,
+        policies: Optional[Dict[str, RetryPolicy]] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.policies = policies or DEFAULT_RETRY_POLICIES
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._retries = {endpoint_class: 0 for endpoint_class in self.policies}
+        self._seconds = {endpoint_class: 0.0 for endpoint_class in self.policies}
+
+    def call(
+        self, endpoint_class: str, description: str, send: Callable[[], Response]
+    ) -> Response:
+        """
+        Send a request, retrying transient failures.
+
+        Returns:
+            The first non-retryable response, or the last retryable one once
+            the attempts or the retry budget are exhausted. The caller decides
+            how to report it; connection errors are re-raised instead.
+        """
+        policy = self.policies[endpoint_class]
+        attempt = 0
+
+        while True:
+            response: Optional[Response] = None
+            try:
+                response = send()
+                if not is_retryable(response):
+                    return response
+                reason = f"status {response.status_code}"
+            except (requests.ConnectionError, requests.Timeout) as error:
+                if not self._can_retry(endpoint_class, policy, attempt):
+                    raise
+                reason = type(error).__name__
+            else:
+                if not self._can_retry(endpoint_class, policy, attempt):
+                    return response
+
+            delay = policy.delay(attempt, _retry_after(response))
+            with self._lock:
+                self._seconds[endpoint_class] += delay
+
+            logger.warning(
+                f"{description} failed with {reason}; retrying in {delay:.1f}s "
+                f"(attempt {attempt + 2} of {policy.max_attempts})"
+            )
+            self._sleep(delay)
+            attempt += 1
+
+    def _can_retry(self, endpoint_class: str, policy: RetryPolicy, attempt: int) -> bool:
+        if attempt + 1 >= policy.max_attempts:
+            return False
+
+        with self._lock:
+            if self._retries[endpoint_class] >= policy.budget:
+                logger.warning(f"Retry budget for {endpoint_class} calls is spent")
+                return False
+            self._retries[endpoint_class] += 1
+            return True
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {
+                endpoint_class: {
+                    "retries": self._retries[endpoint_class],
+                    "seconds": self._seconds[endpoint_class],
+                }
+                for endpoint_class in self.policies
+            }
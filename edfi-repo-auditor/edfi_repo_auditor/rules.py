@@ -0,0 +1,166 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+"""
+Declarative audit rules and the planner that decides what to fetch for them.
+
+Each rule names the checklist item or metric it produces, the audit stage that
+evaluates it, the repository fields it reads from the GraphQL
+`RepositoryInformation` fragment, the other calls it needs, and whether its
+result changes with time alone. Planning a
+selection of rules gives the stages to run, the fields to query and the calls
+to make, so nothing is fetched that no selected rule reads.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Set, Tuple
+
+from edfi_repo_auditor.checklist import CHECKLIST
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# Calls made in addition to the repository information query
+WORKFLOW_TREE = "workflow tree"
+WORKFLOW_FILES = "workflow files"
+FILE_LISTING = "file listing"
+DEPENDABOT_STATUS = "dependabot status"
+PULL_REQUESTS = "pull requests"
+OSSF_SCORECARD = "ossf scorecard"
+
+
+@dataclass(frozen=True)
+class Rule:
+    name: str
+    description: str
+    stage: str
+    item: Optional[dict] = None
+    # Fields of `github_client.REPOSITORY_INFORMATION_FIELDS`
+    fields: Tuple[str, ...] = ()
+    calls: Tuple[str, ...] = ()
+    # The result changes over time even when the repository does not, such as
+    # metrics over the last 30 days
+    time_dependent: bool = False
+
+
+def _check(
+    name: str,
+    stage: str,
+    fields: Tuple[str, ...] = (),
+    calls: Tuple[str, ...] = (),
+    time_dependent: bool = False,
+) -> Rule:
+    item = getattr(CHECKLIST, name)
+    return Rule(name, item["description"], stage, item, fields, calls, time_dependent)
+
+
+_WORKFLOW_CONTENT = (WORKFLOW_TREE, WORKFLOW_FILES)
+
+# To add a check, add its CHECKLIST item and declare what it depends on here.
+RULES: List[Rule] = [
+    _check("HAS_ACTIONS", "actions", calls=(WORKFLOW_TREE,)),
+    _check("APPROVED_ACTIONS", "actions", calls=_WORKFLOW_CONTENT),
+    _check("TEST_REPORTER", "actions", calls=_WORKFLOW_CONTENT),
+    _check("UNIT_TESTS", "actions", calls=_WORKFLOW_CONTENT),
+    _check("WIKI", "repo_config", fields=("hasWikiEnabled",)),
+    _check("ISSUES", "repo_config", fields=("hasIssuesEnabled",)),
+    _check("PROJECTS", "repo_config", fields=("hasProjectsEnabled",)),
+    _check("DELETES_HEAD", "repo_config", fields=("deleteBranchOnMerge",)),
+    _check("USES_SQUASH", "repo_config", fields=("squashMergeAllowed",)),
+    _check("LICENSE_INFORMATION", "repo_config", fields=("licenseInfo",)),
+    _check("DEPENDABOT_ENABLED", "repo_config", calls=(DEPENDABOT_STATUS,)),
+    # Alerts fail once they are three weeks old
+    _check(
+        "DEPENDABOT_ALERTS",
+        "repo_config",
+        fields=("vulnerabilityAlerts",),
+        time_dependent=True,
+    ),
+    _check("NOTICES", "files", fields=("defaultBranchRef",), calls=(FILE_LISTING,)),
+    _check(
+        "CODE_OF_CONDUCT",
+        "files",
+        fields=("defaultBranchRef",),
+        calls=(FILE_LISTING,),
+    ),
+    Rule(
+        "PR_METRICS",
+        "PR Metrics",
+        "pr_metrics",
+        calls=(PULL_REQUESTS,),
+        time_dependent=True,
+    ),
+    # The Scorecard is computed again by OpenSSF on a schedule of its own
+    Rule(
+        "OSSF_SCORE",
+        "OSSF Score",
+        "ossf_score",
+        calls=(OSSF_SCORECARD,),
+        time_dependent=True,
+    ),
+]
+
+
+@dataclass(frozen=True)
+class AuditPlan:
+    """The rules to evaluate, and the data they need."""
+
+    rules: Tuple[Rule, ...]
+
+    @property
+    def stages(self) -> Set[str]:
+        return {rule.stage for rule in self.rules}
+
+    @property
+    def fields(self) -> List[str]:
+        """Repository information fields to query, in rule order."""
+        return list(
+            dict.fromkeys(field for rule in self.rules for field in rule.fields)
+        )
+
+    @property
+    def calls(self) -> Set[str]:
+        return {call for rule in self.rules for call in rule.calls}
+
+    def includes(self, item: dict) -> bool:
+        return any(rule.description == item["description"] for rule in self.rules)
+
+
+def _matches(rule: Rule, name: str) -> bool:
+    wanted = name.strip().lower()
+    return wanted in (rule.name.lower(), rule.description.lower())
+
+
+def unknown_rules(names: Iterable[str]) -> List[str]:
+    """The names that match no rule by name or description."""
+    return [name for name in names if not any(_matches(rule, name) for rule in RULES)]
+
+
+def plan_audit(names: Iterable[str] = (), strict: bool = True) -> AuditPlan:
+    """
+    Plan the audit of the rules called `names`, matched without regard to
+    case against each rule's name (`DEPENDABOT_ENABLED`) or description
+    ("Dependabot Enabled"). Every rule is planned when no names are given.
+
+    Raises:
+        ValueError: a name matches no rule, when `strict`; otherwise the
+            name is logged and ignored
+    """
+    names = list(names)
+    if not names:
+        return AuditPlan(tuple(RULES))
+
+    unknown = unknown_rules(names)
+    if unknown:
+        if strict:
+            raise ValueError(f"Unknown checks: {', '.join(unknown)}")
+        logger.warning(f"No rule produces {', '.join(unknown)}; ignoring")
+
+    return AuditPlan(
+        tuple(rule for rule in RULES if any(_matches(rule, name) for name in names))
+    )
+
+
+FULL_PLAN = plan_audit()
@@ -0,0 +1,117 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+"""
+Scoring of audit results against the rules and threshold in `scoring.json`.
+
+Every repository is scored at once: the passed checks form a boolean matrix
+that is multiplied by the rule weights. Saved reports can be scored again with
+the current rules:
+
+    python -m edfi_repo_auditor.scoring reports/audit-result.csv
+"""
+
+import argparse
+import json
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from edfi_repo_auditor.checklist import CHECKLIST, CHECKLIST_DEFAULT_SUCCESS_MESSAGE
+from edfi_repo_auditor.config import DEFAULT_SCORING_FILE
+from edfi_repo_auditor.results import AuditResult, passed_matrix
+
+SCORE_KEY = "Score"
+MEETS_THRESHOLD_KEY = "Meets Threshold"
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Scoring:
+    threshold: int
+    # Points for each passed check, by check description
+    rules: Dict[str, int]
+
+
+def load_scoring(path: str) -> Scoring:
+    with open(path, "r", encoding="utf-8") as f:
+        document = json.load(f)
+    return Scoring(document["threshold"], document["rules"])
+
+
+def _rule_columns(columns: List[str], scoring: Scoring) -> Dict[str, str]:
+    """Result column of each rule, matched without regard to case."""
+    by_name = {str(column).lower(): column for column in columns}
+    matched = {}
+    missing = []
+    for rule in scoring.rules:
+        column = by_name.get(rule.lower())
+        if column is None:
+            missing.append(rule)
+        else:
+            matched[rule] = column
+
+    if missing:
+        logger.info(f"Not scoring {', '.join(missing)}: not in the results")
+    return matched
+
+
+def score_results(report: pd.DataFrame, scoring: Scoring) -> pd.DataFrame:
+    """
+    Score every repository in `report`, one row per repository with a column
+    per check.
+
+    Returns:
+        `report` with the `Score` and whether it `Meets Threshold`
+    """
+    columns = _rule_columns(list(report.columns), scoring)
+    weights = np.array([scoring.rules[rule] for rule in columns], dtype=np.int64)
+    passed = (
+        report[list(columns.values())].eq(CHECKLIST_DEFAULT_SUCCESS_MESSAGE).to_numpy()
+    )
+
+    scores = passed @ weights if len(columns) else np.zeros(len(report), np.int64)
+    return with_scores(report, scores, scoring)
+
+
+def score_records(results: List[AuditResult], scoring: Scoring) -> np.ndarray:
+    """The score of each of `results`, from their check statuses."""
+    descriptions = [item["description"] for item in CHECKLIST]
+    weights = np.zeros(len(descriptions), dtype=np.int64)
+    for rule, column in _rule_columns(descriptions, scoring).items():
+        weights[descriptions.index(column)] += scoring.rules[rule]
+    return passed_matrix(results) @ weights
+
+
+def with_scores(
+    report: pd.DataFrame, scores: np.ndarray, scoring: Scoring
+) -> pd.DataFrame:
+    """`report` with the `Score` and whether it `Meets Threshold`."""
+    return report.assign(
+        **{SCORE_KEY: scores, MEETS_THRESHOLD_KEY: scores >= scoring.threshold}
+    )
+
+
+def main(args_in: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Score saved audit results again, in place"
+    )
+    parser.add_argument("reports", nargs="+", help="CSV files saved by the audit")
+    parser.add_argument("--scoring_file", default=DEFAULT_SCORING_FILE)
+    args = parser.parse_args(args_in)
+
+    scoring = load_scoring(args.scoring_file)
+    for path in args.reports:
+        report = pd.read_csv(path)
+        score_results(report, scoring).to_csv(path, index=False)
+        print(f"Scored {len(report)} repositories in {path}")
+
+
+if __name__ == "__main__":
+    main()
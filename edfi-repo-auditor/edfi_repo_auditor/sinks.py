@@ -0,0 +1,228 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+"""
+Outputs written as each repository's audit completes.
+
+Unlike the CSV report, which is written once every repository is done, a sink
+receives each repository's results as soon as they are reported, so the
+results can be followed while a long audit runs. Sinks that write in batches
+hold at most one batch in memory.
+
+Parquet output needs the optional `pyarrow` package.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List
+
+from edfi_repo_auditor.checklist import CHECKLIST
+from edfi_repo_auditor.ossf_score import OSSF_SCORE_KEY
+from edfi_repo_auditor.pr_metrics import PR_METRIC_KEYS
+from edfi_repo_auditor.results import (
+    AUDIT_ERROR_KEY,
+    WORKFLOW_FETCHES_SKIPPED_KEY,
+    AuditResult,
+)
+
+try:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.parquet as pq  # type: ignore
+except ImportError:  # pragma: no cover - depends on the environment
+    pa = None
+    pq = None
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 100
+
+# Every metric an audit can report; each is a number
+METRIC_KEYS = PR_METRIC_KEYS + (OSSF_SCORE_KEY, WORKFLOW_FETCHES_SKIPPED_KEY)
+
+
+class ResultSink(ABC):
+    """
+    Receives the results of each repository, in report order, and renders
+    them as the report does.
+    """
+
+    @abstractmethod
+    def write(self, repository: str, results: AuditResult) -> None:
+        """Write the `results` of `repository`."""
+
+    def close(self) -> None:
+        """Write anything still buffered and release the output."""
+
+
+class JsonLinesSink(ResultSink):
+    """One JSON object per repository, flushed as it is written."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "w", encoding="utf-8")
+
+    def write(self, repository: str, results: AuditResult) -> None:
+        row = {"repository": repository, **results.render()}
+        self._file.write(json.dumps(row) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _BatchedSink(ResultSink, ABC):
+    def __init__(self, batch_size: int):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self._batch_size = batch_size
+        self._batch: List[dict] = []
+        self._lock = threading.Lock()
+
+    def write(self, repository: str, results: AuditResult) -> None:
+        row = {"repository": repository, **results.render()}
+        with self._lock:
+            self._batch.append(row)
+            if len(self._batch) >= self._batch_size:
+                self._flush()
+
+    def _flush(self) -> None:
+        """Write the pending batch; called with the lock held."""
+        if self._batch:
+            self._write_batch(self._batch)
+            self._batch = []
+
+    @abstractmethod
+    def _write_batch(self, rows: List[dict]) -> None:
+        """Write the rendered results of a batch of repositories."""
+
+
+class SqliteSink(_BatchedSink):
+    """
+    One row per result in a `results` table of repository, check and value;
+    each batch is inserted in one transaction. Results of a previous audit in
+    the same file are replaced.
+    """
+
+    def __init__(self, path: str, batch_size: int = DEFAULT_BATCH_SIZE):
+        super().__init__(batch_size)
+        self.path = path
+        # Results may be written from another thread than the one opening the
+        # sink; writes are serialized by the sink's lock.
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS results "
+                "(repository TEXT NOT NULL, name TEXT NOT NULL, value)"
+            )
+            self._connection.execute("DELETE FROM results")
+
+    def _write_batch(self, rows: List[dict]) -> None:
+        with self._connection:
+            self._connection.executemany(
+                "INSERT INTO results VALUES (?, ?, ?)",
+                [
+                    (row["repository"], name, _sqlite_value(value))
+                    for row in rows
+                    for name, value in row.items()
+                    if name != "repository"
+                ],
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush()
+            self._connection.close()
+
+
+def _sqlite_value(value: Any) -> Any:
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    return json.dumps(value)
+
+
+class ParquetSink(_BatchedSink):
+    """
+    One row per repository, with a column per check, a column per metric and
+    the audit error; each batch is written as a row group. Results in other
+    columns are not written.
+    """
+
+    def __init__(self, path: str, batch_size: int = DEFAULT_BATCH_SIZE):
+        if pa is None:
+            raise RuntimeError(
+                "Parquet output needs pyarrow: install it with `pip install pyarrow`"
+            )
+        super().__init__(batch_size)
+        self.path = path
+        self._schema = pa.schema(
+            [("repository", pa.string())]
+            + [(item["description"], pa.string()) for item in CHECKLIST]
+            + [(name, pa.float64()) for name in METRIC_KEYS]
+            + [(AUDIT_ERROR_KEY, pa.string())]
+        )
+        self._writer = pq.ParquetWriter(path, self._schema)
+        self._dropped: set = set()
+
+    def _write_batch(self, rows: List[dict]) -> None:
+        extra = {name for row in rows for name in row} - set(self._schema.names)
+        if extra - self._dropped:
+            logger.warning(
+                f"Not writing {', '.join(sorted(extra - self._dropped))} to "
+                f"{self.path}: not a known result column"
+            )
+            self._dropped |= extra
+
+        columns = {
+            field.name: [_conform(row.get(field.name), field.type) for row in rows]
+            for field in self._schema
+        }
+        self._writer.write_table(pa.table(columns, schema=self._schema))
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush()
+            self._writer.close()
+
+
+def _conform(value: Any, kind: Any) -> Any:
+    """`value` as the type of its column, or None when it cannot be."""
+    if value is None:
+        return None
+    if kind == pa.float64():
+        return float(value) if isinstance(value, (int, float)) else None
+    return value if isinstance(value, str) else json.dumps(value)
+
+
+SINKS: Dict[str, Callable[[str], ResultSink]] = {
+    "jsonl": JsonLinesSink,
+    "parquet": ParquetSink,
+    "sqlite": SqliteSink,
+}
+
+
+def open_sinks(formats: List[str], base_path: str) -> List[ResultSink]:
+    """
+    Open a sink for each of `formats`, writing to `base_path` with the
+    format's extension.
+    """
+    directory = os.path.dirname(base_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    sinks: List[ResultSink] = []
+    try:
+        for name in formats:
+            path = f"{base_path}.{name}"
+            logger.info(f"Writing results to {path} as each repository completes")
+            sinks.append(SINKS[name](path))
+    except Exception:
+        for sink in sinks:
+            sink.close()
+        raise
+    return sinks
@@ -0,0 +1,223 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+"""
+Results of each audit stage, kept between runs against a fingerprint of the
+stage's inputs.
+
+A changed repository rarely changes the inputs of every stage: a merged pull
+request does not change the workflows, and a changed setting does not change
+the pull request metrics. Each stage is fingerprinted by a few repository
+information fields that are fetched with the bulk query anyway, and a stage
+only runs again when its fingerprint changes.
+
+Some checks also depend on the time, which no fingerprint field covers: the
+pull request metrics cover the last 30 days, the OSSF Scorecard is computed
+outside the repository, and alerts fail once they are three weeks old. The
+results of the stages running them are only reused for a limited time.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from dataclasses import replace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from edfi_repo_auditor.disk_cache import DiskCache
+from edfi_repo_auditor.results import AuditResult
+from edfi_repo_auditor.rules import AuditPlan
+from edfi_repo_auditor.stages import Stage
+
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+DEFAULT_MAX_AGE_HOURS = 24
+
+# Repository information fields that change whenever a stage's inputs do: the
+# tree of the `.github` directory holds the workflows and local actions, and
+# the OSSF Scorecard is computed again for new commits. The settings stage is
+# fingerprinted by the settings its planned checks read, unless they also need
+# other calls.
+STAGE_FINGERPRINT_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "actions": ("githubTree",),
+    "files": ("rootTree",),
+    "pr_metrics": ("latestMergedPullRequest",),
+    "ossf_score": ("defaultBranchRef",),
+}
+
+
+def fingerprint_fields(plan: AuditPlan, stage: str) -> List[str]:
+    """The information fields fingerprinting `stage`, or none to always run it."""
+    if stage in STAGE_FINGERPRINT_FIELDS:
+        return list(STAGE_FINGERPRINT_FIELDS[stage])
+
+    rules = [rule for rule in plan.rules if rule.stage == stage]
+    # The result of a call, such as the Dependabot status, has no fingerprint
+    if any(rule.calls for rule in rules):
+        return []
+    return list(dict.fromkeys(field for rule in rules for field in rule.fields))
+
+
+def expires(plan: AuditPlan, stage: str) -> bool:
+    """Whether any planned check of `stage` depends on the time."""
+    return any(rule.time_dependent for rule in plan.rules if rule.stage == stage)
+
+
+def stage_fingerprint(
+    information: Optional[dict], fields: List[str], checks: List[str]
+) -> Optional[str]:
+    """
+    Fingerprint of a stage running `checks`, from the `fields` of the
+    repository information; None when any field was not fetched.
+    """
+    if not information or any(field not in information for field in fields):
+        return None
+    data = json.dumps(
+        {
+            "fields": {field: information[field] for field in fields},
+            "checks": sorted(checks),
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+class StageMemo:
+    """
+    Stage results by repository and stage, each stored with the fingerprint
+    it was computed for and the time it was computed. Results of a failed
+    fetch, such as an OSSF score that could not be fetched, are not stored so
+    that they are retried.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        reuse: bool = True,
+        max_age_hours: float = DEFAULT_MAX_AGE_HOURS,
+    ):
+        self._store = DiskCache(directory, max_bytes) if directory else None
+        self._entries: Dict[str, dict] = {}
+        self._reuse = reuse
+        self._max_age = max_age_hours * 3600
+        self._lock = threading.Lock()
+        self._hits: Dict[str, int] = {}
+        self._misses: Dict[str, int] = {}
+
+    def _get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None and self._store is not None:
+            entry = self._store.get(key)
+        return entry
+
+    def _expired(self, entry: dict) -> bool:
+        # Entries stored without a time are treated as expired
+        return time.time() - entry.get("recorded", 0) > self._max_age
+
+    def run(
+        self,
+        repository: str,
+        stage: str,
+        fingerprint: str,
+        run: Callable[[], AuditResult],
+        expires: bool = False,
+    ) -> AuditResult:
+        """
+        The results of `stage` for `repository` stored for `fingerprint`, or
+        those of calling `run`, which are then stored.
+
+        Parameters:
+            expires: True when the results depend on the time, so that they
+                are only reused up to the maximum age
+        """
+        key = f"{repository}/{stage}"
+        entry = self._get(key) if self._reuse else None
+        stored = (
+            AuditResult.from_dict(entry["result"])
+            if entry is not None
+            and entry.get("fingerprint") == fingerprint
+            and "result" in entry
+            and not (expires and self._expired(entry))
+            else None
+        )
+        counts = self._misses
+        if stored is not None:
+            counts = self._hits
+            results = stored
+        else:
+            results = run()
+            if results.complete:
+                entry = {
+                    "fingerprint": fingerprint,
+                    "result": results.to_dict(),
+                    "recorded": time.time(),
+                }
+                with self._lock:
+                    self._entries[key] = entry
+                if self._store is not None:
+                    self._store.set(key, entry)
+
+        with self._lock:
+            counts[stage] = counts.get(stage, 0) + 1
+        return results
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Stages reused and run, by stage name."""
+        with self._lock:
+            return {
+                stage: {
+                    "hits": self._hits.get(stage, 0),
+                    "misses": self._misses.get(stage, 0),
+                }
+                for stage in sorted(self._hits.keys() | self._misses.keys())
+            }
+
+
+def memo_fields(plan: AuditPlan) -> List[str]:
+    """The information fields fingerprinting the planned stages."""
+    return list(
+        dict.fromkeys(
+            field
+            for stage in sorted(plan.stages)
+            for field in fingerprint_fields(plan, stage)
+        )
+    )
+
+
+def memoize_stages(
+    stages: List[Stage],
+    memo: StageMemo,
+    repository: str,
+    plan: AuditPlan,
+) -> List[Stage]:
+    """
+    Wrap every fingerprinted stage so that it runs only when its fingerprint
+    has changed. Wrapped stages wait for the repository information, which
+    holds the fingerprint fields.
+
+    Parameters:
+        repository: Full name of the repository, with its organization
+    """
+
+    def memoized(stage: Stage) -> Stage:
+        fields = fingerprint_fields(plan, stage.name)
+        if not fields:
+            return stage
+        checks = [rule.name for rule in plan.rules if rule.stage == stage.name]
+        expiring = expires(plan, stage.name)
+
+        def run(inputs: Dict[str, Any]) -> Any:
+            key = stage_fingerprint(inputs.get("information"), fields, checks)
+            if key is None:
+                return stage.run(inputs)
+            return memo.run(
+                repository, stage.name, key, lambda: stage.run(inputs), expiring
+            )
+
+        requires = tuple(dict.fromkeys(stage.requires + ("information",)))
+        return replace(stage, run=run, requires=requires)
+
+    return [memoized(stage) for stage in stages]
@@ -0,0 +1,79 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+"""
+Concurrent execution of a repository's audit stages.
+
+Stages form a small dependency graph: a stage starts as soon as every stage it
+requires has finished, and independent stages run at the same time. A
+repository's latency is therefore its slowest chain of stages rather than the
+sum of all of them.
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Set, Tuple
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    One unit of audit work. `run` receives the outputs of the stages named
+    in `requires`, keyed by stage name.
+    """
+
+    name: str
+    run: Callable[[Dict[str, Any]], Any]
+    requires: Tuple[str, ...] = ()
+
+
+def _timed(stage: Stage, inputs: Dict[str, Any]) -> Tuple[Any, float]:
+    started = time.perf_counter()
+    output = stage.run(inputs)
+    return output, time.perf_counter() - started
+
+
+def run_stages(stages: List[Stage]) -> Tuple[Dict[str, Any], Dict[str, float]]:
+    """
+    Run `stages` concurrently, honouring their dependencies.
+
+    Returns:
+        Tuple of the stage outputs and the seconds each stage took, both keyed
+        by stage name. The first stage to fail raises its exception once the
+        stages already running have finished.
+    """
+    names = {stage.name for stage in stages}
+    for stage in stages:
+        missing = set(stage.requires) - names
+        if missing:
+            raise ValueError(f"Stage {stage.name} requires unknown stages {missing}")
+
+    outputs: Dict[str, Any] = {}
+    timings: Dict[str, float] = {}
+    pending = list(stages)
+    running: Dict[Future, Stage] = {}
+
+    with ThreadPoolExecutor(
+        max_workers=max(len(stages), 1), thread_name_prefix="stage"
+    ) as executor:
+        while pending or running:
+            for stage in [s for s in pending if set(s.requires) <= outputs.keys()]:
+                pending.remove(stage)
+                inputs = {name: outputs[name] for name in stage.requires}
+                running[executor.submit(_timed, stage, inputs)] = stage
+
+            if not running:
+                raise ValueError(
+                    f"Stages {[s.name for s in pending]} have circular dependencies"
+                )
+
+            done: Set[Future]
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage = running.pop(future)
+                outputs[stage.name], timings[stage.name] = future.result()
+
+    return outputs, timings
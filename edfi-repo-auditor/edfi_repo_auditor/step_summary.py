@@ -0,0 +1,147 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+"""
+Organization-level GitHub Actions job summary.
+
+Instead of a table per repository, the summary holds one matrix of the
+repositories and the checks run, with the repositories failing the most checks
+first. GitHub rejects job summaries over 1 MiB, so the matrix is cut to a byte
+budget; the full results of every repository are written to a details file
+that is uploaded with the other reports.
+"""
+
+import os
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from edfi_repo_auditor.checklist import CHECKLIST
+from edfi_repo_auditor.results import AuditResult, Status
+
+DEFAULT_SUMMARY_MAX_KB = 1000
+
+_CELLS = {Status.NOT_RUN: "", Status.PASSED: "✅", Status.FAILED: "❌"}
+
+
+def repository_markdown(repository: str, results: AuditResult) -> str:
+    """Markdown table of every result of `repository`."""
+    lines = [
+        f"# Repository Audit Results: {repository}",
+        "",
+        "",
+        "## Audit Details",
+        "",
+        "| Check | Result |",
+        "|-------|--------|",
+    ]
+    # Sort results for consistent output
+    lines.extend(
+        f"| {check} | {result} |" for check, result in sorted(results.render().items())
+    )
+    return "\n".join(lines) + "\n"
+
+
+def _size(line: str) -> int:
+    return len(line.encode("utf-8")) + 1
+
+
+def org_summary(
+    organization: str,
+    report_data: List[Tuple[str, AuditResult]],
+    max_bytes: int,
+    details_path: str,
+    scores: Optional[np.ndarray] = None,
+    threshold: Optional[int] = None,
+) -> str:
+    """
+    Markdown matrix of the checks of every repository, at most `max_bytes`
+    long. Repositories whose audit failed come first, then those failing the
+    most checks; the repositories that do not fit are left out with a note
+    pointing to `details_path`.
+
+    Parameters:
+        scores: Score of each repository, in the order of `report_data`
+        threshold: Passing score, when `scores` are given
+    """
+    # Only the checks run for at least one repository get a column
+    columns = [
+        index
+        for index in range(len(CHECKLIST))
+        if any(results.statuses[index] for _, results in report_data)
+    ]
+    items = list(CHECKLIST)
+
+    header = [f"# Repository Audit Summary: {organization}", ""]
+    if scores is not None:
+        header += [f"Passing score: {threshold}", ""]
+    names = ["Repository", "Failed"] + ([] if scores is None else ["Score"])
+    names += [items[index]["description"] for index in columns]
+    header += [
+        "| " + " | ".join(names) + " |",
+        "|" + "|".join("---" for _ in names) + "|",
+    ]
+
+    rows = []
+    for position, (repository, results) in enumerate(report_data):
+        failed = results.statuses.count(Status.FAILED)
+        cells = [repository, "⚠️ Audit Error" if results.error else str(failed)]
+        if scores is not None:
+            score = scores[position]
+            meets = threshold is not None and score >= threshold
+            cells.append(f"{score:g} {'✅' if meets else '❌'}")
+        cells += [_CELLS[Status(results.statuses[index])] for index in columns]
+        rows.append((results.error is None, -failed, repository, cells))
+    rows.sort(key=lambda row: row[:3])
+
+    def note(omitted: int) -> str:
+        return (
+            f"\n_{omitted} more repositories are not shown; see `{details_path}` "
+            "for the results of every repository._"
+        )
+
+    # Room is kept for the note on the repositories left out
+    budget = max_bytes - _size(note(len(rows)))
+    lines = list(header)
+    used = sum(_size(line) for line in lines)
+    table = used <= budget
+    if not table:
+        # Not even the header of the matrix fits
+        lines = header[:2]
+
+    shown = 0
+    if table:
+        for _, _, _, cells in rows:
+            line = "| " + " | ".join(cells) + " |"
+            if used + _size(line) > budget:
+                break
+            lines.append(line)
+            used += _size(line)
+            shown += 1
+
+    if shown < len(rows):
+        lines.append(note(len(rows) - shown))
+    return "\n".join(lines) + "\n"
+
+
+def write_details(path: str, report_data: List[Tuple[str, AuditResult]]) -> None:
+    """Write the full results of every repository to the markdown file `path`."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        for repository, results in report_data:
+            f.write(repository_markdown(repository, results))
+            f.write("\n")
+
+
+def write_step_summary(summary: str) -> None:
+    """Append `summary` to the GitHub Actions job summary in one write."""
+    github_step_summary = os.getenv("GITHUB_STEP_SUMMARY")
+    if github_step_summary:
+        with open(github_step_summary, "a", encoding="utf-8") as f:
+            f.write(summary)
+
+    print(summary)
@@ -0,0 +1,64 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+"""
+Content-addressed store of workflow files and their scan results.
+
+Entries are keyed by git blob SHA, so the many byte-identical copies of a
+workflow found across an organization's repositories are downloaded and
+scanned once. Entries are kept in memory for the run and, when a directory is
+given, on disk between runs.
+"""
+
+import threading
+from typing import Dict, Optional
+
+from edfi_repo_auditor.disk_cache import DiskCache
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class WorkflowCache:
+    def __init__(
+        self, directory: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        self._store = DiskCache(directory, max_bytes) if directory else None
+        self._entries: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, oid: str) -> Optional[dict]:
+        """
+        Look up a workflow by blob SHA.
+
+        Returns:
+            The stored entry, with the workflow `text` and its scan results,
+            or None when the blob has not been seen
+        """
+        with self._lock:
+            entry = self._entries.get(oid)
+        if entry is None and self._store is not None:
+            entry = self._store.get(oid)
+            if entry is not None:
+                with self._lock:
+                    self._entries[oid] = entry
+
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return entry
+
+    def set(self, oid: str, entry: dict) -> None:
+        with self._lock:
+            self._entries[oid] = entry
+        if self._store is not None:
+            self._store.set(oid, entry)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
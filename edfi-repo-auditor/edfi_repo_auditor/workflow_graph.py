@@ -0,0 +1,131 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+"""
+Resolution of reusable workflows and composite actions across repositories.
+
+Workflows commonly delegate to shared reusable workflows and composite actions
+that live in other repositories, and these can call further workflows and
+actions in turn. The graph fetches and parses each of them once per run, no
+matter how many audited repositories call it.
+"""
+
+import logging
+import posixpath
+import threading
+from concurrent.futures import Future
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from edfi_repo_auditor.github_client import GitHubClient
+from edfi_repo_auditor.workflow_model import UsesReference, parse_action, parse_workflow
+
+# GitHub allows reusable workflows and composite actions to be nested up to
+# ten levels deep.
+DEFAULT_MAX_DEPTH = 10
+
+ACTION_FILE_NAMES = ["action.yml", "action.yaml"]
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class WorkflowGraph:
+    def __init__(self, client: GitHubClient, max_depth: int = DEFAULT_MAX_DEPTH):
+        self._client = client
+        self._max_depth = max_depth
+        self._nodes: Dict[Tuple, Future] = {}
+        self._lock = threading.Lock()
+        self.fetched = 0
+
+    def references(
+        self,
+        owner: str,
+        repository: str,
+        references: Iterable[UsesReference],
+        ref: Optional[str] = None,
+    ) -> Set[UsesReference]:
+        """
+        Find every workflow and action reachable from `references`, which
+        were found in a file in `owner/repository` at `ref`.
+
+        Returns:
+            `references` and everything they call, with local references
+            resolved to the repository that contains them
+        """
+        found: Set[UsesReference] = set()
+        frontier = [
+            reference.relative_to(owner, repository, ref) for reference in references
+        ]
+
+        for _ in range(self._max_depth + 1):
+            calls: List[UsesReference] = []
+            for reference in frontier:
+                if reference not in found:
+                    found.add(reference)
+                    calls.extend(self._calls(reference))
+            if not calls:
+                break
+            frontier = calls
+
+        return found
+
+    def _calls(self, reference: UsesReference) -> List[UsesReference]:
+        """The workflows and actions called by `reference`, loaded once."""
+        if not reference.owner or not reference.repository:
+            # Docker images call nothing further, and a malformed reference
+            # such as `owner/` names no repository to read
+            return []
+
+        key = (
+            reference.owner.lower(),
+            reference.repository.lower(),
+            reference.path,
+            reference.ref,
+        )
+        with self._lock:
+            node = self._nodes.get(key)
+            loading = node is None
+            if node is None:
+                node = self._nodes[key] = Future()
+
+        # Concurrent audits of other repositories wait for the first one to
+        # finish loading a shared node rather than fetching it again.
+        if loading:
+            try:
+                node.set_result(self._load(reference))
+            except Exception as error:
+                node.set_exception(error)
+        return node.result()
+
+    def _load(self, reference: UsesReference) -> List[UsesReference]:
+        calls: List[UsesReference] = []
+        if reference.is_workflow:
+            text = self._fetch(reference, reference.path)
+            workflow = parse_workflow(text) if text else None
+            if workflow is not None:
+                calls = list(workflow.references())
+        else:
+            for name in ACTION_FILE_NAMES:
+                text = self._fetch(reference, posixpath.join(reference.path, name))
+                if text is None:
+                    continue
+                action = parse_action(text)
+                if action is not None and action.is_composite:
+                    calls = list(action.references())
+                break
+
+        return [
+            call.relative_to(
+                reference.owner or "", reference.repository or "", reference.ref
+            )
+            for call in calls
+        ]
+
+    def _fetch(self, reference: UsesReference, path: str) -> Optional[str]:
+        with self._lock:
+            self.fetched += 1
+        logger.debug(f"Resolving {reference.raw}: reading {path}")
+        return self._client.get_file_content(
+            reference.owner or "", reference.repository or "", path, reference.ref
+        )
@@ -0,0 +1,245 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+"""
+Typed model of GitHub Actions workflows and actions.
+
+Only the parts the audit relies on are modeled: jobs, steps, and the `uses`
+references that call reusable workflows and actions.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import yaml
+
+from edfi_repo_auditor.checklist import CHECKLIST
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+_WORKFLOW_EXTENSIONS = (".yml", ".yaml")
+
+
+@dataclass(frozen=True)
+class UsesReference:
+    """
+    A `uses` value, such as `actions/checkout@v4`,
+    `owner/repo/.github/workflows/build.yml@main`, `./.github/actions/setup`
+    or `docker://alpine:3`.
+    """
+
+    raw: str
+    owner: Optional[str] = None
+    repository: Optional[str] = None
+    path: str = ""
+    ref: Optional[str] = None
+
+    @classmethod
+    def parse(cls, raw: str) -> "UsesReference":
+        value = raw.strip()
+        if value.startswith("./") or value.startswith("docker://"):
+            return cls(raw=value, path=value)
+
+        target, _, ref = value.partition("@")
+        parts = target.split("/", 2)
+        if len(parts) < 2:
+            return cls(raw=value, path=value)
+        return cls(
+            raw=value,
+            owner=parts[0],
+            repository=parts[1],
+            path=parts[2] if len(parts) > 2 else "",
+            ref=ref or None,
+        )
+
+    @property
+    def is_local(self) -> bool:
+        """True for a `./` reference not yet resolved with `relative_to`."""
+        return self.owner is None and self.raw.startswith("./")
+
+    @property
+    def is_docker(self) -> bool:
+        return self.raw.startswith("docker://")
+
+    @property
+    def is_workflow(self) -> bool:
+        return self.path.lower().endswith(_WORKFLOW_EXTENSIONS)
+
+    @property
+    def target(self) -> str:
+        """The referenced workflow or action without its ref, in lower case."""
+        if self.owner is None:
+            return self.path.lower()
+        return "/".join(
+            part for part in [self.owner, self.repository, self.path] if part
+        ).lower()
+
+    def relative_to(
+        self, owner: str, repository: str, ref: Optional[str] = None
+    ) -> "UsesReference":
+        """
+        Resolve a local `./` reference against the repository, and ref, of
+        the file that contains it. Other references are returned unchanged.
+        """
+        if not self.is_local:
+            return self
+        return UsesReference(
+            raw=self.raw,
+            owner=owner,
+            repository=repository,
+            path=self.path[2:].strip("/"),
+            ref=ref,
+        )
+
+
+def _reference(value: object) -> Optional[UsesReference]:
+    return UsesReference.parse(value) if isinstance(value, str) else None
+
+
+@dataclass
+class Step:
+    name: Optional[str] = None
+    uses: Optional[UsesReference] = None
+    run: Optional[str] = None
+
+
+@dataclass
+class Job:
+    id: str
+    name: Optional[str] = None
+    # Set when the job calls a reusable workflow instead of running steps
+    uses: Optional[UsesReference] = None
+    steps: List[Step] = field(default_factory=list)
+
+
+@dataclass
+class Workflow:
+    name: Optional[str] = None
+    jobs: List[Job] = field(default_factory=list)
+
+    def references(self) -> Iterator[UsesReference]:
+        for job in self.jobs:
+            if job.uses is not None:
+                yield job.uses
+            for step in job.steps:
+                if step.uses is not None:
+                    yield step.uses
+
+
+@dataclass
+class Action:
+    name: Optional[str] = None
+    using: Optional[str] = None
+    steps: List[Step] = field(default_factory=list)
+
+    @property
+    def is_composite(self) -> bool:
+        return self.using == "composite"
+
+    def references(self) -> Iterator[UsesReference]:
+        for step in self.steps:
+            if step.uses is not None:
+                yield step.uses
+
+
+def _load(text: str) -> Optional[dict]:
+    try:
+        document = yaml.safe_load(text)
+    except yaml.YAMLError as error:
+        logger.debug(f"Unable to parse YAML: {error}")
+        return None
+    return document if isinstance(document, dict) else None
+
+
+def _steps(values: object) -> List[Step]:
+    if not isinstance(values, list):
+        return []
+    return [
+        Step(
+            name=value.get("name"),
+            uses=_reference(value.get("uses")),
+            run=value.get("run"),
+        )
+        for value in values
+        if isinstance(value, dict)
+    ]
+
+
+def parse_workflow(text: str) -> Optional[Workflow]:
+    """
+    Parse a workflow file.
+
+    Returns:
+        The workflow, or None when the text is not a valid workflow; GitHub
+        would not run such a file either
+    """
+    document = _load(text)
+    if document is None:
+        return None
+
+    jobs = document.get("jobs")
+    if not isinstance(jobs, dict):
+        jobs = {}
+
+    return Workflow(
+        name=document.get("name"),
+        jobs=[
+            Job(
+                id=str(job_id),
+                name=job.get("name"),
+                uses=_reference(job.get("uses")),
+                steps=_steps(job.get("steps")),
+            )
+            for job_id, job in jobs.items()
+            if isinstance(job, dict)
+        ],
+    )
+
+
+def parse_action(text: str) -> Optional[Action]:
+    """Parse an `action.yml` file. Only composite actions have steps."""
+    document = _load(text)
+    if document is None:
+        return None
+
+    runs = document.get("runs")
+    if not isinstance(runs, dict):
+        runs = {}
+
+    return Action(
+        name=document.get("name"),
+        using=runs.get("using"),
+        steps=_steps(runs.get("steps")),
+    )
+
+
+@dataclass(frozen=True)
+class UsesCheck:
+    """
+    A checklist item that passes when a workflow, directly or through the
+    reusable workflows and composite actions it calls, uses any of `targets`.
+    """
+
+    item: dict
+    targets: Tuple[str, ...]
+
+    def passed(self, references: Iterable[UsesReference]) -> bool:
+        targets = {target.lower() for target in self.targets}
+        return any(reference.target in targets for reference in references)
+
+
+# To add a check on the workflows and actions that are used, add a CHECKLIST
+# item and register its targets here.
+USES_CHECKS: List[UsesCheck] = [
+    UsesCheck(
+        CHECKLIST.APPROVED_ACTIONS,
+        ("ed-fi-alliance-oss/ed-fi-actions/.github/workflows/repository-scanner.yml",),
+    ),
+    UsesCheck(
+        CHECKLIST.TEST_REPORTER,
+        ("dorny/test-reporter", "EnricoMi/publish-unit-test-result-action"),
+    ),
+]
@@ -0,0 +1,145 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+"""
+Single-pass evaluation of the workflow checklist items.
+
+Each check declares a short prefix that every one of its matches begins with.
+The prefixes of all checks are compiled into one alternation and searched for
+in the lower-cased workflow, so a file is scanned once no matter how many
+checks are registered. Only the places where a prefix is found are tested
+against the full pattern of its check.
+
+The result is a bitmap with one bit per check, in registration order.
+"""
+
+import hashlib
+import json
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Pattern, Sequence
+
+from edfi_repo_auditor.checklist import CHECKLIST
+
+
+@dataclass(frozen=True)
+class WorkflowCheck:
+    """
+    A checklist item that passes when `pattern` is found in any workflow.
+
+    `prefix` is a regular expression that matches the start of every match of
+    `pattern` once both are lower-cased. It must not contain capturing groups,
+    which would stop the regular expression engine from skipping quickly to
+    candidate positions.
+    """
+
+    item: dict
+    prefix: str
+    pattern: str
+    ignore_case: bool = False
+
+
+def literal(*texts: str) -> str:
+    """Pattern matching any of `texts` exactly."""
+    return "|".join(re.escape(text) for text in texts)
+
+
+# To add a check on the text of workflows, add a CHECKLIST item and register
+# its pattern here. Checks on the workflows and actions used are registered in
+# `workflow_model.USES_CHECKS`.
+WORKFLOW_CHECKS: List[WorkflowCheck] = [
+    WorkflowCheck(
+        CHECKLIST.UNIT_TESTS, "unit", r"unit.{0,2}test(s)?", ignore_case=True
+    ),
+]
+
+
+class WorkflowScanner:
+    def __init__(self, checks: Sequence[WorkflowCheck] = WORKFLOW_CHECKS):
+        if not checks:
+            raise ValueError("checks cannot be empty")
+
+        self.checks = list(checks)
+        self.all_passed = (1 << len(self.checks)) - 1
+        # Identifies the registered checks, so that a stored bitmap is never
+        # read against a different set of checks.
+        checks_json = json.dumps(
+            [
+                [
+                    check.item["description"],
+                    check.prefix,
+                    check.pattern,
+                    check.ignore_case,
+                ]
+                for check in self.checks
+            ]
+        )
+        self.signature = hashlib.sha256(checks_json.encode("utf-8")).hexdigest()
+        self._prefixes = [re.compile(check.prefix) for check in self.checks]
+        for check, prefix in zip(self.checks, self._prefixes):
+            if prefix.groups or prefix.match(""):
+                raise ValueError(
+                    f"Prefix of {check.item['description']} must match text "
+                    "and have no capturing groups"
+                )
+        self._patterns = [
+            re.compile(check.pattern, re.IGNORECASE if check.ignore_case else 0)
+            for check in self.checks
+        ]
+        self._prefilters: Dict[int, Pattern[str]] = {}
+
+    def _prefilter(self, found: int) -> Pattern[str]:
+        """Alternation of the prefixes of the checks not yet set in `found`."""
+        prefilter = self._prefilters.get(found)
+        if prefilter is None:
+            prefilter = re.compile(
+                "|".join(
+                    f"(?:{check.prefix})"
+                    for index, check in enumerate(self.checks)
+                    if not found & (1 << index)
+                )
+            )
+            self._prefilters[found] = prefilter
+        return prefilter
+
+    def scan(self, text: str, found: int = 0) -> int:
+        """
+        Scan `text` for every check not already set in `found`.
+
+        Returns:
+            `found` with the bit of each check matched in `text` set
+        """
+        if found == self.all_passed:
+            return found
+
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # A few characters change length when lowered, so positions in
+            # the lowered text no longer line up; search check by check.
+            for index, pattern in enumerate(self._patterns):
+                if not found & (1 << index) and pattern.search(text):
+                    found |= 1 << index
+            return found
+
+        position = 0
+        while found != self.all_passed:
+            candidate = self._prefilter(found).search(lowered, position)
+            if candidate is None:
+                break
+
+            start = candidate.start()
+            for index, pattern in enumerate(self._patterns):
+                if (
+                    not found & (1 << index)
+                    and self._prefixes[index].match(lowered, start)
+                    and pattern.match(text, start)
+                ):
+                    found |= 1 << index
+            position = start + 1
+
+        return found
+
+    def passed(self, found: int, check: WorkflowCheck) -> bool:
+        return bool(found & (1 << self.checks.index(check)))
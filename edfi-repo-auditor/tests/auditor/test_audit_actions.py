@@ -5,121 +5,303 @@
 
 import pytest
 
+from typing import Dict
 from unittest.mock import patch
-from edfi_repo_auditor.auditor import audit_actions
+from edfi_repo_auditor.actions_index import ActionsIndex
+from edfi_repo_auditor.auditor import WORKFLOW_FETCHES_SKIPPED_KEY, audit_actions
 from edfi_repo_auditor.checklist import CHECKLIST, CHECKLIST_DEFAULT_SUCCESS_MESSAGE
+from edfi_repo_auditor.rules import plan_audit
+from edfi_repo_auditor.workflow_cache import WorkflowCache
 
 ACCESS_TOKEN = "asd09uasdfu09asdfj;iolkasdfklj"
 OWNER = "Ed-Fi-Alliance-OSS"
 REPO = "Ed-Fi-ODS"
 
 
+def _workflows(mock_client, files: Dict[str, str]) -> None:
+    mock_client.get_workflow_tree.return_value = [
+        {"name": name, "path": f".github/workflows/{name}", "oid": name}
+        for name in files
+    ]
+    mock_client.get_blob_texts.side_effect = lambda owner, repo, oids: {
+        oid: files[oid] for oid in oids
+    }
+    mock_client.get_workflow_files.side_effect = lambda owner, repos: {
+        repo: {f".github/workflows/{name}": text for name, text in files.items()}
+        for repo in repos
+    }
+    mock_client.get_file_content.return_value = None
+
+
 def describe_when_auditing_actions() -> None:
     def describe_given_reviewing_allowed_list() -> None:
-        @pytest.fixture
-        def actions() -> dict:
-            return {"total_count": 1, "workflows": [{"path": "test-action.yml"}]}
-
         @patch("edfi_repo_auditor.github_client.GitHubClient")
-        def it_returns_fail_message_when_uses_any_action(
-            mock_client, actions: dict
-        ) -> None:
+        def it_returns_fail_message_when_uses_any_action(mock_client) -> None:
             file_content = """
-                - name: Scan
-                  uses: fake-action/allowed-list
-            """
-            mock_client.get_actions.return_value = actions
-            mock_client.get_file_content.return_value = file_content
+jobs:
+  scan:
+    steps:
+      - name: Scan
+        uses: fake-action/allowed-list
+"""
+            _workflows(mock_client, {"test-action.yml": file_content})
             results = audit_actions(mock_client, OWNER, REPO)
             assert (
-                results[CHECKLIST.APPROVED_ACTIONS["description"]]
+                results.render()[CHECKLIST.APPROVED_ACTIONS["description"]]
                 == CHECKLIST.APPROVED_ACTIONS["fail"]
             )
 
         @patch("edfi_repo_auditor.github_client.GitHubClient")
-        def it_returns_success_message_when_uses_approved_actions(
-            mock_client, actions: dict
-        ) -> None:
+        def it_returns_success_message_when_uses_approved_actions(mock_client) -> None:
             file_content = """
-                - name: Scan
-                  uses: ed-fi-alliance-oss/ed-fi-actions/.github/workflows/repository-scanner.yml
-            """
-            mock_client.get_actions.return_value = actions
-            mock_client.get_file_content.return_value = file_content
+jobs:
+  scan:
+    uses: ed-fi-alliance-oss/ed-fi-actions/.github/workflows/repository-scanner.yml@main
+"""
+            _workflows(mock_client, {"test-action.yml": file_content})
             results = audit_actions(mock_client, OWNER, REPO)
             assert (
-                results[CHECKLIST.APPROVED_ACTIONS["description"]]
+                results.render()[CHECKLIST.APPROVED_ACTIONS["description"]]
                 == CHECKLIST_DEFAULT_SUCCESS_MESSAGE
             )
 
     def describe_given_reviewing_test_reporter() -> None:
-        @pytest.fixture
-        def actions() -> dict:
-            return {"total_count": 1, "workflows": [{"path": "test-action.yml"}]}
-
         @patch("edfi_repo_auditor.github_client.GitHubClient")
-        def it_returns_fail_message_when_no_test_reporter(
-            mock_client, actions: dict
-        ) -> None:
+        def it_returns_fail_message_when_no_test_reporter(mock_client) -> None:
             file_content = """
                 - name: Integration Tests
             """
-            mock_client.get_actions.return_value = actions
-            mock_client.get_file_content.return_value = file_content
+            _workflows(mock_client, {"test-action.yml": file_content})
             results = audit_actions(mock_client, OWNER, REPO)
             assert (
-                results[CHECKLIST.TEST_REPORTER["description"]]
+                results.render()[CHECKLIST.TEST_REPORTER["description"]]
                 == CHECKLIST.TEST_REPORTER["fail"]
             )
 
         @patch("edfi_repo_auditor.github_client.GitHubClient")
-        def it_returns_success_message_when_has_test_reporter(
-            mock_client, actions: dict
-        ) -> None:
+        def it_returns_success_message_when_has_test_reporter(mock_client) -> None:
             file_content = """
-                - name: Integration Tests Report
-                uses: dorny/test-reporter
-            """
-            mock_client.get_actions.return_value = actions
-            mock_client.get_file_content.return_value = file_content
+jobs:
+  test:
+    steps:
+      - name: Integration Tests Report
+        uses: dorny/test-reporter@v1
+"""
+            _workflows(mock_client, {"test-action.yml": file_content})
             results = audit_actions(mock_client, OWNER, REPO)
             assert (
-                results[CHECKLIST.TEST_REPORTER["description"]]
+                results.render()[CHECKLIST.TEST_REPORTER["description"]]
                 == CHECKLIST_DEFAULT_SUCCESS_MESSAGE
             )
 
     def describe_given_reviewing_unit_tests() -> None:
-        @pytest.fixture
-        def actions() -> dict:
-            return {"total_count": 1, "workflows": [{"path": "test-action.yml"}]}
-
         @patch("edfi_repo_auditor.github_client.GitHubClient")
-        def it_returns_success_message_when_has_unit_tests(
-            mock_client, actions: dict
-        ) -> None:
+        def it_returns_success_message_when_has_unit_tests(mock_client) -> None:
             file_content = """
                 - name: Unit Tests with coverage
             """
-
-            mock_client.get_actions.return_value = actions
-            mock_client.get_file_content.return_value = file_content
+            _workflows(mock_client, {"test-action.yml": file_content})
             results = audit_actions(mock_client, OWNER, REPO)
             assert (
-                results[CHECKLIST.UNIT_TESTS["description"]]
+                results.render()[CHECKLIST.UNIT_TESTS["description"]]
                 == CHECKLIST_DEFAULT_SUCCESS_MESSAGE
             )
 
         @patch("edfi_repo_auditor.github_client.GitHubClient")
-        def it_returns_fail_message_when_no_unit_tests(
-            mock_client, actions: dict
-        ) -> None:
+        def it_returns_fail_message_when_no_unit_tests(mock_client) -> None:
             file_content = """
                 - name: Integration Tests
             """
-            mock_client.get_actions.return_value = actions
-            mock_client.get_file_content.return_value = file_content
+            _workflows(mock_client, {"test-action.yml": file_content})
             results = audit_actions(mock_client, OWNER, REPO)
             assert (
-                results[CHECKLIST.UNIT_TESTS["description"]]
+                results.render()[CHECKLIST.UNIT_TESTS["description"]]
                 == CHECKLIST.UNIT_TESTS["fail"]
             )
+
+    def describe_given_no_workflow_files() -> None:
+        @patch("edfi_repo_auditor.github_client.GitHubClient")
+        def it_returns_fail_message_for_has_actions(mock_client) -> None:
+            _workflows(mock_client, {})
+            results = audit_actions(mock_client, OWNER, REPO)
+            assert (
+                results.render()[CHECKLIST.HAS_ACTIONS["description"]]
+                == CHECKLIST.HAS_ACTIONS["fail"]
+            )
+
+    def describe_given_many_workflow_files() -> None:
+        PASSING = """
+jobs:
+  scan:
+    uses: ed-fi-alliance-oss/ed-fi-actions/.github/workflows/repository-scanner.yml@main
+  test:
+    steps:
+      - name: Unit Tests
+        uses: dorny/test-reporter@v1
+"""
+
+        @pytest.fixture
+        @patch("edfi_repo_auditor.github_client.GitHubClient")
+        def client(mock_client):
+            files = {f"release-{index}.yml": "run: release" for index in range(10)}
+            files["on-pullrequest-test.yml"] = PASSING
+            _workflows(mock_client, files)
+            results = audit_actions(mock_client, OWNER, REPO)
+            return mock_client, results
+
+        def it_reads_likely_matches_first(client) -> None:
+            first_batch = client[0].get_blob_texts.call_args_list[0].args[2]
+            assert first_batch[0] == "on-pullrequest-test.yml"
+
+        def it_stops_once_every_check_passed(client) -> None:
+            assert client[0].get_blob_texts.call_count == 1
+
+        def it_reports_the_skipped_fetches(client) -> None:
+            assert client[1].render()[WORKFLOW_FETCHES_SKIPPED_KEY] == 11 - 4
+
+        def it_reports_the_checks_passed(client) -> None:
+            assert (
+                client[1].render()[CHECKLIST.UNIT_TESTS["description"]]
+                == CHECKLIST_DEFAULT_SUCCESS_MESSAGE
+            )
+
+    def describe_given_a_failing_check() -> None:
+        @patch("edfi_repo_auditor.github_client.GitHubClient")
+        def it_reads_every_file(mock_client) -> None:
+            _workflows(
+                mock_client, {f"build-{index}.yml": "run: build" for index in range(6)}
+            )
+            results = audit_actions(mock_client, OWNER, REPO)
+            assert mock_client.get_blob_texts.call_count == 2
+            assert results.render()[WORKFLOW_FETCHES_SKIPPED_KEY] == 0
+
+    def describe_given_workflows_seen_in_another_repository() -> None:
+        @pytest.fixture
+        @patch("edfi_repo_auditor.github_client.GitHubClient")
+        def client(mock_client):
+            cache = WorkflowCache()
+            _workflows(mock_client, {"test.yml": "- name: Unit Tests"})
+            audit_actions(mock_client, OWNER, "first", cache)
+            mock_client.get_blob_texts.reset_mock()
+
+            results = audit_actions(mock_client, OWNER, REPO, cache)
+            return mock_client, results, cache
+
+        def it_does_not_download_them_again(client) -> None:
+            client[0].get_blob_texts.assert_not_called()
+            assert client[1].render()[WORKFLOW_FETCHES_SKIPPED_KEY] == 1
+
+        def it_reuses_the_scan_results(client) -> None:
+            assert (
+                client[1].render()[CHECKLIST.UNIT_TESTS["description"]]
+                == CHECKLIST_DEFAULT_SUCCESS_MESSAGE
+            )
+
+        def it_records_the_hit(client) -> None:
+            assert client[2].stats() == {"hits": 1, "misses": 1}
+
+    def describe_given_a_workflow_scanned_with_different_checks() -> None:
+        @patch("edfi_repo_auditor.github_client.GitHubClient")
+        def it_scans_the_stored_text_again(mock_client) -> None:
+            cache = WorkflowCache()
+            cache.set("test.yml", {"text": "- name: Unit Tests", "checks": "old"})
+            _workflows(mock_client, {"test.yml": ""})
+
+            results = audit_actions(mock_client, OWNER, REPO, cache)
+
+            mock_client.get_blob_texts.assert_not_called()
+            assert (
+                results.render()[CHECKLIST.UNIT_TESTS["description"]]
+                == CHECKLIST_DEFAULT_SUCCESS_MESSAGE
+            )
+
+    def describe_given_a_test_reporter_used_by_a_composite_action() -> None:
+        @patch("edfi_repo_auditor.github_client.GitHubClient")
+        def it_returns_success_message(mock_client) -> None:
+            _workflows(
+                mock_client,
+                {"test.yml": """
+jobs:
+  test:
+    steps:
+      - uses: ./.github/actions/report
+"""},
+            )
+            mock_client.get_file_content.side_effect = lambda owner, repo, path, ref: (
+                "runs:\n  using: composite\n  steps:\n    - uses: dorny/test-reporter@v1"
+                if path == ".github/actions/report/action.yml"
+                else None
+            )
+
+            results = audit_actions(mock_client, OWNER, REPO)
+
+            assert (
+                results.render()[CHECKLIST.TEST_REPORTER["description"]]
+                == CHECKLIST_DEFAULT_SUCCESS_MESSAGE
+            )
+
+    def describe_given_an_actions_index() -> None:
+        PASSING = """
+jobs:
+  scan:
+    uses: ed-fi-alliance-oss/ed-fi-actions/.github/workflows/repository-scanner.yml@main
+  test:
+    steps:
+      - name: Unit Tests
+        uses: dorny/test-reporter@v1
+"""
+        RELEASE = "jobs:\n  release:\n    steps:\n      - uses: a/b@v1"
+
+        @pytest.fixture
+        @patch("edfi_repo_auditor.github_client.GitHubClient")
+        def client(mock_client, tmp_path):
+            # The checks pass with the first batch, leaving the last release
+            files = {
+                "test.yml": PASSING,
+                **{
+                    f"release-{number}.yml": RELEASE.replace("a/b", f"a/b{number}")
+                    for number in range(4)
+                },
+            }
+            _workflows(mock_client, files)
+            index = ActionsIndex(str(tmp_path / "actions.sqlite"))
+            results = audit_actions(mock_client, OWNER, REPO, actions_index=index)
+            return mock_client, index, results
+
+        def it_indexes_files_the_checks_did_not_need(client) -> None:
+            assert [use.path for use in client[1].find("a/b3")] == [
+                ".github/workflows/release-3.yml"
+            ]
+
+        def it_reads_the_other_files_in_one_query(client) -> None:
+            client[0].get_workflow_files.assert_called_once_with(OWNER, [REPO])
+
+        def it_does_not_count_them_as_fetched_by_the_checks(client) -> None:
+            assert client[2].metrics[WORKFLOW_FETCHES_SKIPPED_KEY] == 1
+
+        def it_does_not_read_indexed_files_again(client) -> None:
+            client[0].get_blob_texts.reset_mock()
+            client[0].get_workflow_files.reset_mock()
+            audit_actions(client[0], OWNER, "copy", actions_index=client[1])
+
+            assert client[0].get_blob_texts.call_count == 1
+            client[0].get_workflow_files.assert_not_called()
+            assert [use.repository for use in client[1].find("a/b3")] == [
+                REPO,
+                "copy",
+            ]
+
+    def describe_given_a_plan_with_only_has_actions() -> None:
+        @patch("edfi_repo_auditor.github_client.GitHubClient")
+        def it_does_not_read_the_workflows(mock_client) -> None:
+            _workflows(mock_client, {"test.yml": "- name: Unit Tests"})
+
+            results = audit_actions(
+                mock_client, OWNER, REPO, plan=plan_audit(["HAS_ACTIONS"])
+            )
+
+            mock_client.get_blob_texts.assert_not_called()
+            assert list(results.render()) == [
+                CHECKLIST.HAS_ACTIONS["description"],
+                WORKFLOW_FETCHES_SKIPPED_KEY,
+            ]
@@ -10,6 +10,7 @@ import pytest
 from unittest.mock import patch
 from edfi_repo_auditor.auditor import ALERTS_WEEKS_SINCE_CREATED, audit_alerts
 from edfi_repo_auditor.checklist import CHECKLIST, CHECKLIST_DEFAULT_SUCCESS_MESSAGE
+from edfi_repo_auditor.results import AuditResult
 
 ACCESS_TOKEN = "asd09uasdfu09asdfj;iolkasdfklj"
 OWNER = "Ed-Fi-Alliance-OSS"
@@ -23,19 +24,19 @@ def describe_when_auditing_alerts() -> None:
 
             @pytest.fixture
             @patch("edfi_repo_auditor.github_client.GitHubClient")
-            def results(mock_client) -> dict:
+            def results(mock_client) -> AuditResult:
                 mock_client.has_dependabot_enabled.return_value = False
                 return audit_alerts(mock_client, OWNER, REPO, ALERTS)
 
-            def it_returns_dependabot_enabled(results: dict) -> None:
+            def it_returns_dependabot_enabled(results: AuditResult) -> None:
                 assert (
-                    results[CHECKLIST.DEPENDABOT_ENABLED["description"]]
+                    results.render()[CHECKLIST.DEPENDABOT_ENABLED["description"]]
                     == CHECKLIST.DEPENDABOT_ENABLED["fail"]
                 )
 
-            def it_returns_no_alerts(results: dict) -> None:
+            def it_returns_no_alerts(results: AuditResult) -> None:
                 assert (
-                    results[CHECKLIST.DEPENDABOT_ALERTS["description"]]
+                    results.render()[CHECKLIST.DEPENDABOT_ALERTS["description"]]
                     == CHECKLIST_DEFAULT_SUCCESS_MESSAGE
                 )
 
@@ -44,13 +45,13 @@ def describe_when_auditing_alerts() -> None:
 
             @pytest.fixture
             @patch("edfi_repo_auditor.github_client.GitHubClient")
-            def results(mock_client) -> dict:
+            def results(mock_client) -> AuditResult:
                 mock_client.has_dependabot_enabled.return_value = True
                 return audit_alerts(mock_client, OWNER, REPO, ALERTS)
 
-            def it_returns_dependabot_enabled(results: dict) -> None:
+            def it_returns_dependabot_enabled(results: AuditResult) -> None:
                 assert (
-                    results[CHECKLIST.DEPENDABOT_ENABLED["description"]]
+                    results.render()[CHECKLIST.DEPENDABOT_ENABLED["description"]]
                     == CHECKLIST_DEFAULT_SUCCESS_MESSAGE
                 )
 
@@ -59,13 +60,13 @@ def describe_when_auditing_alerts() -> None:
 
             @pytest.fixture
             @patch("edfi_repo_auditor.github_client.GitHubClient")
-            def results(mock_client) -> dict:
+            def results(mock_client) -> AuditResult:
                 mock_client.has_dependabot_enabled.return_value = True
                 return audit_alerts(mock_client, OWNER, REPO, ALERTS)
 
-            def it_returns_no_alerts(results: dict) -> None:
+            def it_returns_no_alerts(results: AuditResult) -> None:
                 assert (
-                    results[CHECKLIST.DEPENDABOT_ENABLED["description"]]
+                    results.render()[CHECKLIST.DEPENDABOT_ENABLED["description"]]
                     == CHECKLIST_DEFAULT_SUCCESS_MESSAGE
                 )
 
@@ -84,13 +85,13 @@ def describe_when_auditing_alerts() -> None:
 
             @pytest.fixture
             @patch("edfi_repo_auditor.github_client.GitHubClient")
-            def results(mock_client) -> dict:
+            def results(mock_client) -> AuditResult:
                 mock_client.get_repository_information.return_value = True
                 return audit_alerts(mock_client, OWNER, REPO, ALERTS)
 
-            def it_returns_no_alerts(results: dict) -> None:
+            def it_returns_no_alerts(results: AuditResult) -> None:
                 assert (
-                    results[CHECKLIST.DEPENDABOT_ALERTS["description"]]
+                    results.render()[CHECKLIST.DEPENDABOT_ALERTS["description"]]
                     == CHECKLIST_DEFAULT_SUCCESS_MESSAGE
                 )
 
@@ -118,13 +119,13 @@ def describe_when_auditing_alerts() -> None:
 
             @pytest.fixture
             @patch("edfi_repo_auditor.github_client.GitHubClient")
-            def results(mock_client) -> dict:
+            def results(mock_client) -> AuditResult:
                 mock_client.get_repository_information.return_value = True
                 return audit_alerts(mock_client, OWNER, REPO, ALERTS)
 
-            def it_returns_no_alerts(results: dict) -> None:
+            def it_returns_no_alerts(results: AuditResult) -> None:
                 assert (
-                    results[CHECKLIST.DEPENDABOT_ALERTS["description"]]
+                    results.render()[CHECKLIST.DEPENDABOT_ALERTS["description"]]
                     == CHECKLIST_DEFAULT_SUCCESS_MESSAGE
                 )
 
@@ -143,13 +144,13 @@ def describe_when_auditing_alerts() -> None:
 
             @pytest.fixture
             @patch("edfi_repo_auditor.github_client.GitHubClient")
-            def results(mock_client) -> dict:
+            def results(mock_client) -> AuditResult:
                 mock_client.has_dependabot_enabled.return_value = True
                 return audit_alerts(mock_client, OWNER, REPO, ALERTS)
 
-            def it_returns_no_alerts(results: dict) -> None:
+            def it_returns_no_alerts(results: AuditResult) -> None:
                 assert (
-                    results[CHECKLIST.DEPENDABOT_ALERTS["description"]]
+                    results.render()[CHECKLIST.DEPENDABOT_ALERTS["description"]]
                     == CHECKLIST_DEFAULT_SUCCESS_MESSAGE
                 )
 
@@ -168,13 +169,13 @@ def describe_when_auditing_alerts() -> None:
 
             @pytest.fixture
             @patch("edfi_repo_auditor.github_client.GitHubClient")
-            def results(mock_client) -> dict:
+            def results(mock_client) -> AuditResult:
                 mock_client.get_repository_information.return_value = True
                 return audit_alerts(mock_client, OWNER, REPO, ALERTS)
 
-            def it_returns_warning(results: dict) -> None:
+            def it_returns_warning(results: AuditResult) -> None:
                 assert (
-                    results[CHECKLIST.DEPENDABOT_ALERTS["description"]]
+                    results.render()[CHECKLIST.DEPENDABOT_ALERTS["description"]]
                     == CHECKLIST.DEPENDABOT_ALERTS["fail"]
                 )
 
@@ -193,12 +194,12 @@ def describe_when_auditing_alerts() -> None:
 
             @pytest.fixture
             @patch("edfi_repo_auditor.github_client.GitHubClient")
-            def results(mock_client) -> dict:
+            def results(mock_client) -> AuditResult:
                 mock_client.get_repository_information.return_value = True
                 return audit_alerts(mock_client, OWNER, REPO, ALERTS)
 
-            def it_returns_warning(results: dict) -> None:
+            def it_returns_warning(results: AuditResult) -> None:
                 assert (
-                    results[CHECKLIST.DEPENDABOT_ALERTS["description"]]
+                    results.render()[CHECKLIST.DEPENDABOT_ALERTS["description"]]
                     == CHECKLIST.DEPENDABOT_ALERTS["fail"]
                 )
@@ -6,7 +6,10 @@
 import pytest
 
 from unittest.mock import patch
-from edfi_repo_auditor.auditor import get_repo_information
+from edfi_repo_auditor.auditor import audit_stages, get_repo_information
+from edfi_repo_auditor.results import AuditResult
+from edfi_repo_auditor.rules import plan_audit
+from edfi_repo_auditor.stage_memo import StageMemo
 
 ACCESS_TOKEN = "asd09uasdfu09asdfj;iolkasdfklj"
 OWNER = "Ed-Fi-Alliance-OSS"
@@ -31,14 +34,14 @@ def describe_when_getting_repo_info() -> None:
             @pytest.fixture
             @patch("edfi_repo_auditor.auditor.audit_alerts")
             @patch("edfi_repo_auditor.github_client.GitHubClient")
-            def results(mock_audit_alerts, mock_client) -> dict:
+            def results(mock_client, mock_audit_alerts) -> AuditResult:
                 mock_client.get_repository_information.return_value = RESPONSE
-                mock_audit_alerts.return_value = {}
+                mock_audit_alerts.return_value = AuditResult()
                 return get_repo_information(mock_client, OWNER, REPO)
 
-            def it_returns_no_rules(results: dict) -> None:
+            def it_returns_no_rules(results: AuditResult) -> None:
                 assert (
-                    str(results)
+                    str(results.render())
                     == "{'Wiki Disabled': '✅ OK', 'Issues Enabled': '⚠️ WARNING: Issues are not enabled', 'Projects Disabled': '✅ OK', 'Deletes head branch': '❌ FAILED: Branch should be deleted on merge', 'Uses Squash Merge': '✅ OK', 'License Information': '❌ FAILED: License not found'}"
                 )
 
@@ -65,14 +68,14 @@ def describe_when_getting_repo_info() -> None:
             @pytest.fixture
             @patch("edfi_repo_auditor.auditor.audit_alerts")
             @patch("edfi_repo_auditor.github_client.GitHubClient")
-            def results(mock_audit_alerts, mock_client) -> dict:
+            def results(mock_client, mock_audit_alerts) -> AuditResult:
                 mock_client.get_repository_information.return_value = RESPONSE
-                mock_audit_alerts.return_value = {}
+                mock_audit_alerts.return_value = AuditResult()
                 return get_repo_information(mock_client, OWNER, REPO)
 
-            def it_returns_rules_for_main(results: dict) -> None:
+            def it_returns_rules_for_main(results: AuditResult) -> None:
                 assert (
-                    str(results)
+                    str(results.render())
                     == "{'Wiki Disabled': '✅ OK', 'Issues Enabled': '✅ OK', 'Projects Disabled': '✅ OK', 'Deletes head branch': '❌ FAILED: Branch should be deleted on merge', 'Uses Squash Merge': '✅ OK', 'License Information': '❌ FAILED: License not found'}"
                 )
 
@@ -99,13 +102,101 @@ def describe_when_getting_repo_info() -> None:
             @pytest.fixture
             @patch("edfi_repo_auditor.auditor.audit_alerts")
             @patch("edfi_repo_auditor.github_client.GitHubClient")
-            def results(mock_audit_alerts, mock_client) -> dict:
+            def results(mock_client, mock_audit_alerts) -> AuditResult:
                 mock_client.get_repository_information.return_value = RESPONSE
-                mock_audit_alerts.return_value = {}
+                mock_audit_alerts.return_value = AuditResult()
                 return get_repo_information(mock_client, OWNER, REPO)
 
-            def it_returns_rules_for_main(results: dict) -> None:
+            def it_returns_rules_for_main(results: AuditResult) -> None:
                 assert (
-                    str(results)
+                    str(results.render())
                     == "{'Wiki Disabled': '✅ OK', 'Issues Enabled': '✅ OK', 'Projects Disabled': '✅ OK', 'Deletes head branch': '❌ FAILED: Branch should be deleted on merge', 'Uses Squash Merge': '✅ OK', 'License Information': '✅ OK'}"
                 )
+
+    def describe_given_prefetched_information() -> None:
+        RESPONSE = {
+            "vulnerabilityAlerts": {"nodes": []},
+            "rulesets": {"nodes": []},
+            "hasWikiEnabled": True,
+            "hasIssuesEnabled": True,
+            "hasProjectsEnabled": False,
+            "deleteBranchOnMerge": True,
+            "squashMergeAllowed": True,
+            "licenseInfo": None,
+        }
+
+        @patch("edfi_repo_auditor.auditor.audit_alerts")
+        @patch("edfi_repo_auditor.github_client.GitHubClient")
+        def it_does_not_query_the_repository(mock_client, mock_audit_alerts) -> None:
+            mock_audit_alerts.return_value = AuditResult()
+            results = get_repo_information(mock_client, OWNER, REPO, RESPONSE)
+
+            mock_client.get_repository_information.assert_not_called()
+            assert results.render()["Wiki Disabled"] == "⚠️ WARNING: Wiki is enabled"
+
+    def describe_given_a_plan_with_only_dependabot_enabled() -> None:
+        @pytest.fixture
+        @patch("edfi_repo_auditor.github_client.GitHubClient")
+        def client(mock_client):
+            mock_client.has_dependabot_enabled.return_value = True
+            results = get_repo_information(
+                mock_client, OWNER, REPO, plan=plan_audit(["DEPENDABOT_ENABLED"])
+            )
+            return mock_client, results
+
+        def it_does_not_query_the_repository(client) -> None:
+            client[0].get_repository_information.assert_not_called()
+
+        def it_returns_only_that_check(client) -> None:
+            assert client[1].render() == {"Dependabot Enabled": "✅ OK"}
+
+
+def describe_when_planning_the_stages() -> None:
+    def describe_given_only_dependabot_checks() -> None:
+        @patch("edfi_repo_auditor.github_client.GitHubClient")
+        def it_runs_only_the_information_and_settings_stages(mock_client) -> None:
+            stages = audit_stages(
+                mock_client,
+                OWNER,
+                REPO,
+                plan=plan_audit(["DEPENDABOT_ENABLED", "DEPENDABOT_ALERTS"]),
+            )
+            assert [stage.name for stage in stages] == ["information", "repo_config"]
+
+    def describe_given_no_repository_fields() -> None:
+        @patch("edfi_repo_auditor.github_client.GitHubClient")
+        def it_does_not_fetch_the_information(mock_client) -> None:
+            stages = audit_stages(
+                mock_client, OWNER, REPO, plan=plan_audit(["HAS_ACTIONS"])
+            )
+            assert [stage.name for stage in stages] == ["actions"]
+
+    def describe_given_a_stage_memo() -> None:
+        @patch("edfi_repo_auditor.github_client.GitHubClient")
+        def it_fingerprints_the_stages_with_the_information(mock_client) -> None:
+            stages = audit_stages(
+                mock_client,
+                OWNER,
+                REPO,
+                plan=plan_audit(["HAS_ACTIONS"]),
+                stage_memo=StageMemo(),
+            )
+            assert [(stage.name, stage.requires) for stage in stages] == [
+                ("information", ()),
+                ("actions", ("information",)),
+            ]
+
+        @patch("edfi_repo_auditor.github_client.GitHubClient")
+        def it_fetches_the_fingerprint_fields(mock_client) -> None:
+            stages = audit_stages(
+                mock_client,
+                OWNER,
+                REPO,
+                plan=plan_audit(["HAS_ACTIONS"]),
+                stage_memo=StageMemo(),
+            )
+            stages[0].run({})
+
+            mock_client.get_repository_information.assert_called_once_with(
+                OWNER, REPO, ["githubTree"]
+            )
@@ -5,7 +5,10 @@
 
 import requests_mock
 
-from edfi_repo_auditor.ossf_score import get_ossf_score
+import pytest
+import requests
+
+from edfi_repo_auditor.ossf_score import fetch_ossf_score, get_ossf_score
 
 
 def _build_url(org: str, repo: str) -> str:
@@ -69,3 +72,15 @@ def describe_get_ossf_score() -> None:
                 result = get_ossf_score(org, repo)
 
             assert result == {"OSSF Score": None}
+
+
+def describe_fetch_ossf_score() -> None:
+    def describe_given_http_error_500() -> None:
+        def it_raises_the_failure() -> None:
+            with requests_mock.Mocker() as mock:
+                org = "Ed-Fi"
+                repo = "Repo"
+                mock.get(_build_url(org, repo), status_code=500)
+
+                with pytest.raises(requests.RequestException):
+                    fetch_ossf_score(org, repo)
@@ -8,6 +8,8 @@ import pytest
 from unittest.mock import patch
 from edfi_repo_auditor.auditor import review_files
 from edfi_repo_auditor.checklist import CHECKLIST, CHECKLIST_DEFAULT_SUCCESS_MESSAGE
+from edfi_repo_auditor.results import AuditResult
+from edfi_repo_auditor.rules import plan_audit
 
 ACCESS_TOKEN = "asd09uasdfu09asdfj;iolkasdfklj"
 OWNER = "Ed-Fi-Alliance-OSS"
@@ -23,12 +25,16 @@ def describe_when_reviewing_files() -> None:
 
         @pytest.fixture
         @patch("edfi_repo_auditor.github_client.GitHubClient")
-        def results(mock_client) -> dict:
-            mock_client.get_file_content.return_value = "Found"
+        def results(mock_client) -> AuditResult:
+            mock_client.get_repository_files.return_value = [
+                ".github/code_of_conduct.md",
+                "NOTICES.md",
+                "README.md",
+            ]
             return review_files(mock_client, OWNER, REPO)
 
-        def it_returns_success_message(results: dict) -> None:
-            assert results == FILES
+        def it_returns_success_message(results: AuditResult) -> None:
+            assert results.render() == FILES
 
     def describe_given_files_not_found() -> None:
         FILES = {
@@ -38,10 +44,39 @@ def describe_when_reviewing_files() -> None:
 
         @pytest.fixture
         @patch("edfi_repo_auditor.github_client.GitHubClient")
-        def results(mock_client) -> dict:
-            mock_client.get_file_content.return_value = None
+        def results(mock_client) -> AuditResult:
+            mock_client.get_repository_files.return_value = ["README.md"]
             return review_files(mock_client, OWNER, REPO)
 
-        def it_returns_fail_message(results: dict) -> None:
+        def it_returns_fail_message(results: AuditResult) -> None:
             print(results)
-            assert results == FILES
+            assert results.render() == FILES
+
+    def describe_given_prefetched_repository_information() -> None:
+        @pytest.fixture
+        @patch("edfi_repo_auditor.github_client.GitHubClient")
+        def client(mock_client):
+            mock_client.get_repository_files.return_value = []
+            review_files(
+                mock_client,
+                OWNER,
+                REPO,
+                {"defaultBranchRef": {"target": {"oid": "abc123"}}},
+            )
+            return mock_client
+
+        def it_lists_the_head_commit(client) -> None:
+            client.get_repository_files.assert_called_once_with(OWNER, REPO, "abc123")
+
+        def it_lists_the_files_once(client) -> None:
+            client.get_file_content.assert_not_called()
+
+    def describe_given_a_plan_without_file_checks() -> None:
+        @patch("edfi_repo_auditor.github_client.GitHubClient")
+        def it_does_not_list_the_files(mock_client) -> None:
+            results = review_files(
+                mock_client, OWNER, REPO, plan=plan_audit(["HAS_ACTIONS"])
+            )
+
+            mock_client.get_repository_files.assert_not_called()
+            assert results.render() == {}
@@ -0,0 +1,469 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+import asyncio
+import os
+import random
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from typing import Dict, List, Set
+
+import pandas as pd
+import pytest
+from unittest.mock import patch
+
+from edfi_repo_auditor.auditor import (
+    CACHE_SHARES,
+    _cache_bytes,
+    _client_options,
+    run_audit,
+    run_audit_async,
+)
+from edfi_repo_auditor.checklist import CHECKLIST, CHECKLIST_DEFAULT_SUCCESS_MESSAGE
+from edfi_repo_auditor.checkpoint import Checkpoint
+from edfi_repo_auditor.config import Configuration, load_configuration
+from edfi_repo_auditor.github_client import GitHubClient
+from edfi_repo_auditor.pr_metrics import MERGED_PR_COUNT_KEY
+from edfi_repo_auditor.results import AUDIT_ERROR_KEY, AuditResult
+from edfi_repo_auditor.rules import FULL_PLAN
+from edfi_repo_auditor.scoring import SCORE_KEY
+
+ACCESS_TOKEN = "asd09uasdfu09asdfj;iolkasdfklj"
+OWNER = "Ed-Fi-Alliance-OSS"
+REPOSITORIES = [f"repo-{index}" for index in range(8)]
+AUDITED: List[str] = []
+# Checks run for each repository
+PLANS: Dict[str, List[str]] = {}
+AUDIT_THREADS: Set[str] = set()
+
+
+def _audit_repository(
+    client,
+    organization: str,
+    repository: str,
+    information,
+    stage_timings=None,
+    workflow_cache=None,
+    workflow_graph=None,
+    actions_index=None,
+    plan=None,
+    stage_memo=None,
+):
+    AUDITED.append(repository)
+    PLANS[repository] = [rule.name for rule in (plan or FULL_PLAN).rules]
+    AUDIT_THREADS.add(threading.current_thread().name)
+    # Finish in a random order to show that the report order does not depend
+    # on which worker completes first.
+    time.sleep(random.uniform(0, 0.01))
+    if repository == "repo-3":
+        raise RuntimeError("boom")
+    results = AuditResult({MERGED_PR_COUNT_KEY: REPOSITORIES.index(repository)})
+    results.record(CHECKLIST.HAS_ACTIONS, True)
+    return results
+
+
+def describe_when_running_the_audit() -> None:
+    def describe_given_multiple_workers() -> None:
+        @pytest.fixture
+        @patch("edfi_repo_auditor.auditor.output_to_github_actions")
+        @patch("edfi_repo_auditor.auditor.save_to_csv")
+        @patch("edfi_repo_auditor.auditor.audit_repository", _audit_repository)
+        @patch.object(GitHubClient, "get_repositories_information")
+        def report(mock_information, mock_save_to_csv, mock_output) -> pd.DataFrame:
+            mock_information.return_value = {
+                repository: {} for repository in REPOSITORIES
+            }
+            run_audit(
+                Configuration(
+                    OWNER,
+                    ACCESS_TOKEN,
+                    [],
+                    "INFO",
+                    True,
+                    "",
+                    cache_dir="",
+                    workers=4,
+                )
+            )
+            return mock_save_to_csv.call_args.args[0]
+
+        def it_reports_repositories_in_input_order(report: pd.DataFrame) -> None:
+            assert report["repository"].to_list() == REPOSITORIES
+
+        def it_records_a_failed_repository(report: pd.DataFrame) -> None:
+            failed: List[str] = report[report[AUDIT_ERROR_KEY].notna()][
+                "repository"
+            ].to_list()
+            assert failed == ["repo-3"]
+
+        def it_audits_the_remaining_repositories(report: pd.DataFrame) -> None:
+            assert report["Has Actions"].notna().sum() == len(REPOSITORIES) - 1
+            assert report[MERGED_PR_COUNT_KEY].dropna().to_list() == [
+                index for index in range(len(REPOSITORIES)) if index != 3
+            ]
+
+        def it_scores_every_repository(report: pd.DataFrame) -> None:
+            assert report[SCORE_KEY].notna().sum() == len(REPOSITORIES)
+
+    def describe_given_checks_that_need_no_repository_fields() -> None:
+        @pytest.fixture
+        @patch("edfi_repo_auditor.auditor.output_to_github_actions")
+        @patch("edfi_repo_auditor.auditor.audit_repository", _audit_repository)
+        @patch.object(GitHubClient, "get_repositories")
+        @patch.object(GitHubClient, "get_repositories_information")
+        def client(mock_information, mock_repositories, mock_output):
+            mock_repositories.return_value = ["repo-0"]
+            run_audit(
+                Configuration(
+                    OWNER,
+                    ACCESS_TOKEN,
+                    [],
+                    "INFO",
+                    False,
+                    "",
+                    cache_dir="",
+                    checks=["HAS_ACTIONS"],
+                )
+            )
+            return mock_information, mock_repositories
+
+        def it_lists_the_repositories_by_name(client) -> None:
+            client[1].assert_called_once_with(OWNER)
+
+        def it_does_not_query_their_settings(client) -> None:
+            client[0].assert_not_called()
+
+    def describe_given_the_state_of_a_previous_audit() -> None:
+        @pytest.fixture
+        def audited(tmp_path):
+            information = {
+                repository: {"pushedAt": "2026-01-01T00:00:00Z"}
+                for repository in REPOSITORIES[:4]
+            }
+
+            @patch("edfi_repo_auditor.auditor.output_to_github_actions")
+            @patch("edfi_repo_auditor.auditor.audit_repository", _audit_repository)
+            @patch.object(GitHubClient, "get_repositories_information")
+            def audit(mock_information, mock_output, full=False):
+                mock_information.return_value = information
+                AUDITED.clear()
+                run_audit(
+                    Configuration(
+                        OWNER,
+                        ACCESS_TOKEN,
+                        [],
+                        "INFO",
+                        False,
+                        "",
+                        cache_dir="",
+                        state_file=str(tmp_path / "state.json"),
+                        full=full,
+                    )
+                )
+                return {repository: PLANS[repository] for repository in AUDITED}
+
+            audit()
+            information["repo-1"] = {"pushedAt": "2026-02-01T00:00:00Z"}
+            return audit(), audit(full=True)
+
+        def it_audits_only_changed_and_failed_repositories(audited) -> None:
+            full = [rule.name for rule in FULL_PLAN.rules]
+
+            assert sorted(
+                repository
+                for repository, checks in audited[0].items()
+                if checks == full
+            ) == ["repo-1", "repo-3"]
+
+        def it_runs_the_time_dependent_checks_of_the_others_again(audited) -> None:
+            assert {
+                repository: checks
+                for repository, checks in audited[0].items()
+                if repository in ["repo-0", "repo-2"]
+            } == {
+                repository: [
+                    "DEPENDABOT_ENABLED",
+                    "DEPENDABOT_ALERTS",
+                    "PR_METRICS",
+                    "OSSF_SCORE",
+                ]
+                for repository in ["repo-0", "repo-2"]
+            }
+
+        def it_audits_every_repository_when_asked_for_a_full_audit(audited) -> None:
+            full = [rule.name for rule in FULL_PLAN.rules]
+
+            assert audited[1] == {repository: full for repository in REPOSITORIES[:4]}
+
+    def describe_given_an_interrupted_audit() -> None:
+        @pytest.fixture
+        @patch("edfi_repo_auditor.auditor.output_to_github_actions")
+        @patch("edfi_repo_auditor.auditor.save_to_csv")
+        @patch("edfi_repo_auditor.auditor.audit_repository", _audit_repository)
+        @patch.object(GitHubClient, "get_repositories_information")
+        def resumed(mock_information, mock_save_to_csv, mock_output, tmp_path):
+            mock_information.return_value = {
+                repository: {} for repository in REPOSITORIES
+            }
+            path = str(tmp_path / "checkpoint.jsonl")
+            audit = {"organization": OWNER, "repositories": [], "checks": ["WIKI"]}
+            interrupted = Checkpoint(path, audit)
+            earlier = AuditResult()
+            earlier.record(CHECKLIST.HAS_ACTIONS, False)
+            for repository in REPOSITORIES[:2]:
+                interrupted.record(repository, earlier.to_dict())
+            interrupted.close()
+
+            AUDITED.clear()
+            run_audit(
+                Configuration(
+                    OWNER,
+                    ACCESS_TOKEN,
+                    [],
+                    "INFO",
+                    True,
+                    "",
+                    cache_dir="",
+                    checks=["WIKI"],
+                    checkpoint_file=path,
+                    resume=True,
+                )
+            )
+            return mock_save_to_csv.call_args.args[0], path
+
+        def it_skips_the_repositories_already_done(resumed) -> None:
+            assert sorted(AUDITED) == REPOSITORIES[2:]
+
+        def it_reports_every_repository(resumed) -> None:
+            report, _ = resumed
+            assert report["Has Actions"].to_list()[:3] == [
+                CHECKLIST.HAS_ACTIONS["fail"],
+                CHECKLIST.HAS_ACTIONS["fail"],
+                CHECKLIST_DEFAULT_SUCCESS_MESSAGE,
+            ]
+
+        def it_removes_the_checkpoint_once_done(resumed) -> None:
+            _, path = resumed
+            assert not os.path.exists(path)
+
+    def describe_given_the_default_configuration() -> None:
+        @pytest.fixture
+        def configure(tmp_path, monkeypatch):
+            monkeypatch.chdir(tmp_path)
+            for name in ["AUDIT_FILE_NAME", "AUDIT_OUTPUTS", "AUDIT_SAVE_RESULTS"]:
+                monkeypatch.delenv(name, raising=False)
+
+            def configure(*args: str) -> Configuration:
+                return load_configuration(
+                    ["-o", OWNER, "-p", ACCESS_TOKEN, "--cache_dir", ""] + list(args)
+                )
+
+            return configure
+
+        @patch("edfi_repo_auditor.auditor.output_to_github_actions")
+        @patch("edfi_repo_auditor.auditor.audit_repository", _audit_repository)
+        @patch.object(GitHubClient, "get_repositories_information")
+        def it_audits_without_a_file_name(
+            mock_information, mock_output, configure, tmp_path
+        ) -> None:
+            mock_information.return_value = {"repo-0": {}}
+
+            run_audit(configure("-s"))
+
+            assert (tmp_path / "reports" / "audit-result.csv").exists()
+
+        @patch("edfi_repo_auditor.auditor.output_to_github_actions")
+        @patch("edfi_repo_auditor.auditor.audit_repository", _audit_repository)
+        @patch.object(GitHubClient, "get_repositories_information")
+        def it_streams_to_the_default_file_name(
+            mock_information, mock_output, configure, tmp_path
+        ) -> None:
+            mock_information.return_value = {"repo-0": {}}
+
+            run_audit(configure("--outputs", "jsonl"))
+
+            assert (tmp_path / "reports" / "audit-result.jsonl").exists()
+
+    def describe_given_streaming_outputs() -> None:
+        @patch("edfi_repo_auditor.auditor.output_to_github_actions")
+        @patch("edfi_repo_auditor.auditor.audit_repository", _audit_repository)
+        @patch.object(GitHubClient, "get_repositories_information")
+        def it_writes_every_repository_in_order(
+            mock_information, mock_output, tmp_path, monkeypatch
+        ) -> None:
+            monkeypatch.chdir(tmp_path)
+            mock_information.return_value = {
+                repository: {} for repository in REPOSITORIES
+            }
+            run_audit(
+                Configuration(
+                    OWNER,
+                    ACCESS_TOKEN,
+                    [],
+                    "INFO",
+                    False,
+                    "",
+                    cache_dir="",
+                    workers=4,
+                    outputs=["jsonl"],
+                )
+            )
+
+            report = pd.read_json(
+                tmp_path / "reports" / "audit-result.jsonl", lines=True
+            )
+            assert report["repository"].to_list() == REPOSITORIES
+
+    def describe_given_an_organization_summary() -> None:
+        @pytest.fixture
+        def summary(tmp_path, monkeypatch):
+            monkeypatch.chdir(tmp_path)
+            monkeypatch.setenv("GITHUB_STEP_SUMMARY", str(tmp_path / "summary.md"))
+
+            @patch("edfi_repo_auditor.auditor.output_to_github_actions")
+            @patch("edfi_repo_auditor.auditor.audit_repository", _audit_repository)
+            @patch.object(GitHubClient, "get_repositories_information")
+            def run(mock_information, mock_output):
+                mock_information.return_value = {
+                    repository: {} for repository in REPOSITORIES
+                }
+                run_audit(
+                    Configuration(
+                        OWNER,
+                        ACCESS_TOKEN,
+                        [],
+                        "INFO",
+                        False,
+                        "",
+                        cache_dir="",
+                        workers=4,
+                        org_summary=True,
+                    )
+                )
+                return mock_output
+
+            mock_output = run()
+            return mock_output, tmp_path
+
+        def it_writes_no_table_per_repository(summary) -> None:
+            summary[0].assert_not_called()
+
+        def it_writes_one_matrix_with_the_failed_repository_first(summary) -> None:
+            text = (summary[1] / "summary.md").read_text(encoding="utf-8")
+            rows = [line for line in text.splitlines() if line.startswith("| repo-")]
+
+            assert text.count("# Repository Audit Summary") == 1
+            assert len(rows) == len(REPOSITORIES)
+            assert rows[0].startswith("| repo-3 |")
+
+        def it_writes_every_repository_to_the_details_file(summary) -> None:
+            details = (summary[1] / "reports" / "audit-result-details.md").read_text(
+                encoding="utf-8"
+            )
+
+            for repository in REPOSITORIES:
+                assert f"# Repository Audit Results: {repository}\n" in details
+
+
+def describe_when_running_the_audit_asynchronously() -> None:
+    @pytest.fixture
+    @patch("edfi_repo_auditor.auditor.output_to_github_actions")
+    @patch("edfi_repo_auditor.auditor.save_to_csv")
+    @patch("edfi_repo_auditor.auditor.audit_repository", _audit_repository)
+    @patch.object(GitHubClient, "get_repositories_information")
+    def report(mock_information, mock_save_to_csv, mock_output) -> pd.DataFrame:
+        mock_information.return_value = {repository: {} for repository in REPOSITORIES}
+        AUDIT_THREADS.clear()
+        asyncio.run(
+            run_audit_async(
+                Configuration(
+                    OWNER,
+                    ACCESS_TOKEN,
+                    [],
+                    "INFO",
+                    True,
+                    "",
+                    async_mode=True,
+                    max_in_flight=8,
+                    cache_dir="",
+                    workers=2,
+                )
+            )
+        )
+        return mock_save_to_csv.call_args.args[0]
+
+    def it_reports_repositories_in_input_order(report: pd.DataFrame) -> None:
+        assert report["repository"].to_list() == REPOSITORIES
+
+    def it_records_a_failed_repository(report: pd.DataFrame) -> None:
+        assert report[report[AUDIT_ERROR_KEY].notna()]["repository"].to_list() == [
+            "repo-3"
+        ]
+
+    def it_audits_with_the_configured_workers(report: pd.DataFrame) -> None:
+        assert len(AUDIT_THREADS) <= 2
+
+    @patch("edfi_repo_auditor.auditor.output_to_github_actions")
+    @patch("edfi_repo_auditor.auditor.audit_repository", _audit_repository)
+    @patch.object(GitHubClient, "get_repositories_information")
+    def it_writes_every_repository_to_the_sqlite_output(
+        mock_information, mock_output, tmp_path, monkeypatch
+    ) -> None:
+        monkeypatch.chdir(tmp_path)
+        mock_information.return_value = {repository: {} for repository in REPOSITORIES}
+        asyncio.run(
+            run_audit_async(
+                Configuration(
+                    OWNER,
+                    ACCESS_TOKEN,
+                    [],
+                    "INFO",
+                    False,
+                    "",
+                    async_mode=True,
+                    cache_dir="",
+                    workers=2,
+                    outputs=["sqlite"],
+                )
+            )
+        )
+
+        with closing(
+            sqlite3.connect(tmp_path / "reports" / "audit-result.sqlite")
+        ) as connection:
+            rows = connection.execute(
+                "SELECT repository FROM results GROUP BY repository ORDER BY MIN(rowid)"
+            ).fetchall()
+        assert [row[0] for row in rows] == REPOSITORIES
+
+
+def describe_when_sizing_the_connection_pool() -> None:
+    def it_keeps_a_connection_for_every_concurrent_stage() -> None:
+        config = Configuration(
+            OWNER, ACCESS_TOKEN, [], "INFO", False, "", cache_dir="", workers=4
+        )
+
+        assert _client_options(config)["pool_size"] == 4 * len(FULL_PLAN.stages)
+
+    def it_keeps_the_configured_size_when_larger() -> None:
+        config = Configuration(
+            OWNER, ACCESS_TOKEN, [], "INFO", False, "", pool_size=50, cache_dir=""
+        )
+
+        assert _client_options(config)["pool_size"] == 50
+
+
+def describe_when_sizing_the_caches() -> None:
+    def it_keeps_the_caches_together_within_the_configured_size() -> None:
+        config = Configuration(
+            OWNER, ACCESS_TOKEN, [], "INFO", False, "", cache_max_mb=100
+        )
+
+        sizes = [_cache_bytes(config, name) for name in CACHE_SHARES]
+
+        assert all(size > 0 for size in sizes)
+        assert sum(sizes) <= 100 * 1024 * 1024
@@ -0,0 +1,98 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+import asyncio
+import threading
+import time
+from http import HTTPStatus
+from typing import Optional
+import pytest
+import requests_mock
+
+from edfi_repo_auditor.async_github_client import AsyncGitHubClient
+from edfi_repo_auditor.github_client import API_URL
+
+ACCESS_TOKEN = "asd09uasdfu09asdfj;iolkasdfklj"
+OWNER = "Ed-Fi-Alliance-OSS"
+REPO = "Ed-Fi-ODS"
+DEPENDABOT_URL = f"{API_URL}/repos/{OWNER}/{REPO}/vulnerability-alerts"
+FILES_URL = f"{API_URL}/repos/{OWNER}/{REPO}/contents"
+
+
+def describe_when_using_the_async_client() -> None:
+    def describe_given_invalid_in_flight_limit() -> None:
+        def it_raises_a_ValueError() -> None:
+            with pytest.raises(ValueError):
+                AsyncGitHubClient(ACCESS_TOKEN, max_in_flight=0)
+
+    def describe_given_a_valid_call() -> None:
+        @pytest.fixture
+        def result() -> bool:
+            async def call() -> bool:
+                async with AsyncGitHubClient(ACCESS_TOKEN) as client:
+                    return await client.has_dependabot_enabled(OWNER, REPO)
+
+            with requests_mock.Mocker() as m:
+                m.get(DEPENDABOT_URL, status_code=HTTPStatus.NO_CONTENT)
+                return asyncio.run(call())
+
+        def it_returns_the_synchronous_result(result: bool) -> None:
+            assert result is True
+
+    def describe_given_many_concurrent_calls() -> None:
+        LIMIT = 3
+
+        @pytest.fixture
+        def peak() -> int:
+            lock = threading.Lock()
+            state = {"active": 0, "peak": 0}
+
+            def slow_call(
+                owner: str, repository: str, path: str, ref: Optional[str] = None
+            ) -> str:
+                with lock:
+                    state["active"] += 1
+                    state["peak"] = max(state["peak"], state["active"])
+                time.sleep(0.01)
+                with lock:
+                    state["active"] -= 1
+                return path
+
+            async def call() -> None:
+                async with AsyncGitHubClient(ACCESS_TOKEN, max_in_flight=LIMIT) as client:
+                    client.client.get_file_content = slow_call  # type: ignore
+                    await asyncio.gather(
+                        *(
+                            client.get_file_content(OWNER, REPO, f"file{i}.md")
+                            for i in range(12)
+                        )
+                    )
+
+            asyncio.run(call())
+            return state["peak"]
+
+        def it_never_exceeds_the_in_flight_limit(peak: int) -> None:
+            assert 1 < peak <= LIMIT
+
+    def describe_given_a_blocking_view() -> None:
+        @pytest.fixture
+        def result() -> str:
+            async def call() -> str:
+                async with AsyncGitHubClient(ACCESS_TOKEN) as client:
+                    blocking = client.blocking(asyncio.get_running_loop())
+                    return await asyncio.to_thread(
+                        blocking.get_file_content, OWNER, REPO, "README.md"
+                    )
+
+            with requests_mock.Mocker() as m:
+                m.get(
+                    f"{FILES_URL}/README.md",
+                    status_code=HTTPStatus.OK,
+                    text='{"content": "VGVzdA=="}',
+                )
+                return asyncio.run(call())
+
+        def it_returns_results_to_the_worker_thread(result: str) -> None:
+            assert result == "Test"
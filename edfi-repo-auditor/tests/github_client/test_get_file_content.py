@@ -60,6 +60,32 @@ def describe_when_getting_file() -> None:
             def it_returns_the_decoded_file_content(results: str) -> None:
                 assert "Test" == results
 
+        def describe_getting_file_at_a_ref() -> None:
+            FILE_RESULT = """
+{
+    "name": "action.yml",
+    "type": "file",
+    "content": "VGVzdA==",
+    "encoding": "base64"
+}
+""".strip()
+
+            @pytest.fixture
+            def results() -> Optional[str]:
+                # Arrange
+                with requests_mock.Mocker() as m:
+                    m.get(
+                        f"{FILES_URL}/action.yml?ref=v2",
+                        status_code=HTTPStatus.OK,
+                        text=FILE_RESULT,
+                    )
+                    return GitHubClient(ACCESS_TOKEN).get_file_content(
+                        OWNER, REPO, "action.yml", "v2"
+                    )
+
+            def it_returns_the_file_at_that_ref(results: str) -> None:
+                assert "Test" == results
+
         def describe_given_internal_server_error() -> None:
             FILE_RESULT = """
 {
@@ -0,0 +1,129 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from datetime import datetime, timezone
+from http import HTTPStatus
+from typing import List, Tuple
+import pytest
+import requests_mock
+
+from edfi_repo_auditor.github_client import GitHubClient, GRAPHQL_ENDPOINT
+
+ACCESS_TOKEN = "asd09uasdfu09asdfj;iolkasdfklj"
+OWNER = "Ed-Fi-Alliance-OSS"
+REPO = "Ed-Fi-ODS"
+
+
+def _pull_request(number: int, updated_at: str) -> dict:
+    return {
+        "number": number,
+        "createdAt": "2024-01-01T10:00:00Z",
+        "closedAt": "2024-01-02T12:00:00Z",
+        "mergedAt": "2024-01-02T12:00:00Z",
+        "updatedAt": updated_at,
+        "author": {"login": "developer1"},
+        "additions": 50,
+        "deletions": 10,
+        "changedFiles": 3,
+        "reviews": {
+            "nodes": [
+                {
+                    "author": {"login": "reviewer1"},
+                    "state": "APPROVED",
+                    "submittedAt": "2024-01-02T11:00:00Z",
+                }
+            ]
+        },
+    }
+
+
+def _page(nodes: list, has_next_page: bool) -> dict:
+    return {
+        "json": {
+            "data": {
+                "repository": {
+                    "pullRequests": {
+                        "totalCount": 300,
+                        "pageInfo": {"hasNextPage": has_next_page, "endCursor": "next"},
+                        "nodes": nodes,
+                    }
+                }
+            }
+        },
+        "status_code": HTTPStatus.OK,
+    }
+
+
+def describe_when_getting_merged_pull_requests() -> None:
+    def describe_given_blank_owner() -> None:
+        def it_raises_a_ValueError() -> None:
+            with pytest.raises(ValueError):
+                GitHubClient(ACCESS_TOKEN).get_merged_pull_requests("", REPO)
+
+    def describe_given_pull_requests_with_reviews() -> None:
+        @pytest.fixture
+        def results() -> List[dict]:
+            with requests_mock.Mocker() as m:
+                m.post(
+                    GRAPHQL_ENDPOINT,
+                    [
+                        _page([_pull_request(2, "2024-01-05T00:00:00Z")], True),
+                        _page([_pull_request(1, "2024-01-04T00:00:00Z")], False),
+                    ],
+                )
+                return GitHubClient(ACCESS_TOKEN).get_merged_pull_requests(OWNER, REPO)
+
+        def it_returns_every_page(results: List[dict]) -> None:
+            assert [pr["number"] for pr in results] == [2, 1]
+
+        def it_returns_the_size(results: List[dict]) -> None:
+            assert results[0]["changed_files"] == 3
+
+        def it_returns_when_they_were_last_updated(results: List[dict]) -> None:
+            assert results[0]["updated_at"] == "2024-01-05T00:00:00Z"
+
+        def it_returns_the_nested_reviews(results: List[dict]) -> None:
+            assert results[0]["reviews"] == [
+                {
+                    "user": "reviewer1",
+                    "state": "APPROVED",
+                    "submitted_at": "2024-01-02T11:00:00Z",
+                }
+            ]
+
+    def describe_given_a_since_cutoff() -> None:
+        @pytest.fixture
+        def result() -> Tuple[List[dict], int, int]:
+            with requests_mock.Mocker() as m:
+                m.post(
+                    GRAPHQL_ENDPOINT,
+                    [
+                        _page(
+                            [
+                                _pull_request(3, "2024-03-01T00:00:00Z"),
+                                _pull_request(2, "2024-01-05T00:00:00Z"),
+                            ],
+                            True,
+                        ),
+                        _page([_pull_request(1, "2024-01-04T00:00:00Z")], False),
+                    ],
+                )
+                client = GitHubClient(ACCESS_TOKEN)
+                results = client.get_merged_pull_requests(
+                    OWNER,
+                    REPO,
+                    since=datetime(2024, 2, 1, tzinfo=timezone.utc),
+                    page_size=50,
+                )
+                return results, m.call_count, client.pages_skipped
+
+        def it_only_returns_pull_requests_in_the_window(result: tuple) -> None:
+            assert [pr["number"] for pr in result[0]] == [3]
+
+        def it_stops_paging(result: tuple) -> None:
+            assert result[1] == 1
+
+        def it_reports_the_pages_avoided(result: tuple) -> None:
+            assert result[2] == 5
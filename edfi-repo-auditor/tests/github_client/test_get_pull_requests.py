@@ -3,7 +3,9 @@
 # The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
 # See the LICENSE and NOTICES files in the project root for more information.
 
+from datetime import datetime, timezone
 from http import HTTPStatus
+from typing import Tuple
 import pytest
 import requests_mock
 
@@ -170,3 +172,53 @@ def describe_when_getting_pull_requests() -> None:
                     )
                     with pytest.raises(RuntimeError):
                         GitHubClient(ACCESS_TOKEN).get_pull_requests(OWNER, REPO)
+
+        def describe_given_a_since_cutoff() -> None:
+            PAGE1_RESULT = """
+[
+    {
+        "number": 3,
+        "created_at": "2024-03-01T10:00:00Z",
+        "updated_at": "2024-03-02T12:00:00Z",
+        "merged_at": "2024-03-02T12:00:00Z",
+        "user": {"login": "dev1"}
+    },
+    {
+        "number": 2,
+        "created_at": "2024-01-03T10:00:00Z",
+        "updated_at": "2024-01-04T12:00:00Z",
+        "merged_at": "2024-01-04T12:00:00Z",
+        "user": {"login": "dev2"}
+    }
+]
+""".strip()
+
+            @pytest.fixture
+            def result() -> Tuple[list, GitHubClient, list]:
+                with requests_mock.Mocker() as m:
+                    m.get(
+                        f"{PRS_URL}?state=closed&sort=updated&direction=desc&per_page=2&page=1",
+                        status_code=HTTPStatus.OK,
+                        text=PAGE1_RESULT,
+                        headers={
+                            "Link": f'<{PRS_URL}?state=closed&per_page=2&page=2>; rel="next", '
+                            f'<{PRS_URL}?state=closed&per_page=2&page=40>; rel="last"'
+                        },
+                    )
+                    client = GitHubClient(ACCESS_TOKEN)
+                    prs = client.get_pull_requests(
+                        OWNER,
+                        REPO,
+                        per_page=2,
+                        since=datetime(2024, 2, 1, tzinfo=timezone.utc),
+                    )
+                    return prs, client, m.request_history
+
+            def it_returns_only_prs_updated_in_the_window(result: tuple) -> None:
+                assert [pr["number"] for pr in result[0]] == [3]
+
+            def it_stops_paging(result: tuple) -> None:
+                assert len(result[2]) == 1
+
+            def it_reports_the_pages_avoided(result: tuple) -> None:
+                assert result[1].pages_skipped == 39
@@ -29,6 +29,10 @@ def describe_when_getting_repositories() -> None:
       "id": "MDEyOk9yZ2FuaXphdGlvbjYyNzIyMzIw",
       "repositories": {
         "totalCount": 2,
+        "pageInfo": {
+          "hasNextPage": false,
+          "endCursor": "Y3Vyc29yOnYyOpHOAAAAAA=="
+        },
         "nodes": [
           {
             "name": "Ed-Fi-Standard"
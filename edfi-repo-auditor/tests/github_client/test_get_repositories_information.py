@@ -0,0 +1,133 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+import json
+from http import HTTPStatus
+from typing import Dict, Tuple
+import pytest
+import requests_mock
+
+from edfi_repo_auditor.github_client import GitHubClient, GRAPHQL_ENDPOINT
+
+ACCESS_TOKEN = "asd09uasdfu09asdfj;iolkasdfklj"
+OWNER = "Ed-Fi-Alliance-OSS"
+
+
+def _repository(name: str) -> dict:
+    return {
+        "name": name,
+        "vulnerabilityAlerts": {"nodes": []},
+        "rulesets": {"nodes": []},
+        "hasWikiEnabled": False,
+        "hasIssuesEnabled": True,
+        "hasProjectsEnabled": False,
+        "deleteBranchOnMerge": True,
+        "squashMergeAllowed": True,
+        "licenseInfo": {"key": "apache-2.0"},
+    }
+
+
+def _page(names: list, has_next_page: bool, cursor: str) -> dict:
+    return {
+        "json": {
+            "data": {
+                "organization": {
+                    "repositories": {
+                        "pageInfo": {"hasNextPage": has_next_page, "endCursor": cursor},
+                        "nodes": [_repository(name) for name in names],
+                    }
+                }
+            }
+        },
+        "status_code": HTTPStatus.OK,
+    }
+
+
+def describe_when_getting_repositories_information() -> None:
+    def describe_given_blank_owner() -> None:
+        def it_raises_a_ValueError() -> None:
+            with pytest.raises(ValueError):
+                GitHubClient(ACCESS_TOKEN).get_repositories_information("")
+
+    def describe_given_no_repositories_listed() -> None:
+        @pytest.fixture
+        def result() -> Tuple[Dict[str, dict], list]:
+            with requests_mock.Mocker() as m:
+                m.post(
+                    GRAPHQL_ENDPOINT,
+                    [
+                        _page(["Ed-Fi-ODS", "Ed-Fi-Standard"], True, "page-1"),
+                        _page(["Ed-Fi-Docs"], False, "page-2"),
+                    ],
+                )
+                information = GitHubClient(ACCESS_TOKEN).get_repositories_information(
+                    OWNER
+                )
+                return information, m.request_history
+
+        def it_returns_every_repository(result: tuple) -> None:
+            assert list(result[0]) == ["Ed-Fi-ODS", "Ed-Fi-Standard", "Ed-Fi-Docs"]
+
+        def it_returns_the_settings(result: tuple) -> None:
+            assert result[0]["Ed-Fi-Docs"]["deleteBranchOnMerge"] is True
+
+        def it_pages_with_the_cursor(result: tuple) -> None:
+            variables = [r.json()["variables"] for r in result[1]]
+            assert variables == [{"cursor": None}, {"cursor": "page-1"}]
+
+    def describe_given_repositories_listed() -> None:
+        @pytest.fixture
+        def result() -> Tuple[Dict[str, dict], list]:
+            with requests_mock.Mocker() as m:
+                m.post(
+                    GRAPHQL_ENDPOINT,
+                    status_code=HTTPStatus.OK,
+                    text=json.dumps(
+                        {
+                            "data": {
+                                "repo_0": _repository("Ed-Fi-ODS"),
+                                "repo_1": _repository("Ed-Fi-Standard"),
+                            }
+                        }
+                    ),
+                )
+                information = GitHubClient(ACCESS_TOKEN).get_repositories_information(
+                    OWNER, ["Ed-Fi-ODS", "Ed-Fi-Standard"]
+                )
+                return information, m.request_history
+
+        def it_sends_a_single_aliased_query(result: tuple) -> None:
+            assert len(result[1]) == 1
+            query = result[1][0].json()["query"]
+            assert 'repo_1: repository(name: "Ed-Fi-Standard"' in query
+
+        def it_maps_the_aliases_to_repositories(result: tuple) -> None:
+            assert result[0]["Ed-Fi-Standard"]["name"] == "Ed-Fi-Standard"
+
+    def describe_given_fields() -> None:
+        @pytest.fixture
+        def query() -> str:
+            with requests_mock.Mocker() as m:
+                m.post(
+                    GRAPHQL_ENDPOINT,
+                    status_code=HTTPStatus.OK,
+                    text=json.dumps({"data": {"repo_0": _repository("Ed-Fi-ODS")}}),
+                )
+                GitHubClient(ACCESS_TOKEN).get_repositories_information(
+                    OWNER, ["Ed-Fi-ODS"], ["vulnerabilityAlerts"]
+                )
+                return m.request_history[0].json()["query"]
+
+        def it_selects_only_those_fields(query: str) -> None:
+            assert "vulnerabilityAlerts" in query
+            assert "hasWikiEnabled" not in query
+            assert "rulesets" not in query
+
+    def describe_given_an_unknown_field() -> None:
+        def it_raises_a_ValueError() -> None:
+            with pytest.raises(ValueError):
+                GitHubClient(ACCESS_TOKEN).get_repositories_information(
+                    OWNER, ["Ed-Fi-ODS"], ["stargazers"]
+                )
@@ -0,0 +1,93 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+import json
+from http import HTTPStatus
+import pytest
+import requests_mock
+
+from edfi_repo_auditor.disk_cache import DiskCache
+from edfi_repo_auditor.github_client import GitHubClient, GRAPHQL_ENDPOINT
+
+ACCESS_TOKEN = "asd09uasdfu09asdfj;iolkasdfklj"
+OWNER = "Ed-Fi-Alliance-OSS"
+REPO = "Ed-Fi-ODS"
+
+RESPONSE = {
+    "data": {
+        "repository": {
+            "root": {
+                "entries": [
+                    {"name": "README.md", "type": "blob"},
+                    {"name": "src", "type": "tree"},
+                ]
+            },
+            "dir_0": {"entries": [{"name": "CODE_OF_CONDUCT.md", "type": "blob"}]},
+            "dir_1": None,
+        }
+    }
+}
+
+
+def describe_when_getting_repository_files() -> None:
+    def describe_given_blank_repository() -> None:
+        def it_raises_a_ValueError() -> None:
+            with pytest.raises(ValueError):
+                GitHubClient(ACCESS_TOKEN).get_repository_files(OWNER, "")
+
+    def describe_given_a_repository() -> None:
+        @pytest.fixture
+        def result() -> tuple:
+            with requests_mock.Mocker() as m:
+                m.post(
+                    GRAPHQL_ENDPOINT,
+                    status_code=HTTPStatus.OK,
+                    text=json.dumps(RESPONSE),
+                )
+                files = GitHubClient(ACCESS_TOKEN).get_repository_files(
+                    OWNER, REPO, "abc123"
+                )
+                return files, m.request_history
+
+        def it_lists_the_files_in_every_directory(result: tuple) -> None:
+            assert result[0] == [".github/CODE_OF_CONDUCT.md", "README.md"]
+
+        def it_queries_the_requested_commit(result: tuple) -> None:
+            query = result[1][0].json()["query"]
+            assert 'object(expression: "abc123:")' in query
+            assert 'object(expression: "abc123:.github")' in query
+            assert 'object(expression: "abc123:docs")' in query
+
+    def describe_given_a_tree_cache() -> None:
+        def it_lists_each_commit_once(tmp_path) -> None:
+            client = GitHubClient(
+                ACCESS_TOKEN, tree_cache=DiskCache(str(tmp_path), 10_000)
+            )
+            with requests_mock.Mocker() as m:
+                m.post(
+                    GRAPHQL_ENDPOINT,
+                    status_code=HTTPStatus.OK,
+                    text=json.dumps(RESPONSE),
+                )
+                first = client.get_repository_files(OWNER, REPO, "abc123")
+                second = client.get_repository_files(OWNER, REPO, "abc123")
+
+                assert first == second
+                assert m.call_count == 1
+
+        def it_does_not_cache_the_moving_HEAD(tmp_path) -> None:
+            client = GitHubClient(
+                ACCESS_TOKEN, tree_cache=DiskCache(str(tmp_path), 10_000)
+            )
+            with requests_mock.Mocker() as m:
+                m.post(
+                    GRAPHQL_ENDPOINT,
+                    status_code=HTTPStatus.OK,
+                    text=json.dumps(RESPONSE),
+                )
+                client.get_repository_files(OWNER, REPO)
+                client.get_repository_files(OWNER, REPO)
+
+                assert m.call_count == 2
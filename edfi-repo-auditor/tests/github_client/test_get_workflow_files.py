@@ -0,0 +1,82 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+import json
+from http import HTTPStatus
+from typing import Dict, Tuple
+import pytest
+import requests_mock
+
+from edfi_repo_auditor.github_client import GitHubClient, GRAPHQL_ENDPOINT
+
+ACCESS_TOKEN = "asd09uasdfu09asdfj;iolkasdfklj"
+OWNER = "Ed-Fi-Alliance-OSS"
+
+
+def _entry(name: str, text) -> dict:
+    return {
+        "name": name,
+        "path": f".github/workflows/{name}",
+        "object": {"oid": f"oid-{name}", "text": text},
+    }
+
+
+def describe_when_getting_workflow_files() -> None:
+    def describe_given_blank_owner() -> None:
+        def it_raises_a_ValueError() -> None:
+            with pytest.raises(ValueError):
+                GitHubClient(ACCESS_TOKEN).get_workflow_files("", ["Ed-Fi-ODS"])
+
+    def describe_given_blank_repository() -> None:
+        def it_raises_a_ValueError() -> None:
+            with pytest.raises(ValueError):
+                GitHubClient(ACCESS_TOKEN).get_workflow_files(OWNER, [" "])
+
+    def describe_given_two_repositories() -> None:
+        @pytest.fixture
+        def result() -> Tuple[Dict[str, Dict[str, str]], list]:
+            with requests_mock.Mocker() as m:
+                m.post(
+                    GRAPHQL_ENDPOINT,
+                    status_code=HTTPStatus.OK,
+                    text=json.dumps(
+                        {
+                            "data": {
+                                "repo_0": {
+                                    "workflows": {
+                                        "entries": [
+                                            _entry("scan.yml", "uses: scanner"),
+                                            _entry("build.yaml", "run: build"),
+                                            _entry("README.md", "# Workflows"),
+                                            _entry("logo.yml", None),
+                                        ]
+                                    }
+                                },
+                                "repo_1": {"workflows": None},
+                            }
+                        }
+                    ),
+                )
+                files = GitHubClient(ACCESS_TOKEN).get_workflow_files(
+                    OWNER, ["Ed-Fi-ODS", "Ed-Fi-Standard"]
+                )
+                return files, m.request_history
+
+        def it_sends_a_single_query(result: tuple) -> None:
+            assert len(result[1]) == 1
+
+        def it_asks_for_the_workflows_tree(result: tuple) -> None:
+            query = result[1][0].json()["query"]
+            assert 'object(expression: "HEAD:.github/workflows")' in query
+            assert 'repo_1: repository(name: "Ed-Fi-Standard"' in query
+
+        def it_returns_the_workflow_text_by_path(result: tuple) -> None:
+            assert result[0]["Ed-Fi-ODS"] == {
+                ".github/workflows/build.yaml": "run: build",
+                ".github/workflows/scan.yml": "uses: scanner",
+            }
+
+        def it_returns_no_files_when_there_are_no_workflows(result: tuple) -> None:
+            assert result[0]["Ed-Fi-Standard"] == {}
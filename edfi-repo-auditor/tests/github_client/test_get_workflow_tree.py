@@ -0,0 +1,103 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+import json
+from http import HTTPStatus
+import pytest
+import requests_mock
+
+from edfi_repo_auditor.github_client import GitHubClient, GRAPHQL_ENDPOINT
+
+ACCESS_TOKEN = "asd09uasdfu09asdfj;iolkasdfklj"
+OWNER = "Ed-Fi-Alliance-OSS"
+REPO = "Ed-Fi-ODS"
+
+
+def _entry(name: str, type: str = "blob") -> dict:
+    return {
+        "name": name,
+        "path": f".github/workflows/{name}",
+        "oid": f"oid-{name}",
+        "type": type,
+    }
+
+
+def describe_when_getting_the_workflow_tree() -> None:
+    def describe_given_blank_repository() -> None:
+        def it_raises_a_ValueError() -> None:
+            with pytest.raises(ValueError):
+                GitHubClient(ACCESS_TOKEN).get_workflow_tree(OWNER, "")
+
+    def describe_given_workflow_files() -> None:
+        @pytest.fixture
+        def result() -> list:
+            with requests_mock.Mocker() as m:
+                m.post(
+                    GRAPHQL_ENDPOINT,
+                    status_code=HTTPStatus.OK,
+                    text=json.dumps(
+                        {
+                            "data": {
+                                "repository": {
+                                    "workflows": {
+                                        "entries": [
+                                            _entry("scan.yml"),
+                                            _entry("README.md"),
+                                            _entry("build.yml", "tree"),
+                                        ]
+                                    }
+                                }
+                            }
+                        }
+                    ),
+                )
+                return GitHubClient(ACCESS_TOKEN).get_workflow_tree(OWNER, REPO)
+
+        def it_lists_only_workflow_files(result: list) -> None:
+            assert result == [
+                {
+                    "name": "scan.yml",
+                    "path": ".github/workflows/scan.yml",
+                    "oid": "oid-scan.yml",
+                }
+            ]
+
+
+def describe_when_getting_blob_texts() -> None:
+    def describe_given_no_object_ids() -> None:
+        def it_does_not_send_a_query() -> None:
+            with requests_mock.Mocker() as m:
+                assert GitHubClient(ACCESS_TOKEN).get_blob_texts(OWNER, REPO, []) == {}
+                assert m.call_count == 0
+
+    def describe_given_object_ids() -> None:
+        @pytest.fixture
+        def result() -> tuple:
+            with requests_mock.Mocker() as m:
+                m.post(
+                    GRAPHQL_ENDPOINT,
+                    status_code=HTTPStatus.OK,
+                    text=json.dumps(
+                        {
+                            "data": {
+                                "repository": {
+                                    "blob_0": {"text": "on: push"},
+                                    "blob_1": {"text": None},
+                                }
+                            }
+                        }
+                    ),
+                )
+                texts = GitHubClient(ACCESS_TOKEN).get_blob_texts(
+                    OWNER, REPO, ["abc", "def"]
+                )
+                return texts, m.request_history
+
+        def it_sends_a_single_query(result: tuple) -> None:
+            assert len(result[1]) == 1
+            assert 'blob_1: object(oid: "def")' in result[1][0].json()["query"]
+
+        def it_returns_the_text_by_object_id(result: tuple) -> None:
+            assert result[0] == {"abc": "on: push", "def": None}
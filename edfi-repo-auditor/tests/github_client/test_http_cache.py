@@ -0,0 +1,61 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from http import HTTPStatus
+import pytest
+import requests_mock
+
+from edfi_repo_auditor.github_client import GitHubClient, API_URL
+from edfi_repo_auditor.http_cache import HttpCache
+
+ACCESS_TOKEN = "asd09uasdfu09asdfj;iolkasdfklj"
+OWNER = "Ed-Fi-Alliance-OSS"
+REPO = "Ed-Fi-ODS"
+ACTIONS_URL = f"{API_URL}/repos/{OWNER}/{REPO}/actions/workflows"
+ACTIONS_RESULT = '{"total_count": 1, "workflows": [{"path": "build.yml"}]}'
+ETAG = '"abc123"'
+
+
+def describe_when_caching_responses() -> None:
+    def describe_given_a_response_with_an_etag() -> None:
+        @pytest.fixture
+        def cache(tmp_path) -> HttpCache:
+            cache = HttpCache(str(tmp_path))
+            with requests_mock.Mocker() as m:
+                m.get(
+                    ACTIONS_URL,
+                    status_code=HTTPStatus.OK,
+                    text=ACTIONS_RESULT,
+                    headers={"ETag": ETAG},
+                )
+                GitHubClient(ACCESS_TOKEN, cache=cache).get_actions(OWNER, REPO)
+            return cache
+
+        def describe_given_the_resource_is_not_modified() -> None:
+            @pytest.fixture
+            def result(cache: HttpCache) -> tuple:
+                with requests_mock.Mocker() as m:
+                    m.get(ACTIONS_URL, status_code=HTTPStatus.NOT_MODIFIED)
+                    actions = GitHubClient(ACCESS_TOKEN, cache=cache).get_actions(
+                        OWNER, REPO
+                    )
+                    return actions, m.request_history[0]
+
+            def it_sends_the_etag(result: tuple) -> None:
+                assert result[1].headers["If-None-Match"] == ETAG
+
+            def it_returns_the_cached_body(result: tuple) -> None:
+                assert result[0]["workflows"][0]["path"] == "build.yml"
+
+            def it_counts_a_cache_hit(cache: HttpCache, result: tuple) -> None:
+                assert cache.stats() == {"hits": 1, "misses": 1}
+
+        def describe_given_a_different_token() -> None:
+            def it_does_not_send_the_etag(cache: HttpCache) -> None:
+                with requests_mock.Mocker() as m:
+                    m.get(ACTIONS_URL, status_code=HTTPStatus.OK, text=ACTIONS_RESULT)
+                    GitHubClient("another-token", cache=cache).get_actions(OWNER, REPO)
+
+                    assert "If-None-Match" not in m.request_history[0].headers
@@ -0,0 +1,108 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from http import HTTPStatus
+from typing import Optional
+import pytest
+import requests
+import requests_mock
+
+from edfi_repo_auditor.github_client import GitHubClient, API_URL
+from edfi_repo_auditor.log_helper import HttpError
+from edfi_repo_auditor.rate_limit import GRAPHQL, REST
+from edfi_repo_auditor.retry import Retrier, RetryPolicy
+
+ACCESS_TOKEN = "asd09uasdfu09asdfj;iolkasdfklj"
+OWNER = "Ed-Fi-Alliance-OSS"
+REPO = "Ed-Fi-ODS"
+FILES_URL = f"{API_URL}/repos/{OWNER}/{REPO}/contents"
+FILE_RESULT = '{"content": "VGVzdA=="}'
+
+
+def _client(budget: int = 10) -> GitHubClient:
+    policy = RetryPolicy(max_attempts=3, base_delay=0, budget=budget)
+    retrier = Retrier({REST: policy, GRAPHQL: policy}, sleep=lambda _: None)
+    return GitHubClient(ACCESS_TOKEN, retrier=retrier)
+
+
+def describe_when_retrying_calls() -> None:
+    def describe_given_a_transient_gateway_error() -> None:
+        @pytest.fixture
+        def client() -> GitHubClient:
+            return _client()
+
+        @pytest.fixture
+        def result(client: GitHubClient) -> Optional[str]:
+            with requests_mock.Mocker() as m:
+                m.get(
+                    f"{FILES_URL}/README.md",
+                    [
+                        {"status_code": HTTPStatus.BAD_GATEWAY},
+                        {"status_code": HTTPStatus.OK, "text": FILE_RESULT},
+                    ],
+                )
+                return client.get_file_content(OWNER, REPO, "README.md")
+
+        def it_returns_the_retried_result(result: Optional[str]) -> None:
+            assert result == "Test"
+
+        def it_counts_the_retry(client: GitHubClient, result: Optional[str]) -> None:
+            assert client.retrier.stats()[REST]["retries"] == 1
+
+    def describe_given_a_secondary_rate_limit() -> None:
+        def it_retries_the_call() -> None:
+            with requests_mock.Mocker() as m:
+                m.get(
+                    f"{FILES_URL}/README.md",
+                    [
+                        {
+                            "status_code": HTTPStatus.FORBIDDEN,
+                            "text": "You have exceeded a secondary rate limit",
+                        },
+                        {"status_code": HTTPStatus.OK, "text": FILE_RESULT},
+                    ],
+                )
+                assert _client().get_file_content(OWNER, REPO, "README.md") == "Test"
+
+    def describe_given_a_connection_reset() -> None:
+        def it_retries_the_call() -> None:
+            with requests_mock.Mocker() as m:
+                m.get(
+                    f"{FILES_URL}/README.md",
+                    [
+                        {"exc": requests.ConnectionError},
+                        {"status_code": HTTPStatus.OK, "text": FILE_RESULT},
+                    ],
+                )
+                assert _client().get_file_content(OWNER, REPO, "README.md") == "Test"
+
+    def describe_given_a_persistent_gateway_error() -> None:
+        def it_raises_a_retryable_error_instead_of_file_not_found() -> None:
+            with requests_mock.Mocker() as m:
+                m.get(f"{FILES_URL}/README.md", status_code=HTTPStatus.GATEWAY_TIMEOUT)
+
+                with pytest.raises(HttpError) as error:
+                    _client().get_file_content(OWNER, REPO, "README.md")
+
+                assert error.value.retryable is True
+                assert m.call_count == 3
+
+    def describe_given_the_retry_budget_is_spent() -> None:
+        def it_stops_retrying() -> None:
+            with requests_mock.Mocker() as m:
+                m.get(f"{FILES_URL}/README.md", status_code=HTTPStatus.BAD_GATEWAY)
+
+                with pytest.raises(HttpError):
+                    _client(budget=1).get_file_content(OWNER, REPO, "README.md")
+
+                assert m.call_count == 2
+
+    def describe_given_a_missing_file() -> None:
+        def it_does_not_retry() -> None:
+            with requests_mock.Mocker() as m:
+                m.get(f"{FILES_URL}/README.md", status_code=HTTPStatus.NOT_FOUND)
+
+                assert _client().get_file_content(OWNER, REPO, "README.md") is None
+                assert m.call_count == 1
@@ -0,0 +1,58 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from http import HTTPStatus
+import pytest
+import requests_mock
+
+from edfi_repo_auditor.github_client import GitHubClient, API_URL
+
+ACCESS_TOKEN = "asd09uasdfu09asdfj;iolkasdfklj"
+OWNER = "Ed-Fi-Alliance-OSS"
+REPO = "Ed-Fi-ODS"
+ACTIONS_URL = f"{API_URL}/repos/{OWNER}/{REPO}/actions/workflows"
+
+
+def describe_when_using_the_pooled_session() -> None:
+    def describe_given_invalid_pool_size() -> None:
+        def it_raises_a_ValueError() -> None:
+            with pytest.raises(ValueError):
+                GitHubClient(ACCESS_TOKEN, pool_size=0)
+
+    def describe_given_multiple_calls() -> None:
+        @pytest.fixture
+        def history() -> list:
+            with requests_mock.Mocker() as m:
+                m.get(ACTIONS_URL, status_code=HTTPStatus.OK, text="{}")
+                client = GitHubClient(ACCESS_TOKEN)
+                client.get_actions(OWNER, REPO)
+                client.get_actions(OWNER, REPO)
+                return m.request_history
+
+        def it_sends_the_authorization_header(history: list) -> None:
+            assert history[0].headers["Authorization"] == f"bearer {ACCESS_TOKEN}"
+
+        def it_requests_compressed_responses(history: list) -> None:
+            assert "gzip" in history[0].headers["Accept-Encoding"]
+
+        def it_keeps_connections_alive(history: list) -> None:
+            assert history[1].headers["Connection"] == "keep-alive"
+
+    def describe_given_connection_stats() -> None:
+        @pytest.fixture
+        def stats() -> dict:
+            with requests_mock.Mocker() as m:
+                m.get(ACTIONS_URL, status_code=HTTPStatus.OK, text="{}")
+                with GitHubClient(ACCESS_TOKEN) as client:
+                    client.get_actions(OWNER, REPO)
+                    client.get_actions(OWNER, REPO)
+                    client.get_actions(OWNER, REPO)
+                    return client.connection_stats()
+
+        def it_counts_the_requests(stats: dict) -> None:
+            assert stats["requests"] == 3
+
+        def it_reports_reused_connections(stats: dict) -> None:
+            assert stats["reused"] == stats["requests"] - stats["connections"]
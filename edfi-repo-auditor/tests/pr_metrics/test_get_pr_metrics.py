@@ -0,0 +1,70 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from edfi_repo_auditor.pr_metrics import (
+    AVG_APPROVALS_PER_PR_KEY,
+    AVG_TIME_TO_FIRST_APPROVAL_HOURS_KEY,
+    MERGED_PRS_LAST_30_DAYS_KEY,
+    TOTAL_REVIEWS_KEY,
+    get_pr_metrics,
+)
+
+OWNER = "Ed-Fi-Alliance-OSS"
+REPO = "Ed-Fi-ODS"
+
+
+def _iso(moment: datetime) -> str:
+    return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def describe_when_getting_pr_metrics() -> None:
+    NOW = datetime.now(timezone.utc)
+    CREATED = NOW - timedelta(days=2)
+
+    PRS = [
+        {
+            "number": 2,
+            "created_at": _iso(CREATED),
+            "closed_at": _iso(NOW - timedelta(days=1)),
+            "merged_at": _iso(NOW - timedelta(days=1)),
+            "reviews": [
+                {
+                    "user": "reviewer1",
+                    "state": "APPROVED",
+                    "submitted_at": _iso(CREATED + timedelta(hours=3)),
+                }
+            ],
+        },
+        {
+            "number": 1,
+            "created_at": _iso(NOW - timedelta(days=60)),
+            "closed_at": _iso(NOW - timedelta(days=59)),
+            "merged_at": _iso(NOW - timedelta(days=59)),
+            "reviews": [],
+        },
+    ]
+
+    @pytest.fixture
+    @patch("edfi_repo_auditor.github_client.GitHubClient")
+    def results(mock_client) -> dict:
+        mock_client.get_merged_pull_requests.return_value = PRS
+        results = get_pr_metrics(mock_client, OWNER, REPO)
+        mock_client.get_pull_request_reviews.assert_not_called()
+        return results
+
+    def it_counts_only_recent_merged_prs(results: dict) -> None:
+        assert results[MERGED_PRS_LAST_30_DAYS_KEY] == 1
+
+    def it_uses_the_nested_reviews(results: dict) -> None:
+        assert results[TOTAL_REVIEWS_KEY] == 1
+        assert results[AVG_APPROVALS_PER_PR_KEY] == 1
+
+    def it_measures_approval_time_from_pr_creation(results: dict) -> None:
+        assert results[AVG_TIME_TO_FIRST_APPROVAL_HOURS_KEY] == 3
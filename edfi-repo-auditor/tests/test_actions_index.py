@@ -0,0 +1,114 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+import os
+
+import pytest
+
+from edfi_repo_auditor.actions_index import ActionsIndex, ActionUse, main
+
+ORG = "Ed-Fi-Alliance-OSS"
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = ActionsIndex(os.path.join(tmp_path, "index", "actions.sqlite"))
+    index.update(
+        ORG,
+        "first",
+        {".github/workflows/build.yml": "a", ".github/workflows/scan.yml": "b"},
+        {
+            "a": ["actions/checkout@v3", "github/codeql-action/init@v2"],
+            "b": ["Actions/Checkout@v4"],
+        },
+    )
+    index.update(ORG, "second", {".github/workflows/ci.yml": "a"}, {})
+    yield index
+    index.close()
+
+
+def describe_when_finding_an_action() -> None:
+    def describe_given_any_ref() -> None:
+        def it_lists_every_workflow_file(index: ActionsIndex) -> None:
+            assert index.find("actions/checkout") == [
+                ActionUse(
+                    "actions/checkout",
+                    "v3",
+                    ORG,
+                    "first",
+                    ".github/workflows/build.yml",
+                ),
+                ActionUse(
+                    "actions/checkout", "v3", ORG, "second", ".github/workflows/ci.yml"
+                ),
+                ActionUse(
+                    "actions/checkout", "v4", ORG, "first", ".github/workflows/scan.yml"
+                ),
+            ]
+
+    def describe_given_a_ref() -> None:
+        def it_lists_only_that_ref(index: ActionsIndex) -> None:
+            assert [use.repository for use in index.find("actions/checkout", "v4")] == [
+                "first"
+            ]
+
+    def describe_given_an_action_in_a_subdirectory() -> None:
+        def it_is_found_by_its_repository(index: ActionsIndex) -> None:
+            assert [use.action for use in index.find("github/codeql-action")] == [
+                "github/codeql-action/init",
+                "github/codeql-action/init",
+            ]
+
+    def describe_given_a_similar_name() -> None:
+        def it_is_not_found(index: ActionsIndex) -> None:
+            assert index.find("actions/check") == []
+
+
+def describe_when_updating_a_repository() -> None:
+    def describe_given_unchanged_blobs() -> None:
+        def it_has_nothing_missing(index: ActionsIndex) -> None:
+            assert index.missing(["a", "b", "c"]) == {"c"}
+
+    def describe_given_a_changed_workflow() -> None:
+        @pytest.fixture
+        def updated(index: ActionsIndex) -> ActionsIndex:
+            index.update(
+                ORG,
+                "first",
+                {".github/workflows/build.yml": "a", ".github/workflows/scan.yml": "c"},
+                {"c": ["actions/checkout@v5"]},
+            )
+            return index
+
+        def it_replaces_the_references(updated: ActionsIndex) -> None:
+            assert [use.ref for use in updated.find("actions/checkout")] == [
+                "v3",
+                "v3",
+                "v5",
+            ]
+
+        def it_forgets_blobs_no_longer_used(updated: ActionsIndex) -> None:
+            assert updated.missing(["a", "b"]) == {"b"}
+
+
+def describe_when_querying_from_the_command_line() -> None:
+    def describe_given_an_indexed_action() -> None:
+        def it_prints_each_use(tmp_path, capsys) -> None:
+            path = os.path.join(tmp_path, "actions.sqlite")
+            index = ActionsIndex(path)
+            index.update(
+                ORG, "repo", {"ci.yml": "a"}, {"a": ["dorny/test-reporter@v1"]}
+            )
+            index.close()
+
+            main(["dorny/test-reporter", "--index", path])
+
+            out, _ = capsys.readouterr()
+            assert out == f"dorny/test-reporter@v1\t{ORG}/repo\tci.yml\n"
+
+    def describe_given_no_index() -> None:
+        def it_exits(tmp_path) -> None:
+            with pytest.raises(SystemExit):
+                main(["dorny/test-reporter", "--index", os.path.join(tmp_path, "x")])
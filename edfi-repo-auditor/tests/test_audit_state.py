@@ -0,0 +1,96 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from edfi_repo_auditor.audit_state import AuditState, fingerprint
+from edfi_repo_auditor.results import AuditResult
+
+INFORMATION = {"pushedAt": "2026-01-01T00:00:00Z", "hasWikiEnabled": False}
+RESULTS = AuditResult({"OSSF Score": 8.2}).to_dict()
+CHECKS = ["HAS_ACTIONS", "WIKI"]
+
+
+def _saved_state(tmp_path) -> str:
+    path = str(tmp_path / "state.json")
+    state = AuditState(path)
+    state.record("repo", fingerprint(INFORMATION, CHECKS), RESULTS)
+    state.save()
+    return path
+
+
+def describe_when_fingerprinting_a_repository() -> None:
+    def it_ignores_the_order_of_the_checks() -> None:
+        assert fingerprint(INFORMATION, CHECKS) == fingerprint(
+            INFORMATION, reversed(CHECKS)
+        )
+
+    def it_changes_when_the_repository_is_pushed_to() -> None:
+        pushed = {**INFORMATION, "pushedAt": "2026-02-01T00:00:00Z"}
+
+        assert fingerprint(INFORMATION, CHECKS) != fingerprint(pushed, CHECKS)
+
+    def it_changes_when_other_checks_are_run() -> None:
+        assert fingerprint(INFORMATION, CHECKS) != fingerprint(INFORMATION, CHECKS[:1])
+
+
+def describe_when_reading_the_previous_audit() -> None:
+    def describe_given_an_unchanged_repository() -> None:
+        def it_returns_the_previous_results(tmp_path) -> None:
+            state = AuditState(_saved_state(tmp_path))
+
+            previous = state.previous_results("repo", fingerprint(INFORMATION, CHECKS))
+
+            assert previous is not None and previous.to_dict() == RESULTS
+            assert state.reused == 1
+
+        def it_audits_again_when_asked_for_a_full_audit(tmp_path) -> None:
+            state = AuditState(_saved_state(tmp_path), reuse=False)
+
+            assert (
+                state.previous_results("repo", fingerprint(INFORMATION, CHECKS)) is None
+            )
+
+    def describe_given_results_of_another_checklist() -> None:
+        def it_returns_nothing(tmp_path) -> None:
+            state = AuditState(str(tmp_path / "state.json"))
+            state.record("repo", "key", {**RESULTS, "statuses": "01"})
+            state.save()
+
+            reloaded = AuditState(str(tmp_path / "state.json"))
+            assert reloaded.previous_results("repo", "key") is None
+            assert reloaded.reused == 0
+
+    def describe_given_a_changed_repository() -> None:
+        def it_returns_nothing(tmp_path) -> None:
+            state = AuditState(_saved_state(tmp_path))
+
+            assert state.previous_results("repo", fingerprint({}, CHECKS)) is None
+            assert state.reused == 0
+
+    def describe_given_no_state_file() -> None:
+        def it_returns_nothing(tmp_path) -> None:
+            state = AuditState(str(tmp_path / "missing.json"))
+
+            assert state.previous_results("repo", "key") is None
+
+    def describe_given_an_unreadable_state_file() -> None:
+        def it_starts_afresh(tmp_path) -> None:
+            path = tmp_path / "state.json"
+            path.write_text("{not json")
+
+            assert AuditState(str(path)).previous_results("repo", "key") is None
+
+
+def describe_when_saving_the_state() -> None:
+    def it_keeps_repositories_not_audited_this_time(tmp_path) -> None:
+        path = _saved_state(tmp_path)
+        state = AuditState(path)
+        state.record("other", "key", RESULTS)
+        state.save()
+
+        reloaded = AuditState(path)
+        assert reloaded.previous_results("repo", fingerprint(INFORMATION, CHECKS))
+        assert reloaded.previous_results("other", "key") == AuditResult.from_dict(
+            RESULTS
+        )
@@ -0,0 +1,69 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+import os
+
+from edfi_repo_auditor.checkpoint import Checkpoint
+
+AUDIT = {"organization": "Ed-Fi-Alliance-OSS", "checks": ["HAS_ACTIONS"]}
+RESULTS = {"Has Actions": "OK"}
+
+
+def _interrupted(tmp_path) -> str:
+    path = str(tmp_path / "checkpoint.jsonl")
+    checkpoint = Checkpoint(path, AUDIT)
+    checkpoint.record("done", RESULTS)
+    checkpoint.record("failed", {"Audit Error": "boom"}, failed=True)
+    checkpoint.close()
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"repository": "partial", "res')
+    return path
+
+
+def describe_when_resuming_an_audit() -> None:
+    def describe_given_a_checkpoint_of_the_same_audit() -> None:
+        def it_skips_the_completed_repositories(tmp_path) -> None:
+            checkpoint = Checkpoint(_interrupted(tmp_path), AUDIT, resume=True)
+
+            assert checkpoint.completed == {"done": RESULTS}
+
+        def it_keeps_recording_to_the_checkpoint(tmp_path) -> None:
+            path = _interrupted(tmp_path)
+            checkpoint = Checkpoint(path, AUDIT, resume=True)
+            checkpoint.record("failed", RESULTS)
+            checkpoint.close()
+
+            resumed = Checkpoint(path, AUDIT, resume=True)
+            assert resumed.completed == {"done": RESULTS, "failed": RESULTS}
+
+    def describe_given_a_checkpoint_of_another_audit() -> None:
+        def it_starts_over(tmp_path) -> None:
+            other = {**AUDIT, "checks": ["WIKI"]}
+
+            checkpoint = Checkpoint(_interrupted(tmp_path), other, resume=True)
+
+            assert checkpoint.completed == {}
+
+    def describe_given_no_checkpoint() -> None:
+        def it_starts_over(tmp_path) -> None:
+            checkpoint = Checkpoint(str(tmp_path / "new.jsonl"), AUDIT, resume=True)
+
+            assert checkpoint.completed == {}
+
+
+def describe_when_starting_a_new_audit() -> None:
+    def it_replaces_the_previous_checkpoint(tmp_path) -> None:
+        path = _interrupted(tmp_path)
+        Checkpoint(path, AUDIT).close()
+
+        assert Checkpoint(path, AUDIT, resume=True).completed == {}
+
+
+def describe_when_finishing_the_audit() -> None:
+    def it_removes_the_checkpoint(tmp_path) -> None:
+        path = _interrupted(tmp_path)
+        Checkpoint(path, AUDIT, resume=True).finish()
+
+        assert not os.path.exists(path)
@@ -8,6 +8,7 @@ import pytest
 from edfi_repo_auditor.config import (
     Configuration,
     load_configuration,
+    DEFAULT_FILE_NAME,
     DEFAULT_LOG_LEVEL,
 )
 
@@ -236,3 +237,71 @@ def describe_when_loading_configuration() -> None:
             clear_env, capsys, result: Configuration
         ) -> None:
             assert_no_error_reported(capsys)
+
+    def describe_given_checks() -> None:
+        def config_should_include_the_checks(clear_env) -> None:
+            result = load_configuration(
+                ["-o", ORGANIZATION_1, "-p", PERSONAL_ACCESS_TOKEN_1]
+                + ["--checks", "DEPENDABOT_ENABLED", "Dependabot Alerts"]
+            )
+            assert result.checks == ["DEPENDABOT_ENABLED", "Dependabot Alerts"]
+
+        def it_should_reject_unknown_checks(clear_env, capsys) -> None:
+            with pytest.raises(SystemExit):
+                load_configuration(
+                    ["-o", ORGANIZATION_1, "-p", PERSONAL_ACCESS_TOKEN_1]
+                    + ["--checks", "Requires Signed commits"]
+                )
+
+    def describe_given_resume() -> None:
+        def config_should_resume_from_the_checkpoint(clear_env) -> None:
+            result = load_configuration(
+                ["-o", ORGANIZATION_1, "-p", PERSONAL_ACCESS_TOKEN_1]
+                + ["--resume", "--checkpoint_file", "audit.jsonl"]
+            )
+            assert result.resume is True
+            assert result.checkpoint_file == "audit.jsonl"
+
+    def describe_given_a_maximum_result_age() -> None:
+        def config_should_include_the_maximum_age(clear_env) -> None:
+            result = load_configuration(
+                ["-o", ORGANIZATION_1, "-p", PERSONAL_ACCESS_TOKEN_1]
+                + ["--max_age_hours", "6"]
+            )
+            assert result.max_age_hours == 6
+
+        def it_should_reject_a_negative_age(clear_env, capsys) -> None:
+            with pytest.raises(SystemExit):
+                load_configuration(
+                    ["-o", ORGANIZATION_1, "-p", PERSONAL_ACCESS_TOKEN_1]
+                    + ["--max_age_hours", "-1"]
+                )
+
+    def describe_given_an_organization_summary() -> None:
+        def config_should_include_the_budget(clear_env) -> None:
+            result = load_configuration(
+                ["-o", ORGANIZATION_1, "-p", PERSONAL_ACCESS_TOKEN_1]
+                + ["--org_summary", "--summary_max_kb", "64"]
+            )
+            assert result.org_summary is True
+            assert result.summary_max_kb == 64
+
+        def it_should_reject_an_empty_budget(clear_env, capsys) -> None:
+            with pytest.raises(SystemExit):
+                load_configuration(
+                    ["-o", ORGANIZATION_1, "-p", PERSONAL_ACCESS_TOKEN_1]
+                    + ["--org_summary", "--summary_max_kb", "0"]
+                )
+
+    def describe_given_no_file_name() -> None:
+        def config_should_use_the_default_file_name(clear_env) -> None:
+            result = load_configuration(
+                ["-o", ORGANIZATION_1, "-p", PERSONAL_ACCESS_TOKEN_1]
+            )
+            assert result.file_name == DEFAULT_FILE_NAME
+
+        def it_should_reject_an_empty_file_name(clear_env, capsys) -> None:
+            with pytest.raises(SystemExit):
+                load_configuration(
+                    ["-o", ORGANIZATION_1, "-p", PERSONAL_ACCESS_TOKEN_1, "-f", ""]
+                )
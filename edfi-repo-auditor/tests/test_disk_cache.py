@@ -0,0 +1,56 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+import os
+
+import pytest
+
+from edfi_repo_auditor.disk_cache import DiskCache
+
+
+def describe_when_using_the_disk_cache() -> None:
+    def describe_given_a_stored_value() -> None:
+        def it_returns_the_value(tmp_path) -> None:
+            cache = DiskCache(str(tmp_path), 10_000)
+            cache.set("key", {"a": [1, 2]})
+
+            assert cache.get("key") == {"a": [1, 2]}
+
+        def it_persists_between_instances(tmp_path) -> None:
+            DiskCache(str(tmp_path), 10_000).set("key", "value")
+
+            assert DiskCache(str(tmp_path), 10_000).get("key") == "value"
+
+    def describe_given_a_missing_key() -> None:
+        def it_returns_None(tmp_path) -> None:
+            assert DiskCache(str(tmp_path), 10_000).get("missing") is None
+
+    def describe_given_invalid_size() -> None:
+        def it_raises_a_ValueError(tmp_path) -> None:
+            with pytest.raises(ValueError):
+                DiskCache(str(tmp_path), 0)
+
+    def describe_given_the_size_limit_is_exceeded() -> None:
+        @pytest.fixture
+        def cache(tmp_path) -> DiskCache:
+            cache = DiskCache(str(tmp_path), 200)
+            cache.set("first", "x" * 50)
+            cache.set("second", "y" * 50)
+
+            # Make the first entry the oldest, then read it so it becomes the
+            # most recently used one.
+            os.utime(cache._path("first"), (0, 0))
+            os.utime(cache._path("second"), (1, 1))
+            cache.get("first")
+
+            cache.set("third", "z" * 50)
+            return cache
+
+        def it_evicts_the_least_recently_used_entry(cache: DiskCache) -> None:
+            assert cache.get("second") is None
+
+        def it_keeps_recently_used_entries(cache: DiskCache) -> None:
+            assert cache.get("first") == "x" * 50
+            assert cache.get("third") == "z" * 50
@@ -0,0 +1,109 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from typing import List
+
+import pytest
+
+from edfi_repo_auditor.rate_limit import (
+    GRAPHQL,
+    REST,
+    RESET_MARGIN_SECONDS,
+    RateLimitScheduler,
+)
+
+NOW = 1_000_000.0
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = NOW
+        self.sleeps: List[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+def _scheduler(clock: FakeClock, rate: float = 100) -> RateLimitScheduler:
+    return RateLimitScheduler(
+        reserve=10,
+        requests_per_second={REST: rate, GRAPHQL: rate},
+        clock=clock,
+        sleep=clock.sleep,
+    )
+
+
+def describe_when_scheduling_requests() -> None:
+    def describe_given_no_budget_information() -> None:
+        def it_does_not_wait(clock: FakeClock) -> None:
+            assert _scheduler(clock).acquire(REST) == 0
+
+    def describe_given_plenty_of_budget() -> None:
+        def it_does_not_wait(clock: FakeClock) -> None:
+            scheduler = _scheduler(clock)
+            scheduler.update(
+                REST, {"X-RateLimit-Remaining": "4000", "X-RateLimit-Reset": "1003600"}
+            )
+
+            assert scheduler.acquire(REST) == 0
+
+    def describe_given_the_budget_is_nearly_spent() -> None:
+        @pytest.fixture
+        def scheduler(clock: FakeClock) -> RateLimitScheduler:
+            scheduler = _scheduler(clock)
+            scheduler.update(
+                REST, {"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": "1000060"}
+            )
+            return scheduler
+
+        def it_waits_for_the_reset(scheduler: RateLimitScheduler, clock) -> None:
+            scheduler.acquire(REST)
+
+            assert clock.sleeps == [60 + RESET_MARGIN_SECONDS]
+
+        def it_does_not_hold_up_the_other_resource(
+            scheduler: RateLimitScheduler,
+        ) -> None:
+            assert scheduler.acquire(GRAPHQL) == 0
+
+    def describe_given_a_retry_after_header() -> None:
+        def it_waits_the_requested_time(clock: FakeClock) -> None:
+            scheduler = _scheduler(clock)
+            scheduler.update(GRAPHQL, {"Retry-After": "30"})
+
+            assert scheduler.acquire(GRAPHQL) == 30
+
+    def describe_given_a_burst_above_the_pacing_rate() -> None:
+        def it_spaces_out_the_extra_requests(clock: FakeClock) -> None:
+            scheduler = _scheduler(clock, rate=2)
+            waits = [scheduler.acquire(REST) for _ in range(4)]
+
+            assert waits == [0, 0, 0.5, 0.5]
+
+
+def describe_when_projecting_time_to_finish() -> None:
+    def describe_given_pending_requests_exceed_the_budget() -> None:
+        def it_includes_the_wait_for_the_reset(clock: FakeClock) -> None:
+            scheduler = _scheduler(clock)
+            scheduler.update(
+                REST, {"X-RateLimit-Remaining": "20", "X-RateLimit-Reset": "1000600"}
+            )
+
+            assert scheduler.projected_seconds({REST: 50}) == 600
+
+    def describe_given_pending_requests_within_the_budget() -> None:
+        def it_uses_the_pacing_rate(clock: FakeClock) -> None:
+            scheduler = _scheduler(clock)
+
+            assert scheduler.projected_seconds({REST: 50}) == 0.5
@@ -0,0 +1,27 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from edfi_repo_auditor.repository_files import RepositoryFiles
+
+FILES = RepositoryFiles(
+    ["LICENSE", "Notices.md", ".github/CODE_OF_CONDUCT.md", "docs/SECURITY.md"]
+)
+
+
+def describe_when_finding_a_file() -> None:
+    def describe_given_a_file_in_the_root() -> None:
+        def it_ignores_case() -> None:
+            assert FILES.find("NOTICES.md") == "Notices.md"
+
+    def describe_given_a_file_in_an_alternate_location() -> None:
+        def it_finds_it_in_the_github_directory() -> None:
+            assert FILES.find("CODE_OF_CONDUCT.md") == ".github/CODE_OF_CONDUCT.md"
+
+        def it_finds_it_in_the_docs_directory() -> None:
+            assert FILES.find("security.md") == "docs/SECURITY.md"
+
+    def describe_given_a_missing_file() -> None:
+        def it_returns_None() -> None:
+            assert FILES.find("CONTRIBUTING.md") is None
@@ -0,0 +1,74 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from edfi_repo_auditor.checklist import CHECKLIST, CHECKLIST_DEFAULT_SUCCESS_MESSAGE
+from edfi_repo_auditor.results import (
+    AUDIT_ERROR_KEY,
+    AuditResult,
+    Status,
+    passed_matrix,
+)
+
+
+def _result(*passed: bool) -> AuditResult:
+    result = AuditResult({"OSSF Score": 8.2})
+    for item, flag in zip([CHECKLIST.WIKI, CHECKLIST.HAS_ACTIONS], passed):
+        result.record(item, flag)
+    return result
+
+
+def describe_when_rendering_results() -> None:
+    def it_renders_the_checks_run_in_checklist_order() -> None:
+        assert _result(False, True).render() == {
+            "Has Actions": CHECKLIST_DEFAULT_SUCCESS_MESSAGE,
+            "Wiki Disabled": CHECKLIST.WIKI["fail"],
+            "OSSF Score": 8.2,
+        }
+        assert list(_result(False, True).render())[0] == "Has Actions"
+
+    def it_renders_the_error() -> None:
+        assert AuditResult(error="boom").render() == {AUDIT_ERROR_KEY: "boom"}
+
+
+def describe_when_merging_results() -> None:
+    def it_keeps_the_checks_of_both() -> None:
+        result = _result(True)
+        other = AuditResult({"Workflow Files Not Fetched": 2})
+        other.record(CHECKLIST.NOTICES, False)
+
+        result.update(other)
+
+        assert result.status(CHECKLIST.WIKI) == Status.PASSED
+        assert result.status(CHECKLIST.NOTICES) == Status.FAILED
+        assert result.status(CHECKLIST.ISSUES) == Status.NOT_RUN
+        assert result.metrics == {"OSSF Score": 8.2, "Workflow Files Not Fetched": 2}
+
+    def it_is_incomplete_when_either_is() -> None:
+        result = _result(True)
+
+        result.update(AuditResult({"OSSF Score": None}, complete=False))
+
+        assert not result.complete
+
+
+def describe_when_storing_results() -> None:
+    def it_restores_the_same_result() -> None:
+        result = _result(True, False)
+
+        assert AuditResult.from_dict(result.to_dict()) == result
+
+    def it_restores_nothing_stored_for_another_checklist() -> None:
+        assert (
+            AuditResult.from_dict({"statuses": "01", "metrics": {}, "error": None})
+            is None
+        )
+
+
+def describe_when_stacking_results() -> None:
+    def it_has_a_row_per_result_and_a_column_per_check() -> None:
+        matrix = passed_matrix([_result(True), _result(False, True)])
+
+        assert matrix.shape == (2, len(CHECKLIST))
+        assert matrix.sum(axis=1).tolist() == [1, 1]
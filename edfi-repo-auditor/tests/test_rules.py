@@ -0,0 +1,61 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+import pytest
+
+from edfi_repo_auditor.checklist import CHECKLIST
+from edfi_repo_auditor.rules import (
+    DEPENDABOT_STATUS,
+    RULES,
+    plan_audit,
+    unknown_rules,
+)
+
+
+def describe_when_planning_an_audit() -> None:
+    def describe_given_no_selection() -> None:
+        def it_plans_every_rule() -> None:
+            assert plan_audit().rules == tuple(RULES)
+
+        def it_does_not_query_rulesets() -> None:
+            assert "rulesets" not in plan_audit().fields
+
+    def describe_given_only_dependabot_checks() -> None:
+        @pytest.fixture
+        def plan():
+            return plan_audit(["DEPENDABOT_ENABLED", "dependabot alerts"])
+
+        def it_runs_only_the_settings_stage(plan) -> None:
+            assert plan.stages == {"repo_config"}
+
+        def it_queries_only_the_alerts(plan) -> None:
+            assert plan.fields == ["vulnerabilityAlerts"]
+
+        def it_calls_the_dependabot_status(plan) -> None:
+            assert plan.calls == {DEPENDABOT_STATUS}
+
+        def it_includes_the_selected_checks(plan) -> None:
+            assert plan.includes(CHECKLIST.DEPENDABOT_ENABLED)
+            assert not plan.includes(CHECKLIST.WIKI)
+
+    def describe_given_a_scoring_description() -> None:
+        def it_matches_without_regard_to_case() -> None:
+            plan = plan_audit(["HAS CODE_OF_CONDUCT"])
+            assert plan.includes(CHECKLIST.CODE_OF_CONDUCT)
+            assert plan.fields == ["defaultBranchRef"]
+
+    def describe_given_an_unknown_name() -> None:
+        def it_raises_a_ValueError() -> None:
+            with pytest.raises(ValueError):
+                plan_audit(["Requires Signed commits"])
+
+        def it_is_ignored_when_not_strict() -> None:
+            plan = plan_audit(
+                ["Requires Signed commits", "Wiki Disabled"], strict=False
+            )
+            assert [rule.name for rule in plan.rules] == ["WIKI"]
+
+        def it_is_reported() -> None:
+            assert unknown_rules(["wiki disabled", "nope"]) == ["nope"]
@@ -0,0 +1,93 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+import json
+
+import pandas as pd
+import pytest
+
+from edfi_repo_auditor.checklist import CHECKLIST
+from edfi_repo_auditor.checklist import CHECKLIST_DEFAULT_SUCCESS_MESSAGE as OK
+from edfi_repo_auditor.results import AuditResult
+from edfi_repo_auditor.scoring import (
+    MEETS_THRESHOLD_KEY,
+    SCORE_KEY,
+    Scoring,
+    load_scoring,
+    main,
+    score_records,
+    score_results,
+)
+
+FAILED = "❌ FAILED: Not found"
+SCORING = Scoring(
+    threshold=5,
+    rules={"Has Actions": 5, "HAS CODE_OF_CONDUCT": 1, "Dependabot Alerts": -5},
+)
+REPORT = pd.DataFrame(
+    {
+        "repository": ["first", "second", "third"],
+        "Has Actions": [OK, OK, FAILED],
+        "Has CODE_OF_CONDUCT": [OK, FAILED, OK],
+        "Dependabot Alerts": [FAILED, OK, None],
+    }
+)
+
+
+def describe_when_scoring_results() -> None:
+    @pytest.fixture
+    def scored() -> pd.DataFrame:
+        return score_results(REPORT, SCORING)
+
+    def it_adds_the_points_of_each_passed_check(scored: pd.DataFrame) -> None:
+        assert scored[SCORE_KEY].to_list() == [6, 0, 1]
+
+    def it_compares_with_the_threshold(scored: pd.DataFrame) -> None:
+        assert scored[MEETS_THRESHOLD_KEY].to_list() == [True, False, False]
+
+    def it_keeps_the_results(scored: pd.DataFrame) -> None:
+        assert scored["repository"].to_list() == ["first", "second", "third"]
+
+    def describe_given_no_scored_columns() -> None:
+        def it_scores_zero() -> None:
+            scored = score_results(REPORT[["repository"]], SCORING)
+            assert scored[SCORE_KEY].to_list() == [0, 0, 0]
+
+
+def describe_when_scoring_audit_results() -> None:
+    def it_scores_the_passed_checks_as_the_report_would() -> None:
+        records = []
+        for has_actions, code_of_conduct, alerts in [
+            (True, True, False),
+            (True, False, True),
+            (False, True, None),
+        ]:
+            record = AuditResult()
+            record.record(CHECKLIST.HAS_ACTIONS, has_actions)
+            record.record(CHECKLIST.CODE_OF_CONDUCT, code_of_conduct)
+            if alerts is not None:
+                record.record(CHECKLIST.DEPENDABOT_ALERTS, alerts)
+            records.append(record)
+
+        assert score_records(records, SCORING).tolist() == [6, 0, 1]
+
+
+def describe_when_scoring_saved_reports() -> None:
+    def it_rewrites_the_report_with_the_scores(tmp_path) -> None:
+        scoring_file = tmp_path / "scoring.json"
+        scoring_file.write_text(
+            json.dumps({"threshold": SCORING.threshold, "rules": SCORING.rules})
+        )
+        report_file = tmp_path / "report.csv"
+        REPORT.to_csv(report_file, index=False)
+
+        main([str(report_file), "--scoring_file", str(scoring_file)])
+
+        assert pd.read_csv(report_file)[SCORE_KEY].to_list() == [6, 0, 1]
+
+    def it_loads_the_scoring_file(tmp_path) -> None:
+        scoring_file = tmp_path / "scoring.json"
+        scoring_file.write_text(json.dumps({"threshold": 3, "rules": {"A": 1}}))
+        assert load_scoring(str(scoring_file)) == Scoring(3, {"A": 1})
@@ -0,0 +1,133 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+import json
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from edfi_repo_auditor.checklist import CHECKLIST
+from edfi_repo_auditor.pr_metrics import AVG_PR_DURATION_DAYS_KEY
+from edfi_repo_auditor.results import AUDIT_ERROR_KEY, AuditResult
+from edfi_repo_auditor.sinks import JsonLinesSink, SqliteSink, open_sinks
+
+
+def _results() -> AuditResult:
+    results = AuditResult({AVG_PR_DURATION_DAYS_KEY: 1.5})
+    results.record(CHECKLIST.HAS_ACTIONS, True)
+    return results
+
+
+RENDERED = {"Has Actions": "✅ OK", AVG_PR_DURATION_DAYS_KEY: 1.5}
+
+
+def describe_when_writing_json_lines() -> None:
+    def it_writes_each_repository_as_it_completes(tmp_path) -> None:
+        path = str(tmp_path / "results.jsonl")
+        sink = JsonLinesSink(path)
+        sink.write("repo", _results())
+
+        with open(path, encoding="utf-8") as f:
+            assert json.loads(f.readline()) == {"repository": "repo", **RENDERED}
+        sink.close()
+
+
+def describe_when_writing_to_sqlite() -> None:
+    def _rows(path: str) -> list:
+        connection = sqlite3.connect(path)
+        try:
+            return connection.execute(
+                "SELECT repository, name, value FROM results ORDER BY rowid"
+            ).fetchall()
+        finally:
+            connection.close()
+
+    def it_inserts_a_row_per_result(tmp_path) -> None:
+        path = str(tmp_path / "results.sqlite")
+        sink = SqliteSink(path)
+        sink.write("repo", _results())
+        sink.close()
+
+        assert _rows(path) == [
+            ("repo", "Has Actions", "✅ OK"),
+            ("repo", AVG_PR_DURATION_DAYS_KEY, 1.5),
+        ]
+
+    def it_inserts_each_full_batch(tmp_path) -> None:
+        path = str(tmp_path / "results.sqlite")
+        sink = SqliteSink(path, batch_size=2)
+        for repository in ["a", "b", "c"]:
+            sink.write(repository, _results())
+
+        assert [row[0] for row in _rows(path)] == ["a", "a", "b", "b"]
+        sink.close()
+        assert [row[0] for row in _rows(path)] == ["a", "a", "b", "b", "c", "c"]
+
+    def it_accepts_writes_from_several_threads(tmp_path) -> None:
+        path = str(tmp_path / "results.sqlite")
+        sink = SqliteSink(path, batch_size=2)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(
+                executor.map(
+                    lambda repository: sink.write(repository, _results()),
+                    [f"repo-{index}" for index in range(8)],
+                )
+            )
+        sink.close()
+
+        assert len(_rows(path)) == 16
+
+    def it_replaces_the_results_of_a_previous_audit(tmp_path) -> None:
+        path = str(tmp_path / "results.sqlite")
+        for repository in ["old", "new"]:
+            sink = SqliteSink(path)
+            sink.write(repository, _results())
+            sink.close()
+
+        assert [row[0] for row in _rows(path)] == ["new", "new"]
+
+
+def describe_when_writing_parquet() -> None:
+    def it_writes_a_row_group_per_batch(tmp_path) -> None:
+        pq = pytest.importorskip("pyarrow.parquet")
+        from edfi_repo_auditor.sinks import ParquetSink
+
+        path = str(tmp_path / "results.parquet")
+        sink = ParquetSink(path, batch_size=2)
+        for repository in ["a", "b", "c"]:
+            sink.write(repository, _results())
+        sink.close()
+
+        parquet = pq.ParquetFile(path)
+        assert parquet.metadata.num_row_groups == 2
+        assert parquet.read().column("repository").to_pylist() == ["a", "b", "c"]
+
+    def it_writes_results_first_seen_in_a_later_batch(tmp_path) -> None:
+        pq = pytest.importorskip("pyarrow.parquet")
+        from edfi_repo_auditor.sinks import ParquetSink
+
+        path = str(tmp_path / "results.parquet")
+        sink = ParquetSink(path, batch_size=1)
+        sink.write("a", _results())
+        sink.write("b", AuditResult(error="boom"))
+        sink.close()
+
+        table = pq.read_table(path)
+        assert table.column(AUDIT_ERROR_KEY).to_pylist() == [None, "boom"]
+        assert table.column("Has Actions").to_pylist() == ["✅ OK", None]
+        assert table.column(AVG_PR_DURATION_DAYS_KEY).to_pylist() == [1.5, None]
+
+
+def describe_when_opening_sinks() -> None:
+    def it_opens_one_per_format(tmp_path) -> None:
+        sinks = open_sinks(["jsonl", "sqlite"], str(tmp_path / "reports" / "audit"))
+        for sink in sinks:
+            sink.close()
+
+        assert sorted(path.name for path in (tmp_path / "reports").iterdir()) == [
+            "audit.jsonl",
+            "audit.sqlite",
+        ]
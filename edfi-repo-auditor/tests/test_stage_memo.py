@@ -0,0 +1,176 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+import time
+from typing import List
+
+from edfi_repo_auditor.disk_cache import DiskCache
+from edfi_repo_auditor.results import AuditResult
+from edfi_repo_auditor.rules import FULL_PLAN, plan_audit
+from edfi_repo_auditor.stage_memo import (
+    DEFAULT_MAX_BYTES,
+    StageMemo,
+    expires,
+    fingerprint_fields,
+    memoize_stages,
+    stage_fingerprint,
+)
+from edfi_repo_auditor.stages import Stage, run_stages
+
+REPOSITORY = "Ed-Fi-Alliance-OSS/repo"
+INFORMATION = {
+    "githubTree": {"oid": "tree-1"},
+    "latestMergedPullRequest": {"nodes": [{"number": 7}]},
+}
+
+
+def _recording(calls: List[str], name: str, metrics: dict, complete: bool = True):
+    def run(*_) -> AuditResult:
+        calls.append(name)
+        return AuditResult(dict(metrics), complete=complete)
+
+    return run
+
+
+def _audit(memo: StageMemo, information: dict, calls: List[str]) -> dict:
+    stages = [
+        Stage("information", lambda _: information),
+        *memoize_stages(
+            [
+                Stage("actions", _recording(calls, "actions", {"Actions": 1})),
+                Stage("pr_metrics", _recording(calls, "pr_metrics", {"PRs": 2})),
+            ],
+            memo,
+            REPOSITORY,
+            FULL_PLAN,
+        ),
+    ]
+    outputs, _ = run_stages(stages)
+    return {**outputs["actions"].render(), **outputs["pr_metrics"].render()}
+
+
+def describe_when_fingerprinting_stages() -> None:
+    def it_uses_the_declared_fields() -> None:
+        assert fingerprint_fields(FULL_PLAN, "actions") == ["githubTree"]
+
+    def it_uses_the_settings_read_by_the_planned_checks() -> None:
+        plan = plan_audit(["WIKI", "ISSUES"])
+
+        assert fingerprint_fields(plan, "repo_config") == [
+            "hasWikiEnabled",
+            "hasIssuesEnabled",
+        ]
+
+    def it_does_not_fingerprint_checks_that_need_other_calls() -> None:
+        assert fingerprint_fields(FULL_PLAN, "repo_config") == []
+
+    def it_expires_the_stages_of_time_dependent_checks() -> None:
+        assert expires(FULL_PLAN, "pr_metrics")
+        assert expires(FULL_PLAN, "repo_config")
+        assert not expires(FULL_PLAN, "actions")
+        assert not expires(plan_audit(["WIKI"]), "repo_config")
+
+    def it_has_no_fingerprint_without_the_fields() -> None:
+        assert stage_fingerprint({}, ["githubTree"], ["HAS_ACTIONS"]) is None
+
+    def it_changes_with_the_checks() -> None:
+        assert stage_fingerprint(
+            INFORMATION, ["githubTree"], ["HAS_ACTIONS"]
+        ) != stage_fingerprint(INFORMATION, ["githubTree"], ["UNIT_TESTS"])
+
+
+def describe_when_memoizing_stages() -> None:
+    def describe_given_unchanged_inputs() -> None:
+        def it_reuses_the_results_between_runs(tmp_path) -> None:
+            calls: List[str] = []
+            _audit(StageMemo(str(tmp_path)), INFORMATION, calls)
+            calls.clear()
+
+            results = _audit(StageMemo(str(tmp_path)), INFORMATION, calls)
+
+            assert results == {"Actions": 1, "PRs": 2}
+            assert calls == []
+
+        def it_runs_them_again_when_not_reusing(tmp_path) -> None:
+            calls: List[str] = []
+            _audit(StageMemo(str(tmp_path)), INFORMATION, calls)
+            calls.clear()
+
+            _audit(StageMemo(str(tmp_path), reuse=False), INFORMATION, calls)
+
+            assert sorted(calls) == ["actions", "pr_metrics"]
+
+    def describe_given_results_older_than_the_maximum_age() -> None:
+        def it_runs_only_the_time_dependent_stages_again(tmp_path, monkeypatch) -> None:
+            calls: List[str] = []
+            _audit(StageMemo(str(tmp_path), max_age_hours=24), INFORMATION, calls)
+            calls.clear()
+
+            later = time.time() + 25 * 3600
+            monkeypatch.setattr(time, "time", lambda: later)
+            _audit(StageMemo(str(tmp_path), max_age_hours=24), INFORMATION, calls)
+
+            assert calls == ["pr_metrics"]
+
+    def describe_given_a_merged_pull_request() -> None:
+        def it_runs_only_the_pull_request_stage() -> None:
+            memo = StageMemo()
+            calls: List[str] = []
+            _audit(memo, INFORMATION, calls)
+            calls.clear()
+
+            merged = {
+                **INFORMATION,
+                "latestMergedPullRequest": {"nodes": [{"number": 8}]},
+            }
+            _audit(memo, merged, calls)
+
+            assert calls == ["pr_metrics"]
+            assert memo.stats() == {
+                "actions": {"hits": 1, "misses": 1},
+                "pr_metrics": {"hits": 0, "misses": 2},
+            }
+
+    def describe_given_results_of_another_checklist() -> None:
+        def it_runs_the_stage_again(tmp_path) -> None:
+            stored = {**AuditResult().to_dict(), "statuses": "01"}
+            DiskCache(str(tmp_path), DEFAULT_MAX_BYTES).set(
+                f"{REPOSITORY}/files", {"fingerprint": "key", "result": stored}
+            )
+            calls: List[str] = []
+
+            StageMemo(str(tmp_path)).run(
+                REPOSITORY, "files", "key", _recording(calls, "files", {})
+            )
+
+            assert calls == ["files"]
+
+    def describe_given_a_metric_without_a_value() -> None:
+        def it_stores_the_results() -> None:
+            memo = StageMemo()
+            calls: List[str] = []
+            for _ in range(2):
+                memo.run(
+                    REPOSITORY,
+                    "pr_metrics",
+                    "key",
+                    _recording(calls, "pr_metrics", {"Avg PR Duration (days)": None}),
+                )
+
+            assert len(calls) == 1
+
+    def describe_given_a_failed_fetch() -> None:
+        def it_does_not_store_the_results() -> None:
+            memo = StageMemo()
+            calls: List[str] = []
+            for _ in range(2):
+                memo.run(
+                    REPOSITORY,
+                    "ossf_score",
+                    "key",
+                    _recording(calls, "ossf_score", {"OSSF Score": None}, False),
+                )
+
+            assert len(calls) == 2
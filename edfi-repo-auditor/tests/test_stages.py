@@ -0,0 +1,72 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+import threading
+import time
+
+import pytest
+
+from edfi_repo_auditor.stages import Stage, run_stages
+
+
+def describe_when_running_stages() -> None:
+    def describe_given_independent_stages() -> None:
+        def it_runs_them_concurrently() -> None:
+            # Both stages must be running at once for either to pass the barrier
+            barrier = threading.Barrier(2, timeout=5)
+
+            outputs, _ = run_stages(
+                [
+                    Stage("a", lambda _: barrier.wait() is not None and "a"),
+                    Stage("b", lambda _: barrier.wait() is not None and "b"),
+                ]
+            )
+
+            assert outputs == {"a": "a", "b": "b"}
+
+        def it_records_the_time_of_each_stage() -> None:
+            _, timings = run_stages(
+                [
+                    Stage("slow", lambda _: time.sleep(0.05)),
+                    Stage("fast", lambda _: None),
+                ]
+            )
+
+            assert timings["slow"] >= 0.05
+            assert timings["fast"] < timings["slow"]
+
+    def describe_given_a_dependency() -> None:
+        def it_passes_the_required_output() -> None:
+            outputs, _ = run_stages(
+                [
+                    Stage("sum", lambda inputs: inputs["value"] + 1, ("value",)),
+                    Stage("value", lambda _: 1),
+                ]
+            )
+
+            assert outputs["sum"] == 2
+
+    def describe_given_a_failing_stage() -> None:
+        def it_raises_the_error() -> None:
+            def fail(_):
+                raise RuntimeError("boom")
+
+            with pytest.raises(RuntimeError, match="boom"):
+                run_stages([Stage("fail", fail), Stage("ok", lambda _: 1)])
+
+    def describe_given_an_unknown_dependency() -> None:
+        def it_raises_a_ValueError() -> None:
+            with pytest.raises(ValueError):
+                run_stages([Stage("a", lambda _: 1, ("missing",))])
+
+    def describe_given_circular_dependencies() -> None:
+        def it_raises_a_ValueError() -> None:
+            with pytest.raises(ValueError):
+                run_stages(
+                    [
+                        Stage("a", lambda _: 1, ("b",)),
+                        Stage("b", lambda _: 1, ("a",)),
+                    ]
+                )
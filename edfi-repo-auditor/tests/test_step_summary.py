@@ -0,0 +1,108 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from typing import List, Tuple
+
+import numpy as np
+
+from edfi_repo_auditor.checklist import CHECKLIST
+from edfi_repo_auditor.results import AuditResult
+from edfi_repo_auditor.step_summary import (
+    org_summary,
+    repository_markdown,
+    write_details,
+)
+
+ORGANIZATION = "Ed-Fi-Alliance-OSS"
+DETAILS = "reports/audit-result-details.md"
+
+
+def _result(wiki: bool, actions: bool) -> AuditResult:
+    result = AuditResult({"OSSF Score": 7.5})
+    result.record(CHECKLIST.WIKI, wiki)
+    result.record(CHECKLIST.HAS_ACTIONS, actions)
+    return result
+
+
+def _report() -> List[Tuple[str, AuditResult]]:
+    return [
+        ("passing", _result(True, True)),
+        ("failing-one", _result(False, True)),
+        ("failing-both", _result(False, False)),
+        ("broken", AuditResult(error="boom")),
+    ]
+
+
+def _rows(summary: str) -> List[str]:
+    return [
+        line.split(" | ")[0][2:]
+        for line in summary.splitlines()[4:]
+        if line.startswith("| ")
+    ]
+
+
+def describe_when_summarizing_an_organization() -> None:
+    def it_has_a_column_per_check_run() -> None:
+        summary = org_summary(ORGANIZATION, _report(), 1024 * 1024, DETAILS)
+
+        assert summary.splitlines()[2] == (
+            "| Repository | Failed | Has Actions | Wiki Disabled |"
+        )
+
+    def it_lists_the_failures_first() -> None:
+        summary = org_summary(ORGANIZATION, _report(), 1024 * 1024, DETAILS)
+
+        assert _rows(summary) == ["broken", "failing-both", "failing-one", "passing"]
+        assert "| failing-one | 1 | ✅ | ❌ |" in summary
+        assert "not shown" not in summary
+
+    def it_adds_the_scores() -> None:
+        summary = org_summary(
+            ORGANIZATION, _report(), 1024 * 1024, DETAILS, np.array([6, 3, 0, 0]), 5
+        )
+
+        assert "Passing score: 5" in summary
+        assert "| passing | 0 | 6 ✅ | ✅ | ✅ |" in summary
+        assert "| failing-one | 1 | 3 ❌ | ✅ | ❌ |" in summary
+
+    def describe_given_a_budget_too_small_for_every_repository() -> None:
+        def it_leaves_out_the_last_repositories() -> None:
+            note = (
+                f"\n_1 more repositories are not shown; see `{DETAILS}` for the "
+                "results of every repository._\n"
+            )
+            full = org_summary(ORGANIZATION, _report(), 1024 * 1024, DETAILS)
+            max_bytes = len(full.encode()) + len(note.encode()) - 1
+
+            summary = org_summary(ORGANIZATION, _report(), max_bytes, DETAILS)
+
+            assert len(summary.encode()) <= max_bytes
+            assert _rows(summary) == ["broken", "failing-both", "failing-one"]
+            assert summary.endswith(note)
+
+        def it_keeps_only_the_note_when_no_table_fits() -> None:
+            summary = org_summary(ORGANIZATION, _report(), 200, DETAILS)
+
+            assert "|" not in summary
+            assert "_4 more repositories are not shown" in summary
+
+
+def describe_when_writing_the_details() -> None:
+    def it_writes_every_result_of_every_repository(tmp_path) -> None:
+        path = tmp_path / "reports" / "details.md"
+
+        write_details(str(path), _report())
+
+        details = path.read_text(encoding="utf-8")
+        assert (
+            details
+            == "\n".join(
+                repository_markdown(repository, results)
+                for repository, results in _report()
+            )
+            + "\n"
+        )
+        assert "| Audit Error | boom |" in details
+        assert "| OSSF Score | 7.5 |" in details
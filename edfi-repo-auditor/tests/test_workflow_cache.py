@@ -0,0 +1,36 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from edfi_repo_auditor.workflow_cache import WorkflowCache
+
+ENTRY = {"text": "on: push", "checks": "abc", "found": 1}
+
+
+def describe_when_using_the_workflow_cache() -> None:
+    def describe_given_a_stored_blob() -> None:
+        def it_returns_the_entry() -> None:
+            cache = WorkflowCache()
+            cache.set("oid", ENTRY)
+
+            assert cache.get("oid") == ENTRY
+
+        def it_counts_the_hit() -> None:
+            cache = WorkflowCache()
+            cache.set("oid", ENTRY)
+            cache.get("oid")
+
+            assert cache.stats() == {"hits": 1, "misses": 0}
+
+        def it_persists_between_runs(tmp_path) -> None:
+            WorkflowCache(str(tmp_path)).set("oid", ENTRY)
+
+            assert WorkflowCache(str(tmp_path)).get("oid") == ENTRY
+
+    def describe_given_an_unknown_blob() -> None:
+        def it_counts_the_miss() -> None:
+            cache = WorkflowCache()
+
+            assert cache.get("oid") is None
+            assert cache.stats() == {"hits": 0, "misses": 1}
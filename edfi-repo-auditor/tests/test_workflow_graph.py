@@ -0,0 +1,128 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from typing import Dict, Optional, Set
+from unittest.mock import MagicMock
+
+import pytest
+
+from edfi_repo_auditor.workflow_graph import WorkflowGraph
+from edfi_repo_auditor.workflow_model import UsesReference
+
+FILES: Dict[str, str] = {
+    "shared/workflows/.github/workflows/test.yml@main": """
+jobs:
+  test:
+    steps:
+      - uses: ./.github/actions/report
+""",
+    "shared/workflows/.github/actions/report/action.yml@main": """
+runs:
+  using: composite
+  steps:
+    - uses: dorny/test-reporter@v1
+""",
+    "shared/workflows/.github/workflows/loop.yml@main": """
+jobs:
+  again:
+    uses: shared/workflows/.github/workflows/loop.yml@main
+""",
+}
+
+
+def _client() -> MagicMock:
+    client = MagicMock()
+
+    def get_file_content(
+        owner: str, repository: str, path: str, ref: Optional[str] = None
+    ) -> Optional[str]:
+        return FILES.get(f"{owner}/{repository}/{path}@{ref}")
+
+    client.get_file_content.side_effect = get_file_content
+    return client
+
+
+def _targets(references: Set[UsesReference]) -> Set[str]:
+    return {reference.target for reference in references}
+
+
+def describe_when_resolving_references() -> None:
+    def describe_given_a_reusable_workflow_calling_a_composite_action() -> None:
+        @pytest.fixture
+        def graph() -> WorkflowGraph:
+            return WorkflowGraph(_client())
+
+        def it_finds_the_actions_used_by_the_composite_action(
+            graph: WorkflowGraph,
+        ) -> None:
+            references = graph.references(
+                "org",
+                "repo",
+                [
+                    UsesReference.parse(
+                        "shared/workflows/.github/workflows/test.yml@main"
+                    )
+                ],
+            )
+            assert _targets(references) == {
+                "shared/workflows/.github/workflows/test.yml",
+                "shared/workflows/.github/actions/report",
+                "dorny/test-reporter",
+            }
+
+        def it_reads_each_shared_file_once(graph: WorkflowGraph) -> None:
+            reference = UsesReference.parse(
+                "shared/workflows/.github/workflows/test.yml@main"
+            )
+            graph.references("org", "first", [reference])
+            fetched = graph.fetched
+
+            graph.references("org", "second", [reference])
+
+            assert graph.fetched == fetched
+
+    def describe_given_a_workflow_calling_itself() -> None:
+        def it_stops() -> None:
+            graph = WorkflowGraph(_client())
+            references = graph.references(
+                "org",
+                "repo",
+                [
+                    UsesReference.parse(
+                        "shared/workflows/.github/workflows/loop.yml@main"
+                    )
+                ],
+            )
+            assert _targets(references) == {
+                "shared/workflows/.github/workflows/loop.yml"
+            }
+
+    def describe_given_a_reference_without_a_repository() -> None:
+        def it_reads_nothing() -> None:
+            client = MagicMock()
+            client.get_file_content.side_effect = ValueError(
+                "repository cannot be blank"
+            )
+            graph = WorkflowGraph(client)
+
+            references = graph.references(
+                "org", "repo", [UsesReference.parse("owner/")]
+            )
+
+            assert _targets(references) == {"owner"}
+            client.get_file_content.assert_not_called()
+
+    def describe_given_a_deep_chain() -> None:
+        def it_stops_at_the_maximum_depth() -> None:
+            client = MagicMock()
+            client.get_file_content.side_effect = (
+                lambda owner, repository, path, ref=None: "jobs:\n  next:\n    uses: "
+                + f"org/{int(repository) + 1}/.github/workflows/a.yml@main\n"
+            )
+            graph = WorkflowGraph(client, max_depth=2)
+            references = graph.references(
+                "org", "0", [UsesReference.parse("org/1/.github/workflows/a.yml@main")]
+            )
+            assert len(references) == 3
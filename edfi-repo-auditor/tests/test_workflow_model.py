@@ -0,0 +1,131 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from edfi_repo_auditor.workflow_model import (
+    UsesCheck,
+    UsesReference,
+    parse_action,
+    parse_workflow,
+)
+
+WORKFLOW = """
+name: CI
+on: push
+jobs:
+  scan:
+    uses: Ed-Fi-Alliance-OSS/Ed-Fi-Actions/.github/workflows/scan.yml@main
+  build:
+    name: Build
+    steps:
+      - uses: actions/checkout@v4
+      - name: Unit Tests
+        run: dotnet test
+      - uses: ./.github/actions/report
+"""
+
+ACTION = """
+name: Report
+runs:
+  using: composite
+  steps:
+    - uses: dorny/test-reporter@v1
+    - run: echo done
+      shell: bash
+"""
+
+
+def describe_when_parsing_a_uses_reference() -> None:
+    def describe_given_an_action() -> None:
+        def it_splits_the_owner_repository_and_ref() -> None:
+            reference = UsesReference.parse("actions/checkout@v4")
+            assert (reference.owner, reference.repository, reference.path) == (
+                "actions",
+                "checkout",
+                "",
+            )
+            assert reference.ref == "v4"
+
+    def describe_given_a_reusable_workflow() -> None:
+        def it_is_a_workflow() -> None:
+            reference = UsesReference.parse("Owner/Repo/.github/workflows/a.yml@main")
+            assert reference.is_workflow
+            assert reference.target == "owner/repo/.github/workflows/a.yml"
+
+    def describe_given_a_local_action() -> None:
+        def it_resolves_against_the_containing_repository() -> None:
+            reference = UsesReference.parse("./.github/actions/report")
+            assert reference.is_local
+
+            resolved = reference.relative_to("owner", "repo", "v1")
+            assert resolved.target == "owner/repo/.github/actions/report"
+            assert resolved.ref == "v1"
+
+        def it_resolves_only_once() -> None:
+            resolved = UsesReference.parse("./.github/actions/report").relative_to(
+                "owner", "repo"
+            )
+            assert resolved.relative_to("other", "repo") == resolved
+
+    def describe_given_a_docker_image() -> None:
+        def it_is_not_resolved() -> None:
+            reference = UsesReference.parse("docker://alpine:3")
+            assert reference.is_docker
+            assert reference.owner is None
+            assert reference.relative_to("owner", "repo") == reference
+
+
+def describe_when_parsing_a_workflow() -> None:
+    def describe_given_a_valid_workflow() -> None:
+        def it_reads_jobs_and_steps() -> None:
+            workflow = parse_workflow(WORKFLOW)
+            assert workflow is not None
+            assert [job.id for job in workflow.jobs] == ["scan", "build"]
+            assert workflow.jobs[1].steps[1].run == "dotnet test"
+
+        def it_lists_job_and_step_references() -> None:
+            workflow = parse_workflow(WORKFLOW)
+            assert workflow is not None
+            assert [reference.raw for reference in workflow.references()] == [
+                "Ed-Fi-Alliance-OSS/Ed-Fi-Actions/.github/workflows/scan.yml@main",
+                "actions/checkout@v4",
+                "./.github/actions/report",
+            ]
+
+    def describe_given_invalid_yaml() -> None:
+        def it_returns_None() -> None:
+            assert parse_workflow("jobs: [unclosed") is None
+
+    def describe_given_yaml_that_is_not_a_mapping() -> None:
+        def it_returns_None() -> None:
+            assert parse_workflow("- a\n- b") is None
+
+
+def describe_when_parsing_an_action() -> None:
+    def describe_given_a_composite_action() -> None:
+        def it_lists_step_references() -> None:
+            action = parse_action(ACTION)
+            assert action is not None
+            assert action.is_composite
+            assert [reference.raw for reference in action.references()] == [
+                "dorny/test-reporter@v1"
+            ]
+
+    def describe_given_a_javascript_action() -> None:
+        def it_is_not_composite() -> None:
+            action = parse_action("runs:\n  using: node20\n  main: index.js")
+            assert action is not None
+            assert not action.is_composite
+
+
+def describe_when_evaluating_a_uses_check() -> None:
+    CHECK = UsesCheck({"description": "Reporter"}, ("EnricoMi/publish",))
+
+    def describe_given_a_matching_reference() -> None:
+        def it_ignores_case_and_ref() -> None:
+            assert CHECK.passed([UsesReference.parse("enricomi/publish@v2")])
+
+    def describe_given_no_matching_reference() -> None:
+        def it_fails() -> None:
+            assert not CHECK.passed([UsesReference.parse("enricomi/other@v2")])
@@ -0,0 +1,68 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+import pytest
+
+from edfi_repo_auditor.workflow_scanner import (
+    WorkflowCheck,
+    WorkflowScanner,
+    literal,
+)
+
+ALPHA = WorkflowCheck({"description": "Alpha"}, "alpha", "alpha", ignore_case=True)
+BETA = WorkflowCheck({"description": "Beta"}, "alpha", literal("alpha-beta"))
+GAMMA = WorkflowCheck({"description": "Gamma"}, "gam+", r"gam+a")
+
+
+def describe_when_scanning_a_workflow() -> None:
+    @pytest.fixture
+    def scanner() -> WorkflowScanner:
+        return WorkflowScanner([ALPHA, BETA, GAMMA])
+
+    def describe_given_no_matches() -> None:
+        def it_returns_an_empty_bitmap(scanner: WorkflowScanner) -> None:
+            assert scanner.scan("nothing here") == 0
+
+    def describe_given_several_matches() -> None:
+        def it_sets_one_bit_per_check(scanner: WorkflowScanner) -> None:
+            found = scanner.scan("gammma and ALPHA")
+
+            assert found == 0b101
+            assert scanner.passed(found, ALPHA)
+            assert not scanner.passed(found, BETA)
+
+        def it_honours_case_sensitivity(scanner: WorkflowScanner) -> None:
+            assert not scanner.passed(scanner.scan("ALPHA-BETA"), BETA)
+
+    def describe_given_matches_at_the_same_position() -> None:
+        def it_finds_every_check(scanner: WorkflowScanner) -> None:
+            assert scanner.scan("alpha-beta") == 0b011
+
+    def describe_given_checks_already_found() -> None:
+        def it_keeps_them(scanner: WorkflowScanner) -> None:
+            assert scanner.scan("gamma", 0b001) == 0b101
+
+    def describe_given_every_check_found() -> None:
+        def it_reports_all_passed(scanner: WorkflowScanner) -> None:
+            assert scanner.scan("alpha-beta gamma") == scanner.all_passed
+
+    def describe_given_text_that_changes_length_when_lowered() -> None:
+        def it_still_finds_the_checks(scanner: WorkflowScanner) -> None:
+            assert scanner.scan("\u0130 ALPHA gamma") == 0b101
+
+    def describe_given_a_prefix_with_a_capturing_group() -> None:
+        def it_raises_a_ValueError() -> None:
+            with pytest.raises(ValueError):
+                WorkflowScanner([WorkflowCheck({"description": "Delta"}, "(d)", "d")])
+
+    def describe_given_an_empty_prefix() -> None:
+        def it_raises_a_ValueError() -> None:
+            with pytest.raises(ValueError):
+                WorkflowScanner([WorkflowCheck({"description": "Delta"}, "", "d")])
+
+    def describe_given_no_checks() -> None:
+        def it_raises_a_ValueError() -> None:
+            with pytest.raises(ValueError):
+                WorkflowScanner([])